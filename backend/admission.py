@@ -0,0 +1,123 @@
+"""Admission control for the public POST endpoints.
+
+Each client IP gets a token bucket per route, refilled at
+``rate_limit_per_minute`` up to ``rate_limit_burst`` requests. Requests that pass
+the buckets then go through a gate that lets at most ``admission_max_concurrency``
+of them run at once, which defaults to the size of the async connection pool they
+draw from. Anything over either limit is answered with 429 and ``Retry-After``
+before the endpoint runs, so a burst cannot take every database connection and
+starve the admin pages.
+
+Limits are per worker process. The buckets are off unless ``rate_limit_enabled``
+is set; behind a proxy, uvicorn must also trust it (``FORWARDED_ALLOW_IPS``, read
+by uvicorn itself) so the client IP is the caller's and not the proxy's.
+"""
+
+import asyncio
+import json
+import math
+import time
+from typing import Optional
+
+from config import settings
+
+LIMITED_ROUTES = frozenset({"/api/orders", "/api/feedback", "/api/catering-requests"})
+# Buckets untouched long enough to have refilled are dropped past this many.
+_MAX_BUCKETS = 10_000
+
+
+class TokenBuckets:
+    def __init__(self, rate_per_second: float, burst: int):
+        self._rate = rate_per_second
+        self._burst = float(max(1, burst))
+        # key -> (tokens, updated_at)
+        self._buckets: dict[tuple, tuple[float, float]] = {}
+
+    def take(self, key: tuple, now: Optional[float] = None) -> float:
+        """Take one token for ``key``; returns 0 on success, else seconds until one is available."""
+        now = time.monotonic() if now is None else now
+        tokens, updated_at = self._buckets.get(key, (self._burst, now))
+        tokens = min(self._burst, tokens + (now - updated_at) * self._rate)
+        if tokens >= 1:
+            self._buckets[key] = (tokens - 1, now)
+            if len(self._buckets) > _MAX_BUCKETS:
+                self._prune(now)
+            return 0.0
+        self._buckets[key] = (tokens, now)
+        return (1 - tokens) / self._rate if self._rate > 0 else math.inf
+
+    def _prune(self, now: float) -> None:
+        refill_seconds = self._burst / self._rate if self._rate > 0 else math.inf
+        self._buckets = {
+            key: bucket
+            for key, bucket in self._buckets.items()
+            if now - bucket[1] < refill_seconds
+        }
+
+
+class AdmissionControlMiddleware:
+    def __init__(self, app):
+        self.app = app
+        self._buckets = (
+            TokenBuckets(settings.rate_limit_per_minute / 60, settings.rate_limit_burst)
+            if settings.rate_limit_enabled
+            else None
+        )
+        self._gate: Optional[asyncio.Semaphore] = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+        route = scope["path"].rstrip("/")
+        if route not in LIMITED_ROUTES:
+            await self.app(scope, receive, send)
+            return
+
+        if self._buckets is not None:
+            client = scope.get("client")
+            wait = self._buckets.take((client[0] if client else "", route))
+            if wait:
+                await _reject(send, wait, "Too many requests. Please wait a moment and try again.")
+                return
+
+        # Queued orders wait for the group-commit writer, not for a connection each;
+        # that queue is bounded by order_queue_max_pending instead.
+        queued = route == "/api/orders" and settings.order_queue_enabled
+        if not settings.admission_control_enabled or queued:
+            await self.app(scope, receive, send)
+            return
+        if self._gate is None:
+            self._gate = asyncio.Semaphore(
+                settings.admission_max_concurrency or settings.db_pool_size + settings.db_max_overflow
+            )
+        try:
+            if self._gate.locked():
+                if settings.admission_max_wait_ms <= 0:
+                    raise asyncio.TimeoutError
+                await asyncio.wait_for(self._gate.acquire(), timeout=settings.admission_max_wait_ms / 1000)
+            else:
+                await self._gate.acquire()
+        except asyncio.TimeoutError:
+            await _reject(send, 1, "We are receiving a lot of requests right now. Please try again in a moment.")
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self._gate.release()
+
+
+async def _reject(send, retry_after: float, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"retry-after", str(max(1, math.ceil(min(retry_after, 3600)))).encode("ascii")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,59 @@
+"""create slot_capacities
+
+Revision ID: 3d6f0a9b1c57
+Revises: e81c4b7a9d26
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3d6f0a9b1c57"
+down_revision: Union[str, None] = "e81c4b7a9d26"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "slot_capacities",
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("location_id", sa.Text(), nullable=False),
+        sa.Column("time_slot", sa.Text(), nullable=False),
+        sa.Column("capacity", sa.Integer(), nullable=False),
+        sa.Column("reserved", sa.Integer(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("event_id", "location_id", "time_slot"),
+        sa.CheckConstraint("capacity >= 0", name="ck_slot_capacities_capacity_gte_0"),
+        sa.CheckConstraint("reserved >= 0", name="ck_slot_capacities_reserved_gte_0"),
+    )
+
+    # Same lockdown as the other app tables: backend-only, no Supabase API access.
+    op.execute(sa.text("ALTER TABLE public.slot_capacities ENABLE ROW LEVEL SECURITY"))
+    op.execute(
+        sa.text(
+            """
+            DO $$
+            DECLARE
+                role_name text;
+            BEGIN
+                FOREACH role_name IN ARRAY ARRAY['anon', 'authenticated']
+                LOOP
+                    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = role_name) THEN
+                        EXECUTE format('REVOKE ALL ON TABLE public.slot_capacities FROM %I', role_name);
+                    END IF;
+                END LOOP;
+            END
+            $$;
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("slot_capacities")
@@ -0,0 +1,77 @@
+"""create order_lines
+
+Revision ID: 5b8e2c4d7f19
+Revises: 3d6f0a9b1c57
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e2c4d7f19"
+down_revision: Union[str, None] = "3d6f0a9b1c57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "order_lines",
+        sa.Column("order_id", sa.String(), nullable=False),
+        sa.Column("line_number", sa.Integer(), nullable=False),
+        sa.Column("item_id", sa.String(), nullable=False),
+        sa.Column("item_name", sa.String(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("unit_price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("total_price", sa.Numeric(10, 2), nullable=False),
+        sa.PrimaryKeyConstraint("order_id", "line_number"),
+        sa.CheckConstraint("quantity >= 1", name="ck_order_lines_quantity_gte_1"),
+    )
+
+    # Existing single-item orders become one line each.
+    op.execute(
+        """
+        INSERT INTO order_lines (order_id, line_number, item_id, item_name, quantity, unit_price, total_price)
+        SELECT
+            id,
+            0,
+            item_id,
+            item_name,
+            quantity,
+            ROUND(total_price / NULLIF(quantity, 0), 2),
+            total_price
+        FROM orders
+        WHERE quantity >= 1
+        """
+    )
+
+    # Same lockdown as the other app tables: backend-only, no Supabase API access.
+    op.execute(sa.text("ALTER TABLE public.order_lines ENABLE ROW LEVEL SECURITY"))
+    op.execute(
+        sa.text(
+            """
+            DO $$
+            DECLARE
+                role_name text;
+            BEGIN
+                FOREACH role_name IN ARRAY ARRAY['anon', 'authenticated']
+                LOOP
+                    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = role_name) THEN
+                        EXECUTE format('REVOKE ALL ON TABLE public.order_lines FROM %I', role_name);
+                    END IF;
+                END LOOP;
+            END
+            $$;
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("order_lines")
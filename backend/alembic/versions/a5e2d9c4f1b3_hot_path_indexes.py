@@ -0,0 +1,96 @@
+"""add indexes for hot admin list and active event queries
+
+Revision ID: a5e2d9c4f1b3
+Revises: 7b1d5f8c2a4e
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a5e2d9c4f1b3"
+down_revision: Union[str, None] = "7b1d5f8c2a4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns, extra create_index kwargs)
+_INDEXES = [
+    ("ix_orders_created_at", "orders", [sa.text("created_at DESC")], {}),
+    ("ix_orders_event_created", "orders", ["event_id", sa.text("created_at DESC")], {}),
+    ("ix_orders_event_status_created", "orders", ["event_id", "status", sa.text("created_at DESC")], {}),
+    ("ix_orders_status_created", "orders", ["status", sa.text("created_at DESC")], {}),
+    ("ix_orders_email", "orders", ["email"], {}),
+    ("ix_feedback_created_at", "feedback", [sa.text("created_at DESC")], {}),
+    ("ix_feedback_origin_created", "feedback", ["origin", sa.text("created_at DESC")], {}),
+    ("ix_catering_requests_created_at", "catering_requests", [sa.text("created_at DESC")], {}),
+    (
+        "ix_catering_request_comments_created_at",
+        "catering_request_comments",
+        [sa.text("created_at DESC")],
+        {},
+    ),
+    ("ix_items_sort_order", "items", ["sort_order"], {}),
+    ("ix_locations_sort_order", "locations", ["sort_order"], {}),
+    (
+        "ux_events_single_active",
+        "events",
+        ["is_active"],
+        {"unique": True, "postgresql_where": sa.text("is_active")},
+    ),
+]
+
+
+def _end_driver_transaction() -> None:
+    # pg8000 implicitly opens a transaction for the isolation level probe that
+    # autocommit_block() runs, so close it before any CONCURRENTLY statement.
+    # Without an open transaction this is a no-op warning.
+    op.execute("COMMIT")
+
+
+def upgrade() -> None:
+    # The partial unique index allows one active event; keep the most recently
+    # updated one if earlier writes left several active.
+    op.execute(
+        """
+        UPDATE events
+        SET is_active = FALSE
+        WHERE is_active
+          AND id <> (
+              SELECT id FROM events
+              WHERE is_active
+              ORDER BY updated_at DESC NULLS LAST, id DESC
+              LIMIT 1
+          )
+        """
+    )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction. Dropping first
+    # clears an INVALID index left behind by an interrupted previous attempt.
+    with op.get_context().autocommit_block():
+        _end_driver_transaction()
+        for name, table, columns, kwargs in _INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(name, table, columns, postgresql_concurrently=True, **kwargs)
+        # Every query on event_id is covered by the (event_id, created_at) index.
+        op.drop_index("ix_orders_event_id", table_name="orders", postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        _end_driver_transaction()
+        op.create_index(
+            "ix_orders_event_id",
+            "orders",
+            ["event_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for name, table, _, _ in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
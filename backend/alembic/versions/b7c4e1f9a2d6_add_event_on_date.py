@@ -0,0 +1,59 @@
+"""add typed event_on date to events
+
+Revision ID: b7c4e1f9a2d6
+Revises: 5b8e2c4d7f19
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date, datetime
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c4e1f9a2d6"
+down_revision: Union[str, None] = "5b8e2c4d7f19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of schemas.parse_event_date so later changes there do not alter this backfill.
+_FORMATS = ("%B %d, %Y", "%B %d %Y", "%b %d, %Y", "%b %d %Y", "%A, %B %d, %Y", "%d %B %Y", "%Y-%m-%d")
+_ORDINAL_SUFFIX = re.compile(r"(?<=\d)(st|nd|rd|th)\b", re.IGNORECASE)
+
+
+def _parse(value: str) -> Optional[date]:
+    cleaned = " ".join(_ORDINAL_SUFFIX.sub("", value.replace(".", "")).split())
+    for fmt in _FORMATS:
+        try:
+            return datetime.strptime(cleaned, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def upgrade() -> None:
+    op.add_column("events", sa.Column("event_on", sa.Date(), nullable=True))
+
+    # event_date stays the display string; rows it cannot be read from keep event_on NULL.
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, event_date FROM events")).all()
+    for event_id, event_date in rows:
+        event_on = _parse(event_date)
+        if event_on is not None:
+            bind.execute(
+                sa.text("UPDATE events SET event_on = :event_on WHERE id = :id"),
+                {"event_on": event_on, "id": event_id},
+            )
+
+    op.create_index("ix_events_event_on", "events", ["event_on"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_events_event_on", table_name="events")
+    op.drop_column("events", "event_on")
@@ -0,0 +1,56 @@
+"""create catalog_version
+
+Revision ID: c8e5f2a7d3b4
+Revises: b7c4e1f9a2d6
+Create Date: 2026-10-17 00:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e5f2a7d3b4"
+down_revision: Union[str, None] = "b7c4e1f9a2d6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "catalog_version",
+        sa.Column("id", sa.SmallInteger(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.CheckConstraint("id = 1", name="ck_catalog_version_single_row"),
+    )
+    op.execute(sa.text("INSERT INTO catalog_version (id, version) VALUES (1, 0)"))
+
+    # Same lockdown as the other app tables: backend-only, no Supabase API access.
+    op.execute(sa.text("ALTER TABLE public.catalog_version ENABLE ROW LEVEL SECURITY"))
+    op.execute(
+        sa.text(
+            """
+            DO $$
+            DECLARE
+                role_name text;
+            BEGIN
+                FOREACH role_name IN ARRAY ARRAY['anon', 'authenticated']
+                LOOP
+                    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = role_name) THEN
+                        EXECUTE format('REVOKE ALL ON TABLE public.catalog_version FROM %I', role_name);
+                    END IF;
+                END LOOP;
+            END
+            $$;
+            """
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_version")
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""Benchmark the admin list endpoints against their former ORM-entity versions.
+
+Run from the backend/ directory against a migrated database:
+    python3 -m bench.admin_lists --rows 100000 --iterations 5
+
+Seeds ``--rows`` orders (one line each, ``event_id = --event-id``, default 0, no
+real event) and as many feedback rows, then times ``admin_list_orders`` and
+``admin_list_feedback`` against equivalents that load ``Order``/``Feedback``
+entities as the endpoints used to. The seeded rows are deleted afterwards.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable
+
+from sqlalchemy import delete, text
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models import Feedback, Order, OrderLine
+from routers.admin import _order_dict, admin_list_feedback, admin_list_orders
+from schemas import FEEDBACK_ORIGIN_LABELS, FEEDBACK_TYPE_LABELS
+
+_BENCH_NAME = "bench-admin-lists"
+
+_SEED_ORDERS_SQL = text(
+    """
+    INSERT INTO orders (id, event_id, name, item_id, item_name, quantity, pickup_location,
+                        pickup_time_slot, email, total_price, status, reminded, paid,
+                        exclude_email, created_at)
+    SELECT gen_random_uuid()::text, :event_id, :name, 'bench-item', 'Lamprais', 2, 'Welland',
+           '11:00 AM - 12:00 PM', 'bench@example.com', 40.00, 'pending', FALSE, FALSE,
+           FALSE, now() - make_interval(secs => i)
+    FROM generate_series(1, :rows) AS i
+    """
+)
+_SEED_LINES_SQL = text(
+    """
+    INSERT INTO order_lines (order_id, line_number, item_id, item_name, quantity, unit_price, total_price)
+    SELECT id, 0, item_id, item_name, quantity, 20.00, total_price FROM orders WHERE name = :name
+    """
+)
+_SEED_FEEDBACK_SQL = text(
+    """
+    WITH labels AS (SELECT CAST(:origins AS TEXT[]) AS origins, CAST(:types AS TEXT[]) AS types)
+    INSERT INTO feedback (id, origin, feedback_type, name, contact, message, created_at, status)
+    SELECT gen_random_uuid()::text, origins[1 + mod(i, cardinality(origins))],
+           types[1 + mod(i, cardinality(types))], :name, 'bench@example.com', 'Benchmark feedback',
+           now() - make_interval(secs => i), 'new'
+    FROM labels, generate_series(1, :rows) AS i
+    """
+)
+
+
+def _seed(event_id: int, rows: int) -> None:
+    db = SessionLocal()
+    try:
+        db.execute(_SEED_ORDERS_SQL, {"event_id": event_id, "name": _BENCH_NAME, "rows": rows})
+        db.execute(_SEED_LINES_SQL, {"name": _BENCH_NAME})
+        db.execute(
+            _SEED_FEEDBACK_SQL,
+            {
+                "origins": list(FEEDBACK_ORIGIN_LABELS),
+                "types": list(FEEDBACK_TYPE_LABELS),
+                "name": _BENCH_NAME,
+                "rows": rows,
+            },
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _cleanup() -> None:
+    db = SessionLocal()
+    try:
+        bench_orders = db.query(Order.id).filter(Order.name == _BENCH_NAME)
+        db.execute(delete(OrderLine).where(OrderLine.order_id.in_(bench_orders.scalar_subquery())))
+        db.execute(delete(Order).where(Order.name == _BENCH_NAME))
+        db.execute(delete(Feedback).where(Feedback.name == _BENCH_NAME))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _orm_list_orders(db: Session, event_id: int) -> list[dict]:
+    orders = db.query(Order).filter(Order.event_id == event_id).order_by(Order.created_at.desc()).all()
+    lines = (
+        db.query(OrderLine)
+        .join(Order, Order.id == OrderLine.order_id)
+        .filter(Order.event_id == event_id)
+        .order_by(OrderLine.order_id, OrderLine.line_number)
+        .all()
+    )
+    lines_by_order: dict[str, list[OrderLine]] = {}
+    for line in lines:
+        lines_by_order.setdefault(line.order_id, []).append(line)
+    return [_order_dict(order, lines_by_order.get(order.id, [])) for order in orders]
+
+
+def _orm_list_feedback(db: Session) -> dict:
+    rows = db.query(Feedback).order_by(Feedback.created_at.desc()).all()
+    items = [
+        {
+            "id": row.id,
+            "origin": row.origin,
+            "origin_label": FEEDBACK_ORIGIN_LABELS.get(row.origin, row.origin),
+            "feedback_type": row.feedback_type,
+            "feedback_type_label": FEEDBACK_TYPE_LABELS.get(row.feedback_type, row.feedback_type),
+            "order_id": row.order_id,
+            "name": row.name,
+            "contact": row.contact,
+            "reason": row.reason,
+            "other_details": row.other_details,
+            "message": row.message,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "status": row.status,
+            "admin_comment": row.admin_comment,
+        }
+        for row in rows
+    ]
+    all_rows = db.query(Feedback).all()
+    origin_counts = {
+        origin: sum(1 for row in all_rows if row.origin == origin) for origin in FEEDBACK_ORIGIN_LABELS
+    }
+    type_counts = {
+        feedback_type: sum(1 for row in all_rows if row.feedback_type == feedback_type)
+        for feedback_type in FEEDBACK_TYPE_LABELS
+    }
+    return {"total": len(all_rows), "origin_counts": origin_counts, "type_counts": type_counts, "items": items}
+
+
+def _time(run: Callable[[Session], object], iterations: int) -> list[float]:
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        with SessionLocal() as db:
+            run(db)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _summary(label: str, latencies: list[float]) -> str:
+    return (
+        f"{label:20s} p50 {statistics.median(latencies):9.1f} ms  "
+        f"min {min(latencies):9.1f} ms  max {max(latencies):9.1f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--event-id", type=int, default=0)
+    args = parser.parse_args()
+
+    event_id = args.event_id
+    cases = {
+        "orders": (
+            lambda db: _orm_list_orders(db, event_id),
+            lambda db: admin_list_orders(status=None, event_id=event_id, paid=None, email=None, db=db, _={}),
+        ),
+        "feedback": (
+            _orm_list_feedback,
+            lambda db: admin_list_feedback(reason=None, origin=None, feedback_type=None, db=db, _={}),
+        ),
+    }
+
+    _seed(event_id, args.rows)
+    results = []
+    try:
+        for name, (orm_run, core_run) in cases.items():
+            orm = _time(orm_run, args.iterations)
+            core = _time(core_run, args.iterations)
+            results.append((name, orm, core))
+    finally:
+        _cleanup()
+
+    print(f"{args.rows} seeded orders and feedback rows, {args.iterations} runs each")
+    for name, orm, core in results:
+        print(_summary(f"{name} ORM entities", orm))
+        print(_summary(f"{name} Core rows", core))
+        print(f"{name + ' speedup':20s} {statistics.median(orm) / statistics.median(core):.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
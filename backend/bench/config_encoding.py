@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Microbenchmark: encode the config per request vs serve pre-encoded bytes.
+
+Needs no database; it renders a synthetic config shaped like GET /api/config:
+    python3 -m bench.config_encoding --items 6 --locations 4 --number 20000
+"""
+
+import argparse
+import gzip
+import sys
+import timeit
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+
+from event_config import encode_config
+
+
+def _sample_config(item_count: int, location_count: int) -> dict:
+    return {
+        "event": {"date": "February 28th, 2026"},
+        "currency": "CAD",
+        "hero_header": "Lamprais Pre-Orders",
+        "hero_header_sage": "Now Open",
+        "hero_subheader": "Authentic Sri Lankan Lamprais, wrapped in banana leaf and baked to order.",
+        "promo_details": "Order by Thursday for weekend pickup.",
+        "tooltip_enabled": True,
+        "tooltip_header": "What is Lamprais?",
+        "tooltip_body": "Rice cooked in stock, served with curries and baked in a banana leaf.",
+        "tooltip_image_path": "/assets/img/tooltip/lamprais-how-its-made-compressed.png",
+        "hero_side_image_path": "/assets/img/hero-side/lamprais-side.png",
+        "etransfer_enabled": True,
+        "etransfer_email": "payments@example.com",
+        "is_active": True,
+        "items": [
+            {
+                "id": f"item-{i}",
+                "name": f"Item {i}",
+                "description": "Authentic Sri Lankan rice cooked in rich stock with fragrant accompaniments",
+                "price": 23.0 + i,
+                "discounted_price": 20.0 + i if i % 2 else None,
+                "minimum_order_quantity": 1,
+            }
+            for i in range(item_count)
+        ],
+        "locations": [
+            {
+                "id": f"location-{i}",
+                "name": f"Location {i}",
+                "address": f"{100 + i} Main Street",
+                "timeSlots": [f"{h}:00 PM - {h + 1}:00 PM" for h in range(1, 8)],
+            }
+            for i in range(location_count)
+        ],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=6)
+    parser.add_argument("--locations", type=int, default=4)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    config = _sample_config(args.items, args.locations)
+    body = encode_config(config)
+    gzip_body = gzip.compress(body, mtime=0)
+    assert body == JSONResponse(jsonable_encoder(config)).body
+
+    cases = {
+        # What FastAPI does for a returned dict: jsonable_encoder, then JSONResponse.render.
+        "encode per request": lambda: JSONResponse(jsonable_encoder(config)).body,
+        "pre-encoded bytes": lambda: Response(content=body, media_type="application/json").body,
+        "pre-gzipped bytes": lambda: Response(content=gzip_body, media_type="application/json").body,
+    }
+
+    print(f"Payload {len(body)} bytes ({len(gzip_body)} gzipped), {args.number} iterations")
+    baseline = None
+    for label, case in cases.items():
+        per_call_us = min(timeit.repeat(case, number=args.number, repeat=3)) / args.number * 1e6
+        baseline = baseline or per_call_us
+        print(f"  {label:20s} {per_call_us:8.2f} us/request  ({baseline / per_call_us:5.1f}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Benchmark the ORM config loader against the single-statement JSON loader.
+
+Run from the backend/ directory against a database with an active event:
+    python3 -m bench.config_loader --iterations 200
+
+Both loaders must return identical JSON; the script exits non-zero otherwise.
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from event_config import get_config_from_db, get_config_json_from_db
+
+
+def _time_loader(loader: Callable[[Session], dict], iterations: int) -> list[float]:
+    timings: list[float] = []
+    for _ in range(iterations):
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            loader(db)
+            timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            db.close()
+    return timings
+
+
+def _summary(label: str, timings: list[float]) -> str:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return (
+        f"{label:12s} mean {statistics.mean(ordered):7.2f} ms  "
+        f"p50 {statistics.median(ordered):7.2f} ms  p95 {p95:7.2f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        orm_config = get_config_from_db(db)
+        json_config = get_config_json_from_db(db)
+    finally:
+        db.close()
+    if json.dumps(orm_config) != json.dumps(json_config):
+        print("Loaders disagree:")
+        print(f"  orm:  {json.dumps(orm_config, sort_keys=True)}")
+        print(f"  json: {json.dumps(json_config, sort_keys=True)}")
+        return 1
+
+    _time_loader(get_config_from_db, args.warmup)
+    _time_loader(get_config_json_from_db, args.warmup)
+    orm_timings = _time_loader(get_config_from_db, args.iterations)
+    json_timings = _time_loader(get_config_json_from_db, args.iterations)
+
+    print(f"Identical output ({len(json_config['items'])} items, {len(json_config['locations'])} locations)")
+    print(_summary("orm", orm_timings))
+    print(_summary("json_agg", json_timings))
+    print(f"speedup      {statistics.median(orm_timings) / statistics.median(json_timings):.2f}x (p50)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Benchmark the read paths on each supported database driver.
+
+Run from the backend/ directory against a migrated database with an active event:
+    python3 -m bench.db_driver --orders 1000 --iterations 200
+
+For pg8000 and psycopg in turn this times two reads through a fresh engine from
+``database.create_sync_engine``: the admin orders list (``admin_list_orders``,
+including its line query and serialization) over ``--orders`` synthetic orders
+with ``event_id = --event-id`` (default 0, no real event), and the single-statement
+public config query. Synthetic orders are deleted afterwards.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import delete
+from sqlalchemy.orm import Session, sessionmaker
+
+from constants import OrderStatus
+from database import SessionLocal, create_sync_engine
+from event_config import get_config_json_from_db
+from models import Order
+from order_lines import delete_order_lines, insert_order_lines
+from routers.admin import admin_list_orders
+from services.order_queue import insert_orders
+
+_BENCH_NAME = "bench-db-driver"
+DRIVERS = ("pg8000", "psycopg")
+
+
+def _seed(event_id: int, orders: int) -> None:
+    rows, lines = [], []
+    for _ in range(orders):
+        order_id = str(uuid.uuid4())
+        rows.append({
+            "id": order_id,
+            "event_id": event_id,
+            "name": _BENCH_NAME,
+            "item_id": "bench-item",
+            "item_name": "Lamprais",
+            "quantity": 2,
+            "pickup_location": "Welland",
+            "pickup_time_slot": "11:00 AM - 12:00 PM",
+            "email": "bench@example.com",
+            "total_price": 40.0,
+            "status": OrderStatus.PENDING,
+            "created_at": datetime.now(timezone.utc),
+        })
+        lines.append({
+            "order_id": order_id,
+            "line_number": 0,
+            "item_id": "bench-item",
+            "item_name": "Lamprais",
+            "quantity": 2,
+            "unit_price": 20.0,
+            "total_price": 40.0,
+        })
+    db = SessionLocal()
+    try:
+        insert_orders(db, rows)
+        insert_order_lines(db, lines)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _cleanup() -> None:
+    db = SessionLocal()
+    try:
+        order_ids = [row.id for row in db.query(Order.id).filter(Order.name == _BENCH_NAME)]
+        delete_order_lines(db, order_ids)
+        db.execute(delete(Order).where(Order.name == _BENCH_NAME))
+        db.commit()
+    finally:
+        db.close()
+
+
+def _time(
+    session_factory: Callable[[], Session], run: Callable[[Session], object], iterations: int, warmup: int
+) -> list[float]:
+    # A new session per run, like a request, on pooled connections that keep their prepared statements.
+    latencies = []
+    for index in range(warmup + iterations):
+        start = time.perf_counter()
+        with session_factory() as db:
+            run(db)
+        if index >= warmup:
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def _summary(label: str, latencies: list[float]) -> str:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        f"{label:24s} {len(ordered) / (sum(ordered) / 1000):8.1f} runs/s  "
+        f"p50 {statistics.median(ordered):7.2f} ms  p99 {p99:7.2f} ms"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20, help="untimed runs, also past the prepare threshold")
+    parser.add_argument("--event-id", type=int, default=0)
+    parser.add_argument("--drivers", default=",".join(DRIVERS))
+    args = parser.parse_args()
+
+    def list_orders(db: Session) -> object:
+        return admin_list_orders(status=None, event_id=args.event_id, paid=None, email=None, db=db, _={})
+
+    _seed(args.event_id, args.orders)
+    results = []
+    try:
+        for driver in args.drivers.split(","):
+            engine = create_sync_engine(driver=driver)
+            try:
+                session_factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+                for label, run in (("admin orders list", list_orders), ("config query", get_config_json_from_db)):
+                    results.append((driver, label, _time(session_factory, run, args.iterations, args.warmup)))
+            finally:
+                engine.dispose()
+    finally:
+        _cleanup()
+
+    print(f"{args.orders} orders in the list, {args.iterations} runs per query")
+    for driver, label, latencies in results:
+        print(_summary(f"{driver} {label}", latencies))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""Load-test the public order intake path over HTTP.
+
+Run from the backend/ directory against a migrated database with an active event:
+    python3 -m bench.load_orders --spawn --users 32 --duration 30
+
+Each virtual user loops through what a customer does: fetch the config, submit
+an order, and now and then leave feedback on it. Orders are built from the
+``seed.py`` fixtures and the active event's catalog with a fixed ``--seed``, so
+two runs send the same traffic and results can be compared across commits.
+
+``--spawn`` starts uvicorn itself with ``EMAIL_ENABLED=false`` so no email
+leaves the machine, and with the per-IP rate limit off since every virtual user
+shares one address; otherwise point ``--base-url`` at a running server. Orders
+and feedback created by the run are deleted afterwards unless ``--keep``.
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import delete
+
+from database import SessionLocal
+from event_config import get_catalog_index_for_event_id
+from idempotency import release_idempotency_keys
+from models import Feedback, Order
+from order_lines import delete_order_lines
+from seed import SEED_ORDERS
+from slot_capacity import SlotKey, order_holds_capacity, release_slot
+
+
+class _Stats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+        self.order_ids: list[str] = []
+        self.idempotency_keys: list[str] = []
+
+    def record(self, label: str, elapsed_ms: float, ok: bool) -> None:
+        with self._lock:
+            self.latencies[label].append(elapsed_ms)
+            if not ok:
+                self.errors[label] += 1
+
+    def created(self, order_id: str, idempotency_key: str) -> None:
+        with self._lock:
+            self.order_ids.append(order_id)
+            self.idempotency_keys.append(idempotency_key)
+
+
+def _request(base_url: str, method: str, path: str, body: Optional[dict] = None, headers: Optional[dict] = None):
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = urllib.request.Request(base_url + path, data=data, method=method)
+    request.add_header("Content-Type", "application/json")
+    for name, value in (headers or {}).items():
+        request.add_header(name, value)
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read() or b"null")
+    except urllib.error.HTTPError as exc:
+        return exc.code, None
+
+
+def _timed(stats: _Stats, label: str, ok_status: int, *args, **kwargs):
+    start = time.perf_counter()
+    try:
+        status, payload = _request(*args, **kwargs)
+    except (OSError, ValueError):
+        status, payload = 0, None
+    stats.record(label, (time.perf_counter() - start) * 1000, status == ok_status)
+    return status, payload
+
+
+def _order_payload(rng: random.Random, config: dict) -> dict:
+    """A seed fixture's customer and pickup choice mapped onto the live catalog."""
+    fixture = rng.choice(SEED_ORDERS)
+    locations = config["locations"]
+    location = next((loc for loc in locations if loc["name"] == fixture["pickup_location"]), None)
+    location = location or rng.choice(locations)
+    time_slots = location["timeSlots"]
+    time_slot = fixture["pickup_time_slot"] if fixture["pickup_time_slot"] in time_slots else rng.choice(time_slots)
+
+    items = rng.sample(config["items"], k=min(len(config["items"]), rng.choice((1, 1, 1, 2))))
+    lines = [
+        {
+            "item_id": item["id"],
+            "quantity": max(fixture["quantity"], int(item.get("minimum_order_quantity") or 1)),
+        }
+        for item in items
+    ]
+    return {
+        "name": fixture["name"],
+        "email": fixture["email"],
+        "phone_number": fixture.get("phone_number"),
+        "pickup_location": location["name"],
+        "pickup_time_slot": time_slot,
+        "lines": lines,
+    }
+
+
+def _virtual_user(
+    base_url: str, rng: random.Random, deadline: float, feedback_rate: float, stats: _Stats
+) -> None:
+    while time.monotonic() < deadline:
+        status, config = _timed(stats, "GET /api/config", 200, base_url, "GET", "/api/config")
+        if status != 200 or not config or not config.get("items") or not config.get("locations"):
+            continue
+        payload = _order_payload(rng, config)
+        idempotency_key = str(uuid.UUID(int=rng.getrandbits(128)))
+        status, result = _timed(
+            stats,
+            "POST /api/orders",
+            201,
+            base_url,
+            "POST",
+            "/api/orders",
+            payload,
+            headers={"Idempotency-Key": idempotency_key},
+        )
+        if status != 201 or not result:
+            continue
+        stats.created(result["order_id"], idempotency_key)
+        if rng.random() < feedback_rate:
+            _timed(
+                stats,
+                "POST /api/feedback",
+                201,
+                base_url,
+                "POST",
+                "/api/feedback",
+                {
+                    "origin": "events_page_customer",
+                    "feedback_type": "feedback",
+                    "order_id": result["order_id"],
+                    "name": payload["name"],
+                    "contact": payload["email"],
+                    "message": "Load test feedback",
+                },
+            )
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _spawn_server(workers: int) -> tuple[subprocess.Popen, str]:
+    port = _free_port()
+    env = {**os.environ, "EMAIL_ENABLED": "false", "RATE_LIMIT_ENABLED": "false"}
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            if _request(base_url, "GET", "/api/health")[0] == 200:
+                return process, base_url
+        except OSError:
+            pass
+        time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError("uvicorn did not start")
+
+
+def _cleanup(order_ids: list[str], idempotency_keys: list[str]) -> None:
+    """Delete the run's orders, giving their quantities back to any capacity slots."""
+    db = SessionLocal()
+    try:
+        for start in range(0, len(order_ids), 1000):
+            chunk = order_ids[start:start + 1000]
+            for order in db.query(Order).filter(Order.id.in_(chunk)):
+                catalog = get_catalog_index_for_event_id(db, order.event_id)
+                location = catalog.find_location(order.pickup_location) if catalog is not None else None
+                if location is not None and order_holds_capacity(order.status):
+                    release_slot(db, SlotKey(order.event_id, location.id, order.pickup_time_slot), order.quantity)
+            db.execute(delete(Feedback).where(Feedback.order_id.in_(chunk)))
+            delete_order_lines(db, chunk)
+            db.execute(delete(Order).where(Order.id.in_(chunk)))
+        release_idempotency_keys(db, idempotency_keys)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def _summary(label: str, timings: list[float], errors: int, elapsed: float) -> str:
+    ordered = sorted(timings)
+    return (
+        f"{label:20s} {len(ordered):7d} req {len(ordered) / elapsed:8.1f} req/s  "
+        f"p50 {statistics.median(ordered):7.2f}  p95 {_percentile(ordered, 0.95):7.2f}  "
+        f"p99 {_percentile(ordered, 0.99):7.2f} ms  errors {errors}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--spawn", action="store_true", help="start uvicorn with email disabled")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers with --spawn")
+    parser.add_argument("--users", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--feedback-rate", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep", action="store_true", help="keep the orders and feedback created")
+    args = parser.parse_args()
+
+    process = None
+    base_url = args.base_url.rstrip("/")
+    if args.spawn:
+        process, base_url = _spawn_server(args.workers)
+
+    stats = _Stats()
+    try:
+        deadline = time.monotonic() + args.duration
+        threads = [
+            threading.Thread(
+                target=_virtual_user,
+                args=(base_url, random.Random(args.seed * 100_003 + index), deadline, args.feedback_rate, stats),
+            )
+            for index in range(args.users)
+        ]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+        if not args.keep:
+            _cleanup(stats.order_ids, stats.idempotency_keys)
+
+    print(f"{args.users} users for {elapsed:.1f} s against {base_url}, seed {args.seed}")
+    for label, timings in stats.latencies.items():
+        print(_summary(label, timings, stats.errors[label], elapsed))
+    print(f"{'orders placed':20s} {len(stats.order_ids):7d}     {len(stats.order_ids) / elapsed:8.1f} orders/s")
+    return 1 if any(stats.errors.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Benchmark per-request order commits against the group-commit writer.
+
+Run from the backend/ directory against a migrated database:
+    python3 -m bench.order_ingest --orders 2000 --concurrency 32
+
+Both modes insert the same rows from ``--concurrency`` threads: one INSERT and
+COMMIT per order, or through ``OrderWriteQueue``. Rows are written with
+``event_id = --event-id`` (default 0, no real event) and deleted afterwards.
+"""
+
+import argparse
+import statistics
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import delete
+
+from constants import OrderStatus
+from database import SessionLocal
+from models import Order
+from services.order_queue import OrderWriteQueue, QueuedOrder
+
+_BENCH_NAME = "bench-order-ingest"
+
+
+def _order_values(event_id: int) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "event_id": event_id,
+        "name": _BENCH_NAME,
+        "item_id": "bench-item",
+        "item_name": "Lamprais",
+        "quantity": 2,
+        "pickup_location": "Welland",
+        "pickup_time_slot": "11:00 AM - 12:00 PM",
+        "phone_number": None,
+        "email": "bench@example.com",
+        "total_price": 40.0,
+        "status": OrderStatus.PENDING,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+
+def _commit_per_request(event_id: int) -> Callable[[], None]:
+    def place() -> None:
+        db = SessionLocal()
+        try:
+            db.add(Order(**_order_values(event_id)))
+            db.commit()
+        finally:
+            db.close()
+
+    return place
+
+
+def _group_commit(event_id: int, writer: OrderWriteQueue) -> Callable[[], None]:
+    def place() -> None:
+        writer.submit(QueuedOrder(values=_order_values(event_id), response={})).result()
+
+    return place
+
+
+def _run(place: Callable[[], None], orders: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    lock = threading.Lock()
+    remaining = iter(range(orders))
+
+    def worker() -> None:
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    return
+            start = time.perf_counter()
+            place()
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                latencies.append(elapsed)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - started, latencies
+
+
+def _summary(label: str, orders: int, elapsed: float, latencies: list[float]) -> str:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    return (
+        f"{label:16s} {orders / elapsed:8.1f} orders/s  "
+        f"p50 {statistics.median(ordered):7.2f} ms  p99 {p99:7.2f} ms"
+    )
+
+
+def _cleanup() -> None:
+    db = SessionLocal()
+    try:
+        db.execute(delete(Order).where(Order.name == _BENCH_NAME))
+        db.commit()
+    finally:
+        db.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--orders", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--event-id", type=int, default=0)
+    parser.add_argument("--max-batch", type=int, default=100)
+    parser.add_argument("--max-delay-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    writer = OrderWriteQueue(
+        SessionLocal,
+        max_batch=args.max_batch,
+        max_delay_seconds=args.max_delay_ms / 1000,
+        max_pending=max(args.orders, args.concurrency),
+    )
+    writer.start()
+    try:
+        per_request = _run(_commit_per_request(args.event_id), args.orders, args.concurrency)
+        grouped = _run(_group_commit(args.event_id, writer), args.orders, args.concurrency)
+    finally:
+        writer.stop()
+        _cleanup()
+
+    print(f"{args.orders} orders, {args.concurrency} concurrent clients")
+    print(_summary("per-request", args.orders, *per_request))
+    print(_summary("group commit", args.orders, *grouped))
+    print(f"speedup          {per_request[0] / grouped[0]:.2f}x (throughput)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""Cross-worker invalidation of in-process catalog caches.
+
+Admin writes that touch events, items or locations bump the ``catalog_version``
+row inside their transaction. Order validation compares that row with the
+version a worker last saw before trusting its cached catalog, so no worker
+prices an order from a catalog that changed elsewhere.
+
+With ``CATALOG_NOTIFY_ENABLED`` the same writes also publish ``NOTIFY loku_catalog``,
+delivered once the write commits. Every worker then runs a listener thread on its
+own connection and drops its local caches, including the public config snapshot,
+when another worker announces a change.
+"""
+
+import collections
+import itertools
+import os
+import threading
+import uuid
+from typing import Callable, Optional
+
+from sqlalchemy import create_engine, pool, text
+from sqlalchemy.orm import Session
+
+from config import settings
+
+CATALOG_CHANNEL = "loku_catalog"
+
+# Identifies this process in payloads so a worker skips its own notifications.
+_WORKER_ID = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+_versions = itertools.count(1)
+_local_invalidators: list[Callable[[], object]] = []
+_listener: Optional["CatalogListener"] = None
+
+
+def register_local_cache(invalidate: Callable[[], object]) -> None:
+    """Register a callback that drops an in-process cache derived from the catalog."""
+    _local_invalidators.append(invalidate)
+
+
+def invalidate_local_caches() -> None:
+    for invalidate in _local_invalidators:
+        invalidate()
+
+
+_BUMP_CATALOG_VERSION_SQL = text("UPDATE catalog_version SET version = version + 1 WHERE id = 1")
+
+
+def publish_catalog_change(db: Session) -> Optional[int]:
+    """Record a catalog change in the session's current transaction."""
+    db.execute(_BUMP_CATALOG_VERSION_SQL)
+    if not settings.catalog_notify_enabled:
+        return None
+    version = next(_versions)
+    db.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": CATALOG_CHANNEL, "payload": f"{_WORKER_ID}:{version}"},
+    )
+    return version
+
+
+class CatalogListener(threading.Thread):
+    """Background LISTEN loop that invalidates local caches on foreign notifications.
+
+    pg8000 only reads server messages while running a statement, so the loop
+    polls with a trivial query and drains the connection's notification queue.
+    psycopg hands notifications to a handler instead, which feeds the same queue.
+    """
+
+    def __init__(self, database_url: str, poll_seconds: float):
+        super().__init__(name="catalog-listener", daemon=True)
+        self._engine = create_engine(database_url, poolclass=pool.NullPool)
+        self._poll_seconds = poll_seconds
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        backoff = 1.0
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+                backoff = 1.0
+            except Exception as exc:
+                print(f"[catalog] Listener error, reconnecting in {backoff:.0f}s: {exc}")
+                self._stop_event.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+        self._engine.dispose()
+
+    def _listen(self) -> None:
+        raw = self._engine.raw_connection()
+        try:
+            connection = raw.driver_connection
+            connection.autocommit = True
+            if hasattr(connection, "add_notify_handler"):
+                notifications = collections.deque()
+                connection.add_notify_handler(
+                    lambda notify: notifications.append((notify.pid, notify.channel, notify.payload))
+                )
+            else:
+                notifications = connection.notifications
+            cursor = connection.cursor()
+            cursor.execute(f"LISTEN {CATALOG_CHANNEL}")
+            # Anything published while we were disconnected is lost, so start clean.
+            invalidate_local_caches()
+            while not self._stop_event.wait(self._poll_seconds):
+                cursor.execute("SELECT 1")
+                self._drain(notifications)
+        finally:
+            raw.close()
+
+    def _drain(self, notifications: "collections.deque[tuple]") -> None:
+        changed = False
+        while notifications:
+            _, channel, payload = notifications.popleft()
+            if channel == CATALOG_CHANNEL and not payload.startswith(f"{_WORKER_ID}:"):
+                changed = True
+        if changed:
+            invalidate_local_caches()
+
+
+def start_catalog_listener() -> None:
+    global _listener
+    if not settings.catalog_notify_enabled or _listener is not None:
+        return
+    from database import get_database_url
+
+    _listener = CatalogListener(
+        get_database_url(settings.catalog_listen_database_url),
+        settings.catalog_listen_poll_seconds,
+    )
+    _listener.start()
+
+
+def stop_catalog_listener() -> None:
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener.join(timeout=5)
+    _listener = None
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Check that the hot admin list queries and the active-event lookup use indexes.
+
+Run from the backend/ directory against a migrated database:
+    python3 check_indexes.py
+
+Each query is planned with EXPLAIN (FORMAT JSON) after ``SET enable_seqscan = off``
+so tiny dev tables still show which index the planner would pick. Any Seq Scan
+left in a plan means no index covers it, and the script exits non-zero.
+"""
+
+import json
+import sys
+from datetime import date
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import Query
+
+from database import SessionLocal
+from event_config import _ACTIVE_CATALOG_INDEX_SQL, _ACTIVE_CONFIG_SQL, _CATALOG_VERSION_SQL, _EVENT_CATALOG_INDEX_SQL
+from models import Event, Item, Location
+from order_lines import order_line_rows_query
+from routers.admin import (
+    _CATERING_COMMENTS_QUERY,
+    _CATERING_LIST_QUERY,
+    _event_list_query,
+    _feedback_list_query,
+    _order_list_filters,
+    _order_list_query,
+)
+
+# Filter combinations the admin orders page sends.
+_ORDER_FILTERS = [
+    ("", {}),
+    ("?status", {"status": "pending"}),
+    ("?event_id", {"event_id": 1}),
+    ("?event_id&status", {"event_id": 1, "status": "pending"}),
+    ("?event_id&email", {"event_id": 1, "email": "a@example.com"}),
+    ("?email", {"email": "a@example.com"}),
+    ("?paid", {"paid": True}),
+]
+
+
+def _admin_list_orders_checks() -> list[tuple[str, object]]:
+    # Each list is two statements: the order rows and, through the same filters, their lines.
+    checks = []
+    for suffix, params in _ORDER_FILTERS:
+        filters = _order_list_filters(**params)
+        checks.append((f"admin_list_orders{suffix}", _order_list_query(*filters)))
+        checks.append((f"admin_list_orders{suffix} (lines)", order_line_rows_query(*filters)))
+    return checks
+
+
+# (label, statement) pairs built with the same helpers as routers/admin.py and the
+# active-event lookups in event_config.py.
+CHECKS = [
+    ("admin_list_events", _event_list_query()),
+    (
+        "admin_list_events?event_on_from&event_on_to",
+        _event_list_query(event_on_from=date(2026, 1, 1), event_on_to=date(2026, 12, 31)),
+    ),
+    ("admin_list_items", Query(Item).order_by(Item.sort_order)),
+    ("admin_list_locations", Query(Location).order_by(Location.sort_order)),
+    *_admin_list_orders_checks(),
+    ("admin_list_feedback", _feedback_list_query()),
+    ("admin_list_feedback?origin", _feedback_list_query(origin="order_form")),
+    ("admin_list_catering_requests", _CATERING_LIST_QUERY),
+    ("admin_list_catering_requests (comments)", _CATERING_COMMENTS_QUERY),
+    ("active event", select(Event).where(Event.is_active == True).limit(1)),  # noqa: E712
+    ("active event config", _ACTIVE_CONFIG_SQL),
+    ("active catalog index", _ACTIVE_CATALOG_INDEX_SQL),
+    ("event catalog index", _EVENT_CATALOG_INDEX_SQL.bindparams(event_id=1)),
+    ("catalog version", _CATALOG_VERSION_SQL),
+]
+
+
+def _seq_scans(plan: dict) -> list[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan.get("Relation Name", "?"))
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+def _index_names(plan: dict) -> list[str]:
+    names = [plan["Index Name"]] if "Index Name" in plan else []
+    for child in plan.get("Plans", []):
+        names.extend(_index_names(child))
+    return names
+
+
+def _explain(db, statement) -> dict:
+    if isinstance(statement, Query):
+        statement = statement.statement
+    sql = str(statement.compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True}))
+    raw = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar()
+    if isinstance(raw, str):
+        raw = json.loads(raw)
+    return raw[0]["Plan"]
+
+
+def main() -> int:
+    db = SessionLocal()
+    failures = 0
+    try:
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        for label, statement in CHECKS:
+            plan = _explain(db, statement)
+            seq_scans = _seq_scans(plan)
+            if seq_scans:
+                failures += 1
+                print(f"FAIL  {label}: sequential scan on {', '.join(seq_scans)}")
+            else:
+                print(f"ok    {label}: {', '.join(dict.fromkeys(_index_names(plan)))}")
+    finally:
+        db.rollback()
+        db.close()
+
+    if failures:
+        print(f"\n{failures} quer{'y' if failures == 1 else 'ies'} without an index scan.")
+        return 1
+    print("\nAll checked queries use an index.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,6 +9,25 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
     database_url: str
+    # Driver for postgresql:// URLs on the sync engine: pg8000 (pure Python) or
+    # psycopg (libpq, binary). psycopg prepares statements server-side once a
+    # connection has run them prepare_threshold times; -1 turns that off, which
+    # PgBouncer in transaction mode before 1.21 needs.
+    database_driver: Literal["pg8000", "psycopg"] = "pg8000"
+    db_prepare_threshold: int = 5
+    # Optional read replica for the admin list and dashboard endpoints; unset, they
+    # read from DATABASE_URL.
+    database_read_url: str | None = None
+    # Connection pool of each engine (sync and async). Pre-ping is "always" (a round
+    # trip per checkout), "idle" (only connections idle for pre_ping_idle_seconds)
+    # or "never". statement_timeout applies per connection; 0 keeps the server's.
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = -1
+    db_pool_pre_ping: Literal["always", "idle", "never"] = "always"
+    db_pool_pre_ping_idle_seconds: float = 30.0
+    db_statement_timeout_ms: int = 0
     resend_api_key: str
     # Optional for modern Supabase projects using asymmetric JWTs (RS256/ES256).
     # Still used for legacy HS256 verification and local dev token minting.
@@ -16,6 +37,48 @@ class Settings(BaseSettings):
     email_enabled: bool = True
     frontend_url: str = "http://localhost:3000"
     dev_mode: bool = False
+    # Public config snapshot and catalog index lifetime. Admin writes invalidate the
+    # local worker immediately, and order validation checks the catalog_version row,
+    # so only the public config can lag by up to the TTL on other workers. 0 disables caching.
+    config_cache_ttl_seconds: float = 60.0
+    # Cache-Control sent with the public config (browsers revalidate via ETag).
+    config_cache_control: str = "public, max-age=0, s-maxage=15, stale-while-revalidate=60"
+    # Serve the config snapshot as pre-rendered JSON bytes (and optionally gzip).
+    config_preencode: bool = True
+    config_gzip: bool = False
+    # Cross-worker cache invalidation over Postgres LISTEN/NOTIFY. The listener needs
+    # a session-mode connection (direct or session pooler); defaults to DATABASE_URL.
+    catalog_notify_enabled: bool = False
+    catalog_listen_database_url: str | None = None
+    catalog_listen_poll_seconds: float = 1.0
+    # How long POST /api/orders remembers an Idempotency-Key and its response.
+    idempotency_key_ttl_seconds: int = 86400
+    # Group commit for POST /api/orders: one writer thread per worker inserts queued
+    # orders in batches of up to max_batch rows, waiting at most max_delay_ms.
+    order_queue_enabled: bool = False
+    order_queue_max_batch: int = 100
+    order_queue_max_delay_ms: float = 5.0
+    order_queue_max_pending: int = 1000
+    # Public POST endpoints: a token bucket per client IP and route, then a gate on
+    # how many run at once (0 sizes it to the async connection pool). Per worker.
+    # The buckets are opt-in: behind a proxy they need FORWARDED_ALLOW_IPS set for
+    # uvicorn, or every caller shares the proxy's bucket.
+    rate_limit_enabled: bool = False
+    rate_limit_per_minute: float = 30.0
+    rate_limit_burst: int = 10
+    admission_control_enabled: bool = True
+    admission_max_concurrency: int = 0
+    admission_max_wait_ms: float = 100.0
+    # Server-Timing header with per-request database and email time, and a warning
+    # for routes that run more than query_budget statements (0 disables it).
+    server_timing_enabled: bool = True
+    query_budget: int = 20
+    # Keep the last slow_query_buffer_size statements over slow_query_threshold_ms on
+    # the sync engines, with redacted parameters and an EXPLAIN plan (no ANALYZE).
+    slow_query_log_enabled: bool = False
+    slow_query_threshold_ms: float = 200.0
+    slow_query_buffer_size: int = 100
+    slow_query_explain: bool = True
 
 
 settings = Settings()
@@ -1,27 +1,165 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+import socket
+import time
+from typing import Optional, TypeVar
+
+from sqlalchemy import create_engine, event, exc, insert
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker, DeclarativeBase
 
 from config import settings
+from pool_metrics import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
+from request_timing import instrument_engine
+from slow_queries import record_slow_queries
 
-def get_database_url() -> str:
-    # Auto-map postgresql:// to postgresql+pg8000:// so env URLs work as-is.
-    database_url = settings.database_url
-    if database_url.startswith("postgresql://") and "+pg8000" not in database_url:
-        database_url = database_url.replace("postgresql://", "postgresql+pg8000://", 1)
+def get_database_url(database_url: Optional[str] = None, driver: Optional[str] = None) -> str:
+    # Auto-map postgresql:// to the configured driver so env URLs work as-is; a URL
+    # that already names a driver (postgresql+pg8000://) is used unchanged.
+    database_url = database_url or settings.database_url
+    if database_url.startswith("postgresql://"):
+        database_url = database_url.replace(
+            "postgresql://", f"postgresql+{driver or settings.database_driver}://", 1
+        )
     return database_url
 
 
-engine = create_engine(get_database_url(), pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def get_async_database_url(database_url: Optional[str] = None) -> str:
+    # Same URL as the sync engine, served by asyncpg.
+    database_url = get_database_url(database_url)
+    scheme, sep, rest = database_url.partition("://")
+    if scheme.startswith("postgresql"):
+        scheme = "postgresql+asyncpg"
+    return f"{scheme}{sep}{rest}"
+
+
+def _pool_options() -> dict:
+    # Each engine gets its own pool of this size.
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping == "always",
+    }
+
+
+def _configure_pool_events(sync_engine: Engine) -> None:
+    @event.listens_for(sync_engine, "connect")
+    def _set_statement_timeout(dbapi_connection, _connection_record):
+        if settings.db_statement_timeout_ms <= 0:
+            return
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET statement_timeout = {int(settings.db_statement_timeout_ms)}")
+        cursor.close()
+        dbapi_connection.commit()
+
+    if settings.db_pool_pre_ping != "idle":
+        return
+
+    # Only connections that sat in the pool long enough for a server or pooler to
+    # have dropped them are pinged, instead of paying a round trip on every checkout.
+    @event.listens_for(sync_engine, "checkin")
+    def _mark_idle(_dbapi_connection, connection_record):
+        if connection_record is not None:
+            connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, _connection_proxy):
+        checked_in_at = connection_record.info.get("checked_in_at")
+        if checked_in_at is None or time.monotonic() - checked_in_at < settings.db_pool_pre_ping_idle_seconds:
+            return
+        try:
+            alive = sync_engine.dialect.do_ping(dbapi_connection)
+        except Exception:
+            alive = False
+        if not alive:
+            # The pool discards this connection and checks out a fresh one.
+            raise exc.DisconnectionError()
+
+
+def _disable_nagle(dbapi_connection, _connection_record):
+    # pg8000 leaves Nagle's algorithm on, so a statement larger than its write
+    # buffer (e.g. a batched insert) stalls ~40 ms on the server's delayed ACK.
+    # libpq (psycopg) already sets TCP_NODELAY and exposes no socket object here.
+    sock = getattr(dbapi_connection, "_usock", None)
+    if sock is not None and sock.family in (socket.AF_INET, socket.AF_INET6):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def create_sync_engine(database_url: Optional[str] = None, driver: Optional[str] = None) -> Engine:
+    """A pooled engine for ``database_url`` (default DATABASE_URL) on pg8000 or psycopg."""
+    url = get_database_url(database_url, driver)
+    connect_args = {}
+    if make_url(url).get_driver_name() == "psycopg":
+        # Statements a connection has run prepare_threshold times are prepared
+        # server-side and then only bound and executed (None never prepares).
+        threshold = settings.db_prepare_threshold
+        connect_args["prepare_threshold"] = threshold if threshold >= 0 else None
+    sync_engine = create_engine(
+        url, poolclass=InstrumentedQueuePool, connect_args=connect_args, **_pool_options()
+    )
+    event.listen(sync_engine, "connect", _disable_nagle)
+    _configure_pool_events(sync_engine)
+    instrument_engine(sync_engine)
+    record_slow_queries(sync_engine)
+    return sync_engine
+
+
+engine = create_sync_engine()
+# Objects stay loaded after commit; responses are built from them without a reload.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Read-only admin lists run on a replica when one is configured. Replicas lag
+# the primary, so anything read back right after a write stays on get_db.
+read_engine = create_sync_engine(settings.database_read_url) if settings.database_read_url else engine
+ReadSessionLocal = (
+    sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=read_engine)
+    if read_engine is not engine
+    else SessionLocal
+)
+
+# Public write paths run on the event loop instead of holding a threadpool token
+# while they wait on the database.
+async_engine = create_async_engine(
+    get_async_database_url(), poolclass=InstrumentedAsyncAdaptedQueuePool, **_pool_options()
+)
+_configure_pool_events(async_engine.sync_engine)
+instrument_engine(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
     pass
 
 
+_Model = TypeVar("_Model", bound=Base)
+
+
+def insert_returning(db: Session, model: type[_Model], **values) -> _Model:
+    """INSERT one row and load it from RETURNING, so server defaults need no refresh."""
+    return db.scalars(insert(model).values(**values).returning(model)).one()
+
+
+async def insert_returning_async(db: AsyncSession, model: type[_Model], **values) -> _Model:
+    return (await db.scalars(insert(model).values(**values).returning(model))).one()
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,10 +1,19 @@
+import gzip
+import hashlib
 import json
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Mapping, Optional
 
+from sqlalchemy import JSON, text
 from sqlalchemy.orm import Session
 
-from event_images import resolve_event_image_path
+from catalog_bus import invalidate_local_caches, register_local_cache
+from config import settings
+from event_images import refresh_event_images, resolve_event_image_path
 
 _config_path = Path(__file__).parent / "event-config.json"
 with open(_config_path) as f:
@@ -19,9 +28,6 @@ class EventNotFoundError(RuntimeError):
     pass
 
 
-if TYPE_CHECKING:
-    from models import Item
-
 def get_currency() -> str:
     currency = _file_config.get("currency")
     if not currency:
@@ -41,6 +47,92 @@ def get_config_from_db(db: Session) -> dict:
     return _build_config_from_event(db, event)
 
 
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    version: int
+    loaded_at: float
+    config: Optional[dict]
+    etag: Optional[str] = None
+    # Pre-rendered response bodies, set when CONFIG_PREENCODE / CONFIG_GZIP are on.
+    body: Optional[bytes] = None
+    gzip_body: Optional[bytes] = None
+
+
+_config_cache_lock = threading.Lock()
+_config_cache_version = 0
+_config_cache: Optional[ConfigSnapshot] = None
+
+
+def invalidate_config_cache() -> int:
+    """Drop the cached public config. Call after committing any write that can change it."""
+    global _config_cache, _config_cache_version
+    with _config_cache_lock:
+        _config_cache_version += 1
+        _config_cache = None
+        return _config_cache_version
+
+
+register_local_cache(invalidate_config_cache)
+
+
+def get_config_snapshot(db: Session) -> ConfigSnapshot:
+    """Return the active event config snapshot, reloading it only when stale or invalidated.
+
+    A snapshot with ``config=None`` records that there is no active event, so idle
+    periods do not hit the database either. Cached configs are shared between
+    requests and must be treated as read-only.
+    """
+    global _config_cache
+    ttl = settings.config_cache_ttl_seconds
+    # Snapshots embed resolved image paths; a registry reload invalidates them.
+    refresh_event_images()
+    with _config_cache_lock:
+        cached = _config_cache
+        version = _config_cache_version
+    if cached is not None and time.monotonic() - cached.loaded_at < ttl:
+        return cached
+
+    row = db.execute(_ACTIVE_CONFIG_SQL).first()
+    config = _config_from_json_row(row) if row is not None else None
+    body = encode_config(config) if config is not None and settings.config_preencode else None
+    snapshot = ConfigSnapshot(
+        version=version,
+        loaded_at=time.monotonic(),
+        config=config,
+        etag=_config_etag(row, config) if row is not None else None,
+        body=body,
+        gzip_body=gzip.compress(body, mtime=0) if body is not None and settings.config_gzip else None,
+    )
+    with _config_cache_lock:
+        # Only publish if no admin write invalidated the cache while we were loading.
+        if ttl > 0 and version == _config_cache_version:
+            _config_cache = snapshot
+    return snapshot
+
+
+def encode_config(config: dict) -> bytes:
+    """Render the config exactly as FastAPI's JSONResponse would."""
+    return json.dumps(
+        config,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _config_etag(event, config: dict) -> str:
+    """Strong ETag from the event id and updated_at plus a digest of the served catalog.
+
+    Items and locations carry no timestamps of their own, so their version is a
+    hash of the rendered payload; it changes whenever any served field does.
+    """
+    updated_at = int(event.updated_at.timestamp() * 1_000_000) if event.updated_at else 0
+    payload = json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+    catalog_version = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+    return f'"{event.id}-{updated_at:x}-{catalog_version}"'
+
+
 def get_config_for_event_id_from_db(db: Session, event_id: int) -> dict:
     """Load event config with items and locations for a specific event id."""
     from models import Event
@@ -71,22 +163,9 @@ def _build_config_from_event(db: Session, event) -> dict:
         .all()
     ) if location_ids else []
 
-    return {
-        "event": {"date": event.event_date},
-        "currency": get_currency(),
-        "hero_header": event.hero_header,
-        "hero_header_sage": event.hero_header_sage,
-        "hero_subheader": event.hero_subheader,
-        "promo_details": event.promo_details,
-        "tooltip_enabled": event.tooltip_enabled,
-        "tooltip_header": event.tooltip_header,
-        "tooltip_body": event.tooltip_body,
-        "tooltip_image_path": resolve_event_image_path(event.tooltip_image_key),
-        "hero_side_image_path": resolve_event_image_path(event.hero_side_image_key),
-        "etransfer_enabled": event.etransfer_enabled,
-        "etransfer_email": event.etransfer_email,
-        "is_active": bool(event.is_active),
-        "items": [
+    return _config_payload(
+        event,
+        items=[
             {
                 "id": item.id,
                 "name": item.name,
@@ -97,7 +176,7 @@ def _build_config_from_event(db: Session, event) -> dict:
             }
             for item in items
         ],
-        "locations": [
+        locations=[
             {
                 "id": loc.id,
                 "name": loc.name,
@@ -106,67 +185,338 @@ def _build_config_from_event(db: Session, event) -> dict:
             }
             for loc in locations
         ],
-    }
-
-
-def get_item_from_db(db: Session, item_id: str) -> Optional["Item"]:
-    """Look up an item only if it belongs to the active event."""
-    from models import Event, Item
-    event = db.query(Event).filter(Event.is_active == True).first()
-    if event is None or item_id not in (event.item_ids or []):
-        return None
-    return db.query(Item).filter(Item.id == item_id).first()
-
-
-def get_event_date_from_db(db: Session) -> str:
-    """Lightweight helper that only reads event_date from the active event."""
-    from models import Event
-    event = db.query(Event).filter(Event.is_active == True).first()
-    if event is None:
-        raise NoActiveEventError("No active event found in database")
-    return event.event_date
-
-
-def get_active_event_id_from_db(db: Session) -> int:
-    """Return the current active event id."""
-    from models import Event
-
-    event = db.query(Event).filter(Event.is_active == True).first()
-    if event is None:
-        raise NoActiveEventError("No active event found in database")
-    return int(event.id)
-
+    )
 
-def get_event_date_for_event_id_from_db(db: Session, event_id: int) -> str:
-    """Read event_date for a specific event id."""
-    from models import Event
 
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if event is None:
-        raise EventNotFoundError(f"Event not found: {event_id}")
-    return event.event_date
-
-
-def get_etransfer_config_from_db(db: Session) -> dict:
-    """Read optional e-transfer settings from the active event."""
-    from models import Event
-    event = db.query(Event).filter(Event.is_active == True).first()
-    if event is None:
-        raise NoActiveEventError("No active event found in database")
+def _config_payload(event, *, items: list[dict], locations: list[dict]) -> dict:
     return {
-        "enabled": bool(event.etransfer_enabled),
-        "email": event.etransfer_email,
+        "event": {"date": event.event_date},
+        "currency": get_currency(),
+        "hero_header": event.hero_header,
+        "hero_header_sage": event.hero_header_sage,
+        "hero_subheader": event.hero_subheader,
+        "promo_details": event.promo_details,
+        "tooltip_enabled": event.tooltip_enabled,
+        "tooltip_header": event.tooltip_header,
+        "tooltip_body": event.tooltip_body,
+        "tooltip_image_path": resolve_event_image_path(event.tooltip_image_key),
+        "hero_side_image_path": resolve_event_image_path(event.hero_side_image_key),
+        "etransfer_enabled": event.etransfer_enabled,
+        "etransfer_email": event.etransfer_email,
+        "is_active": bool(event.is_active),
+        "items": items,
+        "locations": locations,
     }
 
 
-def get_etransfer_config_for_event_id_from_db(db: Session, event_id: int) -> dict:
-    """Read optional e-transfer settings for a specific event id."""
-    from models import Event
-
-    event = db.query(Event).filter(Event.id == event_id).first()
-    if event is None:
-        raise EventNotFoundError(f"Event not found: {event_id}")
-    return {
-        "enabled": bool(event.etransfer_enabled),
-        "email": event.etransfer_email,
+# Active event plus its item and location catalog in one round trip. Catalog rows
+# are aggregated in sort_order; prices come back as JSON numbers.
+_ACTIVE_CONFIG_SQL = text(
+    """
+    SELECT
+        e.id,
+        e.updated_at,
+        e.event_date,
+        e.hero_header,
+        e.hero_header_sage,
+        e.hero_subheader,
+        e.promo_details,
+        e.tooltip_enabled,
+        e.tooltip_header,
+        e.tooltip_body,
+        e.tooltip_image_key,
+        e.hero_side_image_key,
+        e.etransfer_enabled,
+        e.etransfer_email,
+        e.is_active,
+        COALESCE(
+            (
+                SELECT json_agg(
+                    json_build_object(
+                        'id', i.id,
+                        'name', i.name,
+                        'description', i.description,
+                        'price', i.price::float8,
+                        'discounted_price', i.discounted_price::float8,
+                        'minimum_order_quantity', GREATEST(1, COALESCE(i.minimum_order_quantity, 1))
+                    )
+                    ORDER BY i.sort_order
+                )
+                FROM items i
+                WHERE i.id IN (SELECT jsonb_array_elements_text(e.item_ids))
+            ),
+            '[]'::json
+        ) AS items,
+        COALESCE(
+            (
+                SELECT json_agg(
+                    json_build_object(
+                        'id', l.id,
+                        'name', l.name,
+                        'address', l.address,
+                        'timeSlots', l.time_slots
+                    )
+                    ORDER BY l.sort_order
+                )
+                FROM locations l
+                WHERE l.id IN (SELECT jsonb_array_elements_text(e.location_ids))
+            ),
+            '[]'::json
+        ) AS locations
+    FROM events e
+    WHERE e.is_active = TRUE
+    LIMIT 1
+    """
+).columns(items=JSON, locations=JSON)
+
+
+def _config_from_json_row(row) -> dict:
+    items = [
+        {
+            **item,
+            # float8 values such as 20 decode as ints; keep the ORM loader's float output.
+            "price": float(item["price"]),
+            "discounted_price": float(item["discounted_price"]) if item["discounted_price"] is not None else None,
+        }
+        for item in row.items
+    ]
+    return _config_payload(row, items=items, locations=row.locations)
+
+
+def get_config_json_from_db(db: Session) -> dict:
+    """Single-statement variant of get_config_from_db built with Postgres JSON aggregation."""
+    row = db.execute(_ACTIVE_CONFIG_SQL).first()
+    if row is None:
+        raise NoActiveEventError("No active event found in database")
+    return _config_from_json_row(row)
+
+
+@dataclass(frozen=True)
+class CatalogItem:
+    id: str
+    name: str
+    price: float
+    discounted_price: Optional[float]
+    minimum_order_quantity: int
+
+
+@dataclass(frozen=True)
+class CatalogLocation:
+    id: str
+    name: str
+    address: str
+    time_slots: frozenset[str]
+
+
+@dataclass(frozen=True)
+class CatalogIndex:
+    """Immutable lookup tables for the items and locations one event offers.
+
+    Indexes are cached per event and shared between requests, so validating an
+    order against the catalog costs only the catalog version check once warm.
+    """
+
+    event_id: int
+    event_date: str
+    etransfer_enabled: bool
+    etransfer_email: Optional[str]
+    items_by_id: Mapping[str, CatalogItem]
+    # Keyed by location id and by name, as orders may store either.
+    locations_by_key: Mapping[str, CatalogLocation]
+    loaded_at: float
+
+    def get_item(self, item_id: str) -> Optional[CatalogItem]:
+        return self.items_by_id.get(item_id)
+
+    def find_location(self, key: str) -> Optional[CatalogLocation]:
+        return self.locations_by_key.get(key)
+
+    def has_time_slot(self, location_key: str, time_slot: str) -> bool:
+        location = self.find_location(location_key)
+        return location is not None and time_slot in location.time_slots
+
+
+# Event fields plus its catalog rows, as plain JSON, in one round trip.
+_CATALOG_INDEX_SQL = """
+    SELECT
+        e.id,
+        e.event_date,
+        e.etransfer_enabled,
+        e.etransfer_email,
+        COALESCE(
+            (
+                SELECT json_agg(
+                    json_build_object(
+                        'id', i.id,
+                        'name', i.name,
+                        'price', i.price::float8,
+                        'discounted_price', i.discounted_price::float8,
+                        'minimum_order_quantity', GREATEST(1, COALESCE(i.minimum_order_quantity, 1))
+                    )
+                )
+                FROM items i
+                WHERE i.id IN (SELECT jsonb_array_elements_text(e.item_ids))
+            ),
+            '[]'::json
+        ) AS items,
+        COALESCE(
+            (
+                SELECT json_agg(
+                    json_build_object(
+                        'id', l.id,
+                        'name', l.name,
+                        'address', l.address,
+                        'time_slots', l.time_slots
+                    )
+                )
+                FROM locations l
+                WHERE l.id IN (SELECT jsonb_array_elements_text(e.location_ids))
+            ),
+            '[]'::json
+        ) AS locations
+    FROM events e
+    WHERE {where}
+    LIMIT 1
+"""
+_ACTIVE_CATALOG_INDEX_SQL = text(_CATALOG_INDEX_SQL.format(where="e.is_active = TRUE")).columns(
+    items=JSON, locations=JSON
+)
+_EVENT_CATALOG_INDEX_SQL = text(_CATALOG_INDEX_SQL.format(where="e.id = :event_id")).columns(
+    items=JSON, locations=JSON
+)
+
+_CATALOG_VERSION_SQL = text("SELECT version FROM catalog_version WHERE id = 1")
+
+_catalog_index_lock = threading.Lock()
+_catalog_index_version = 0
+_catalog_indexes: dict[int, CatalogIndex] = {}
+# Highest catalog_version row value this worker has seen; see _check_catalog_version.
+_seen_catalog_version: Optional[int] = None
+# (active event id or None, loaded_at); None means not looked up yet.
+_active_catalog_event: Optional[tuple[Optional[int], float]] = None
+
+
+def invalidate_catalog_index_cache() -> int:
+    """Drop every cached catalog index and the remembered active event id."""
+    global _catalog_index_version, _active_catalog_event
+    with _catalog_index_lock:
+        _catalog_index_version += 1
+        _catalog_indexes.clear()
+        _active_catalog_event = None
+        return _catalog_index_version
+
+
+register_local_cache(invalidate_catalog_index_cache)
+
+
+def _catalog_index_from_row(row) -> CatalogIndex:
+    items = {
+        item["id"]: CatalogItem(
+            id=item["id"],
+            name=item["name"],
+            price=float(item["price"]),
+            discounted_price=float(item["discounted_price"]) if item["discounted_price"] is not None else None,
+            minimum_order_quantity=int(item["minimum_order_quantity"]),
+        )
+        for item in row.items
     }
+    locations = [
+        CatalogLocation(
+            id=loc["id"],
+            name=loc["name"],
+            address=loc["address"] or "",
+            time_slots=frozenset(loc["time_slots"] or []),
+        )
+        for loc in row.locations
+    ]
+    # Ids win over names when a location's name equals another's id.
+    locations_by_key = {loc.name: loc for loc in locations}
+    locations_by_key.update((loc.id, loc) for loc in locations)
+    return CatalogIndex(
+        event_id=int(row.id),
+        event_date=row.event_date,
+        etransfer_enabled=bool(row.etransfer_enabled),
+        etransfer_email=row.etransfer_email,
+        items_by_id=MappingProxyType(items),
+        locations_by_key=MappingProxyType(locations_by_key),
+        loaded_at=time.monotonic(),
+    )
+
+
+def _fresh(loaded_at: float, ttl: float) -> bool:
+    return time.monotonic() - loaded_at < ttl
+
+
+def _publish_catalog_index(index: CatalogIndex, version: int, *, active: bool) -> None:
+    global _active_catalog_event
+    with _catalog_index_lock:
+        # Only publish if no admin write invalidated the cache while we were loading.
+        if settings.config_cache_ttl_seconds > 0 and version == _catalog_index_version:
+            _catalog_indexes[index.event_id] = index
+            if active:
+                _active_catalog_event = (index.event_id, index.loaded_at)
+
+
+def _check_catalog_version(db: Session) -> None:
+    """Drop local caches if another worker changed the catalog since we last looked.
+
+    Costs one primary-key read. The version row is bumped in the admin write's own
+    transaction, so once a change is visible here its data is too.
+    """
+    global _seen_catalog_version
+    if settings.config_cache_ttl_seconds <= 0:
+        return
+    current = int(db.execute(_CATALOG_VERSION_SQL).scalar() or 0)
+    with _catalog_index_lock:
+        seen = _seen_catalog_version
+        if seen is None or current > seen:
+            _seen_catalog_version = current
+    if seen is not None and current > seen:
+        invalidate_local_caches()
+
+
+def get_catalog_index_for_event_id(db: Session, event_id: int) -> Optional[CatalogIndex]:
+    """Return the catalog index for ``event_id``, or None when the event does not exist."""
+    _check_catalog_version(db)
+    ttl = settings.config_cache_ttl_seconds
+    with _catalog_index_lock:
+        cached = _catalog_indexes.get(event_id)
+        version = _catalog_index_version
+    if cached is not None and _fresh(cached.loaded_at, ttl):
+        return cached
+
+    row = db.execute(_EVENT_CATALOG_INDEX_SQL, {"event_id": event_id}).first()
+    if row is None:
+        return None
+    index = _catalog_index_from_row(row)
+    _publish_catalog_index(index, version, active=False)
+    return index
+
+
+def get_active_catalog_index(db: Session) -> CatalogIndex:
+    """Return the active event's catalog index, loading it only when stale or invalidated.
+
+    Having no active event is cached too. Raises ``NoActiveEventError`` in that case.
+    """
+    global _active_catalog_event
+    _check_catalog_version(db)
+    ttl = settings.config_cache_ttl_seconds
+    with _catalog_index_lock:
+        active = _active_catalog_event
+        version = _catalog_index_version
+        cached = _catalog_indexes.get(active[0]) if active is not None and active[0] is not None else None
+    if active is not None and _fresh(active[1], ttl):
+        if active[0] is None:
+            raise NoActiveEventError("No active event found in database")
+        if cached is not None and _fresh(cached.loaded_at, ttl):
+            return cached
+
+    row = db.execute(_ACTIVE_CATALOG_INDEX_SQL).first()
+    if row is None:
+        with _catalog_index_lock:
+            if ttl > 0 and version == _catalog_index_version:
+                _active_catalog_event = (None, time.monotonic())
+        raise NoActiveEventError("No active event found in database")
+    index = _catalog_index_from_row(row)
+    _publish_catalog_index(index, version, active=True)
+    return index
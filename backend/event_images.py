@@ -1,46 +1,139 @@
 import json
-from functools import lru_cache
+import threading
+import time
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Literal, NamedTuple, Optional
+
+from catalog_bus import invalidate_local_caches
 
 _IMAGE_REGISTRY_PATH = Path(__file__).parent / "event-images.json"
+# How often lookups may stat event-images.json for changes.
+_RELOAD_CHECK_SECONDS = 2.0
+
+
+class _RegistryState(NamedTuple):
+    helper: dict
+    images: list[dict]
+    by_key: dict[str, dict]
+    by_type: dict[str, dict[str, dict]]
+    paths: dict[str, str]
+
+
+class EventImageRegistry:
+    """Indexed view of event-images.json that reloads when the file's mtime changes.
+
+    Lookups by key and by type are dict hits, and resolved paths are precomputed,
+    so catalog size does not matter. A reload drops the catalog caches that embed
+    resolved image paths.
+    """
+
+    def __init__(self, path: Path, check_seconds: float = _RELOAD_CHECK_SECONDS):
+        self._path = path
+        self._check_seconds = check_seconds
+        self._lock = threading.Lock()
+        self._mtime_ns: Optional[int] = None
+        self._checked_at = 0.0
+        self._state = _RegistryState({}, [], {}, {}, {})
+
+    def refresh(self) -> None:
+        """Reload the file if it changed; at most one stat per check interval."""
+        now = time.monotonic()
+        if self._mtime_ns is not None and now - self._checked_at < self._check_seconds:
+            return
+        with self._lock:
+            if self._mtime_ns is not None and now - self._checked_at < self._check_seconds:
+                return
+            self._checked_at = now
+            first_load = self._mtime_ns is None
+            try:
+                mtime_ns = self._path.stat().st_mtime_ns
+            except OSError as exc:
+                if first_load:
+                    raise
+                # Briefly missing, e.g. mid rename-on-save; check again next interval.
+                print(f"[images] Cannot stat {self._path.name}, keeping previous: {exc}")
+                return
+            if mtime_ns == self._mtime_ns:
+                return
+            try:
+                self._load()
+            except (OSError, ValueError, RuntimeError) as exc:
+                if first_load:
+                    raise
+                # Keep serving the last good registry (e.g. a half-written file)
+                # and retry once the file changes again.
+                self._mtime_ns = mtime_ns
+                print(f"[images] Failed to reload {self._path.name}, keeping previous: {exc}")
+                return
+            self._mtime_ns = mtime_ns
+        if not first_load:
+            invalidate_local_caches()
+
+    def _load(self) -> None:
+        with open(self._path) as f:
+            data: dict = json.load(f)
+        helper = data.get("helper")
+        images = data.get("images")
+        if not isinstance(helper, dict) or not isinstance(images, list):
+            raise RuntimeError("event-images.json is invalid")
+        normalized_images: list[dict] = [img for img in images if isinstance(img, dict)]
+
+        by_key: dict[str, dict] = {}
+        by_type: dict[str, dict[str, dict]] = {}
+        paths: dict[str, str] = {}
+        for image in normalized_images:
+            key = image.get("key")
+            if not isinstance(key, str) or key in by_key:
+                continue
+            by_key[key] = image
+            by_type.setdefault(image.get("type"), {})[key] = image
+            path = image.get("path")
+            if isinstance(path, str) and path:
+                paths[key] = path
 
+        # Swap the whole index at once so readers never mix old and new entries.
+        self._state = _RegistryState(helper, normalized_images, by_key, by_type, paths)
 
-@lru_cache(maxsize=1)
-def _load_registry() -> dict:
-    with open(_IMAGE_REGISTRY_PATH) as f:
-        data: dict = json.load(f)
-    helper = data.get("helper")
-    images = data.get("images")
-    if not isinstance(helper, dict) or not isinstance(images, list):
-        raise RuntimeError("event-images.json is invalid")
-    normalized_images: list[dict] = [img for img in images if isinstance(img, dict)]
-    return {"helper": helper, "images": normalized_images}
+    def catalog(self) -> dict:
+        self.refresh()
+        state = self._state
+        return {
+            "helper": dict(state.helper),
+            "images": [dict(img) for img in state.images],
+        }
+
+    def get(self, key: str) -> Optional[dict]:
+        self.refresh()
+        return self._state.by_key.get(key)
+
+    def get_of_type(self, key: str, image_type: str) -> Optional[dict]:
+        self.refresh()
+        return self._state.by_type.get(image_type, {}).get(key)
+
+    def resolve_path(self, key: str) -> Optional[str]:
+        self.refresh()
+        return self._state.paths.get(key)
+
+
+_registry = EventImageRegistry(_IMAGE_REGISTRY_PATH)
+
+
+def refresh_event_images() -> None:
+    _registry.refresh()
 
 
 def get_event_image_catalog() -> dict:
-    registry = _load_registry()
-    return {
-        "helper": dict(registry["helper"]),
-        "images": [dict(img) for img in registry["images"]],
-    }
+    return _registry.catalog()
 
 
 def get_event_image_by_key(key: str) -> Optional[dict]:
-    for image in _load_registry()["images"]:
-        if image.get("key") == key:
-            return image
-    return None
+    return _registry.get(key)
 
 
 def resolve_event_image_path(key: Optional[str]) -> Optional[str]:
     if not key:
         return None
-    image = get_event_image_by_key(key)
-    if image is None:
-        return None
-    path = image.get("path")
-    return path if isinstance(path, str) and path else None
+    return _registry.resolve_path(key)
 
 
 def validate_event_image_key(key: Optional[str], image_type: Literal["tooltip", "hero_side"]) -> Optional[str]:
@@ -49,10 +142,10 @@ def validate_event_image_key(key: Optional[str], image_type: Literal["tooltip",
     normalized = key.strip()
     if not normalized:
         return None
-    image = get_event_image_by_key(normalized)
+    if _registry.get_of_type(normalized, image_type) is not None:
+        return normalized
+    image = _registry.get(normalized)
     if image is None:
         raise ValueError(f"Unknown image key: {normalized}")
     image_kind = image.get("type")
-    if image_kind != image_type:
-        raise ValueError(f"Image key '{normalized}' is type '{image_kind}', expected '{image_type}'")
-    return normalized
+    raise ValueError(f"Image key '{normalized}' is type '{image_kind}', expected '{image_type}'")
@@ -0,0 +1,153 @@
+"""Idempotency-Key support for public POST endpoints.
+
+A request carrying a key first claims it with an upsert inside the same
+transaction as the write it protects, then stores its response before commit.
+A concurrent retry blocks on the uncommitted key row and afterwards replays
+the stored response; if the first attempt rolls back, the retry claims the key
+itself. Keys expire after ``settings.idempotency_key_ttl_seconds`` and each
+claim also purges a few expired rows.
+
+Claims and stores take several keys at once so a batched writer can handle a
+whole batch in one statement each.
+"""
+
+import hashlib
+import json
+from typing import Optional, Union
+
+from sqlalchemy import String, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session
+
+from config import settings
+
+MAX_KEY_LENGTH = 255
+_PURGE_BATCH = 20
+
+# Keys are claimed in sorted order so concurrent batches lock rows consistently.
+_CLAIM_SQL = text(
+    """
+    WITH purged AS (
+        DELETE FROM idempotency_keys
+        WHERE key IN (
+            SELECT key FROM idempotency_keys
+            WHERE expires_at < now() AND key <> ALL(CAST(:keys AS TEXT[]))
+            ORDER BY expires_at
+            LIMIT :purge_batch
+            FOR UPDATE SKIP LOCKED
+        )
+    )
+    INSERT INTO idempotency_keys (key, request_hash, created_at, expires_at)
+    SELECT claim.key, claim.request_hash, now(), now() + make_interval(secs => :ttl)
+    FROM unnest(CAST(:keys AS TEXT[]), CAST(:hashes AS TEXT[])) AS claim(key, request_hash)
+    ORDER BY claim.key
+    ON CONFLICT (key) DO UPDATE
+        SET request_hash = EXCLUDED.request_hash,
+            response = NULL,
+            created_at = EXCLUDED.created_at,
+            expires_at = EXCLUDED.expires_at
+        WHERE idempotency_keys.expires_at < now()
+    RETURNING key
+    """
+)
+
+_LOOKUP_SQL = text(
+    "SELECT key, request_hash, response FROM idempotency_keys "
+    "WHERE key = ANY(CAST(:keys AS TEXT[]))"
+).columns(key=String, request_hash=String, response=JSONB)
+
+_STORE_SQL = text(
+    """
+    UPDATE idempotency_keys AS k
+    SET response = CAST(stored.response AS JSONB)
+    FROM unnest(CAST(:keys AS TEXT[]), CAST(:responses AS TEXT[])) AS stored(key, response)
+    WHERE k.key = stored.key
+    """
+)
+
+_RELEASE_SQL = text("DELETE FROM idempotency_keys WHERE key = ANY(CAST(:keys AS TEXT[]))")
+
+
+class IdempotencyKeyMismatchError(RuntimeError):
+    """The key was already used for a request with a different body."""
+
+
+class IdempotencyKeyInProgressError(RuntimeError):
+    """The key is claimed but no response has been stored for it."""
+
+
+def request_fingerprint(payload: dict) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def claim_idempotency_keys(
+    db: Session, request_hashes: dict[str, str]
+) -> dict[str, Union[None, dict, RuntimeError]]:
+    """Claim every key in ``request_hashes`` (key -> request hash) in one statement.
+
+    Maps each key to None when the caller now owns it and should perform the write,
+    to the stored response when the key was already used for the same request, or
+    to an ``IdempotencyKeyMismatchError``/``IdempotencyKeyInProgressError``.
+    """
+    keys = sorted(request_hashes)
+    claimed = {
+        row.key
+        for row in db.execute(
+            _CLAIM_SQL,
+            {
+                "keys": keys,
+                "hashes": [request_hashes[key] for key in keys],
+                "ttl": float(settings.idempotency_key_ttl_seconds),
+                "purge_batch": _PURGE_BATCH,
+            },
+        )
+    }
+    outcomes: dict[str, Union[None, dict, RuntimeError]] = dict.fromkeys(claimed)
+
+    unclaimed = [key for key in keys if key not in claimed]
+    if unclaimed:
+        existing = {row.key: row for row in db.execute(_LOOKUP_SQL, {"keys": unclaimed})}
+        for key in unclaimed:
+            row = existing.get(key)
+            if row is not None and row.request_hash != request_hashes[key]:
+                outcomes[key] = IdempotencyKeyMismatchError(key)
+            elif row is None or row.response is None:
+                # Missing means another request purged it between the two statements.
+                outcomes[key] = IdempotencyKeyInProgressError(key)
+            else:
+                outcomes[key] = row.response
+    return outcomes
+
+
+def claim_idempotency_key(db: Session, key: str, request_hash: str) -> Optional[dict]:
+    """Claim ``key`` in the session's transaction.
+
+    Returns None when the caller now owns the key and should perform the write,
+    then call ``store_idempotency_response`` before committing. Returns the stored
+    response when the key was already used for the same request.
+    """
+    outcome = claim_idempotency_keys(db, {key: request_hash})[key]
+    if isinstance(outcome, RuntimeError):
+        raise outcome
+    return outcome
+
+
+def store_idempotency_responses(db: Session, responses: dict[str, dict]) -> None:
+    if not responses:
+        return
+    keys = list(responses)
+    db.execute(
+        _STORE_SQL,
+        {"keys": keys, "responses": [json.dumps(responses[key]) for key in keys]},
+    )
+
+
+def store_idempotency_response(db: Session, key: str, response: dict) -> None:
+    store_idempotency_responses(db, {key: response})
+
+
+def release_idempotency_keys(db: Session, keys: list[str]) -> None:
+    """Drop keys claimed in this transaction whose write will not happen after all."""
+    if keys:
+        db.execute(_RELEASE_SQL, {"keys": keys})
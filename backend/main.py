@@ -1,13 +1,32 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from admission import AdmissionControlMiddleware
+from catalog_bus import start_catalog_listener, stop_catalog_listener
 from config import settings
+from request_timing import RequestTimingMiddleware
 from routers import admin, config, feedback, orders, catering
+from services.order_queue import start_order_queue, stop_order_queue
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    start_catalog_listener()
+    start_order_queue()
+    yield
+    stop_order_queue()
+    stop_catalog_listener()
+
 
-app = FastAPI(title="Loku Caters API", version="2.0.0")
+app = FastAPI(title="Loku Caters API", version="2.0.0", lifespan=lifespan)
 
 _local_origins = [f"http://localhost:{p}" for p in range(3000, 3010)]
 
+# Added before CORS so that 429 and timed responses still carry CORS headers.
+app.add_middleware(AdmissionControlMiddleware)
+app.add_middleware(RequestTimingMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=list({settings.frontend_url} | set(_local_origins)),
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Optional
 
-from sqlalchemy import String, Integer, Numeric, DateTime, Text, Boolean, func
+from sqlalchemy import String, Integer, Numeric, Date, DateTime, Text, Boolean, func
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import JSONB
 
@@ -40,6 +40,7 @@ class Event(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(Text, nullable=False)
     event_date: Mapped[str] = mapped_column(Text, nullable=False)
+    event_on: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     hero_header: Mapped[str] = mapped_column(Text, nullable=False, default="")
     hero_header_sage: Mapped[str] = mapped_column(Text, nullable=False, default="")
     hero_subheader: Mapped[str] = mapped_column(Text, nullable=False, default="")
@@ -83,6 +84,18 @@ class Order(Base):
     )
 
 
+class OrderLine(Base):
+    __tablename__ = "order_lines"
+
+    order_id: Mapped[str] = mapped_column(String, primary_key=True)
+    line_number: Mapped[int] = mapped_column(Integer, primary_key=True)
+    item_id: Mapped[str] = mapped_column(String, nullable=False)
+    item_name: Mapped[str] = mapped_column(String, nullable=False)
+    quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    unit_price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+    total_price: Mapped[float] = mapped_column(Numeric(10, 2), nullable=False)
+
+
 class Feedback(Base):
     __tablename__ = "feedback"
 
@@ -130,3 +143,25 @@ class CateringRequestComment(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+
+
+class SlotCapacity(Base):
+    __tablename__ = "slot_capacities"
+
+    event_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    location_id: Mapped[str] = mapped_column(Text, primary_key=True)
+    time_slot: Mapped[str] = mapped_column(Text, primary_key=True)
+    capacity: Mapped[int] = mapped_column(Integer, nullable=False)
+    reserved: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    request_hash: Mapped[str] = mapped_column(String, nullable=False)
+    response: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,147 @@
+"""Line items of multi-item orders.
+
+An order keeps its single-item columns (``item_id``, ``item_name``,
+``quantity``, ``total_price``) as a summary of its lines: the first line's item,
+every line's name, the total quantity and the total price. Capacity and the
+admin lists keep working off those columns; ``order_lines`` holds the detail.
+Orders written before lines existed have no rows there and read as one line
+built from the summary columns.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import Float, Row, Select, cast, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from models import Order, OrderLine
+
+_LINE_COLUMNS = list(OrderLine.__table__.columns)
+# Every line of every order in a request or batch goes in with one statement.
+_INSERT_LINES_SQL = text(
+    "INSERT INTO order_lines ({columns}) SELECT * FROM unnest({arrays})".format(
+        columns=", ".join(column.name for column in _LINE_COLUMNS),
+        arrays=", ".join(
+            f"CAST(:{column.key} AS {column.type.compile(dialect=postgresql.dialect())}[])"
+            for column in _LINE_COLUMNS
+        ),
+    )
+)
+
+
+def build_order_line(order_id: str, line_number: int, item, quantity: int, unit_price: float) -> dict:
+    return {
+        "order_id": order_id,
+        "line_number": line_number,
+        "item_id": item.id,
+        "item_name": item.name,
+        "quantity": quantity,
+        "unit_price": round(unit_price, 2),
+        "total_price": round(unit_price * quantity, 2),
+    }
+
+
+def order_summary(lines: list[dict]) -> dict:
+    """The single-item order columns that summarize ``lines``."""
+    return {
+        "item_id": lines[0]["item_id"],
+        "item_name": ", ".join(line["item_name"] for line in lines),
+        "quantity": sum(line["quantity"] for line in lines),
+        "total_price": round(sum(line["total_price"] for line in lines), 2),
+    }
+
+
+def insert_order_lines(db: Session, lines: list[dict]) -> None:
+    if not lines:
+        return
+    db.execute(
+        _INSERT_LINES_SQL,
+        {column.key: [line[column.key] for line in lines] for column in _LINE_COLUMNS},
+    )
+
+
+def replace_order_lines(db: Session, order_id: str, lines: list[dict]) -> None:
+    delete_order_lines(db, [order_id])
+    insert_order_lines(db, lines)
+
+
+def delete_order_lines(db: Session, order_ids: list[str]) -> None:
+    if order_ids:
+        db.query(OrderLine).filter(OrderLine.order_id.in_(order_ids)).delete(synchronize_session=False)
+
+
+def load_order_lines(db: Session, order_ids: Iterable[str]) -> dict[str, list[OrderLine]]:
+    """Lines of several orders in one query, keyed by order id and in line order."""
+    order_ids = list(order_ids)
+    if not order_ids:
+        return {}
+    rows = (
+        db.query(OrderLine)
+        .filter(OrderLine.order_id.in_(order_ids))
+        .order_by(OrderLine.order_id, OrderLine.line_number)
+        .all()
+    )
+    lines_by_order: dict[str, list[OrderLine]] = {}
+    for line in rows:
+        lines_by_order.setdefault(line.order_id, []).append(line)
+    return lines_by_order
+
+
+# Prices come back as floats, not Decimals, for list responses.
+_LINE_ROW_COLUMNS = (
+    OrderLine.order_id,
+    OrderLine.item_id,
+    OrderLine.item_name,
+    OrderLine.quantity,
+    cast(OrderLine.unit_price, Float).label("unit_price"),
+    cast(OrderLine.total_price, Float).label("total_price"),
+)
+
+
+def order_line_rows_query(*order_filters) -> Select:
+    """Select the lines of every order matching ``order_filters``, grouped by order.
+
+    Selecting by the orders' filters rather than their ids keeps the statement the
+    same size however many orders match.
+    """
+    query = select(*_LINE_ROW_COLUMNS)
+    if order_filters:
+        query = query.join(Order, Order.id == OrderLine.order_id).where(*order_filters)
+    return query.order_by(OrderLine.order_id, OrderLine.line_number)
+
+
+def load_order_line_rows(db: Session, *order_filters) -> dict[str, list[Row]]:
+    """Lines of every order matching ``order_filters`` as plain rows, in one query."""
+    lines_by_order: dict[str, list[Row]] = {}
+    for line in db.execute(order_line_rows_query(*order_filters)):
+        lines_by_order.setdefault(line.order_id, []).append(line)
+    return lines_by_order
+
+
+def order_line_dicts(order: Order, lines: list[OrderLine]) -> list[dict]:
+    """Serialize an order's lines, falling back to its summary columns when it has none.
+
+    Works the same on ORM objects and on rows with the same column names.
+    """
+    if not lines:
+        quantity = order.quantity
+        total_price = float(order.total_price)
+        return [
+            {
+                "item_id": order.item_id,
+                "item_name": order.item_name,
+                "quantity": quantity,
+                "price_per_item": total_price / quantity if quantity else 0.0,
+                "total_price": total_price,
+            }
+        ]
+    return [
+        {
+            "item_id": line.item_id,
+            "item_name": line.item_name,
+            "quantity": line.quantity,
+            "price_per_item": float(line.unit_price),
+            "total_price": float(line.total_price),
+        }
+        for line in lines
+    ]
@@ -0,0 +1,99 @@
+"""Connection pool instrumentation.
+
+The engines in ``database`` use these pool classes, which time every checkout:
+how long callers waited for a connection (including opening a new one) and how
+many gave up after ``db_pool_timeout``. Together with the pool's own counts of checked-out, idle
+and overflow connections this is what the admin pool endpoint reports, so the
+pool can be sized from observed load instead of guessed.
+"""
+
+import collections
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Recent waits kept for the percentiles.
+_RECENT_WAITS = 2000
+
+
+class PoolWaitStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._since = time.time()
+            self._checkouts = 0
+            self._timeouts = 0
+            self._total_wait = 0.0
+            self._max_wait = 0.0
+            self._recent: collections.deque[float] = collections.deque(maxlen=_RECENT_WAITS)
+
+    def record(self, wait_seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            self._checkouts += 1
+            self._timeouts += timed_out
+            self._total_wait += wait_seconds
+            self._max_wait = max(self._max_wait, wait_seconds)
+            self._recent.append(wait_seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent)
+            checkouts = self._checkouts
+            snapshot = {
+                "since": self._since,
+                "checkouts": checkouts,
+                "timeouts": self._timeouts,
+                "wait_ms_avg": self._total_wait / checkouts * 1000 if checkouts else 0.0,
+                "wait_ms_max": self._max_wait * 1000,
+            }
+        for label, fraction in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+            snapshot[f"wait_ms_{label}"] = (
+                recent[min(len(recent) - 1, int(len(recent) * fraction))] * 1000 if recent else 0.0
+            )
+        return snapshot
+
+
+class _InstrumentedPoolMixin:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.wait_stats.record(time.perf_counter() - start, timed_out)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(pool) -> dict:
+    """Current occupancy of a queue pool plus its checkout wait statistics."""
+    status = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        # Negative until the base pool_size connections have been opened.
+        "overflow": max(0, pool.overflow()),
+        "timeout_seconds": pool.timeout(),
+    }
+    wait_stats = getattr(pool, "wait_stats", None)
+    if wait_stats is not None:
+        status.update(wait_stats.snapshot())
+    return status
@@ -0,0 +1,108 @@
+"""Per-request database and email timing.
+
+Cursor events on every engine count and time the statements run while a request
+is in flight, and the email service adds the time spent sending. The totals go
+out in a ``Server-Timing`` header (``db;dur=..;count=..`` and ``email;dur=..``),
+visible in the browser's network panel, and a route that runs more than
+``query_budget`` statements logs a warning, which is how an N+1 shows up.
+
+Stats live in a context variable set for each request. Sync endpoints run in a
+worker thread with a copy of that context, so they add to the same object.
+"""
+
+import contextlib
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from config import settings
+
+
+@dataclass
+class RequestStats:
+    db_count: int = 0
+    db_seconds: float = 0.0
+    email_seconds: float = 0.0
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+    # The start lives on the statement's own context, so one that raises leaves
+    # nothing behind on the pooled connection. Internal statements have no context.
+    if context is not None and _request_stats.get() is not None:
+        context.request_timing_start = time.perf_counter()
+
+
+def _after_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+    stats = _request_stats.get()
+    start = getattr(context, "request_timing_start", None)
+    if stats is None or start is None:
+        return
+    stats.db_count += 1
+    stats.db_seconds += time.perf_counter() - start
+
+
+def instrument_engine(sync_engine: Engine) -> None:
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextlib.contextmanager
+def time_email() -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.email_seconds += time.perf_counter() - start
+
+
+def server_timing(stats: RequestStats) -> str:
+    metrics = [f"db;dur={stats.db_seconds * 1000:.2f};count={stats.db_count}"]
+    if stats.email_seconds:
+        metrics.append(f"email;dur={stats.email_seconds * 1000:.2f}")
+    return ", ".join(metrics)
+
+
+class RequestTimingMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start" and settings.server_timing_enabled:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", server_timing(stats).encode("ascii")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            budget = settings.query_budget
+            if budget > 0 and stats.db_count > budget:
+                # The router records the matched route in the scope, e.g. /api/admin/orders/{order_id}.
+                route = getattr(scope.get("route"), "path", scope["path"])
+                print(
+                    f"[db] {scope['method']} {route} ran {stats.db_count} queries "
+                    f"in {stats.db_seconds * 1000:.1f} ms (budget {budget})"
+                )
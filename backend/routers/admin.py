@@ -1,33 +1,58 @@
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+import csv
+import io
 import json
+import os
 import uuid
 from urllib.request import urlopen
 from typing import Optional, Union
 from functools import lru_cache
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Query, UploadFile
 from jose import JWTError, jwt
-from pydantic import BaseModel, EmailStr, field_validator, model_validator
-from sqlalchemy import func, or_, case
+from pydantic import BaseModel, EmailStr, ValidationError, field_validator, model_validator
+from sqlalchemy import Float, Select, case, cast, func, or_, select
 from sqlalchemy.orm import Session
 
+from catalog_bus import invalidate_local_caches, publish_catalog_change
 from config import settings
 from constants import OrderStatus
-from database import get_db
+from database import async_engine, engine, get_db, get_read_db, insert_returning, read_engine
 from event_config import (
     CURRENCY,
+    CatalogIndex,
+    CatalogLocation,
     EventNotFoundError,
+    NoActiveEventError,
+    get_active_catalog_index,
+    get_catalog_index_for_event_id,
     get_config_for_event_id_from_db,
 )
 from event_images import get_event_image_catalog, validate_event_image_key
-from models import CateringRequest, CateringRequestComment, Event, Feedback, Item, Location, Order
+from models import (
+    CateringRequest, CateringRequestComment, Event, Feedback, Item, Location, Order, OrderLine, SlotCapacity,
+)
+from order_lines import (
+    build_order_line,
+    delete_order_lines,
+    insert_order_lines,
+    load_order_line_rows,
+    load_order_lines,
+    order_line_dicts,
+    order_summary,
+    replace_order_lines,
+)
+from pool_metrics import pool_status
 from schemas import (
     EventCreate, EventUpdate, ItemCreate, ItemUpdate, LocationCreate, LocationUpdate,
     CATERING_REQUEST_STATUSES, FEEDBACK_ORIGIN_LABELS, FEEDBACK_REASON_LABELS, FEEDBACK_STATUSES,
     FEEDBACK_TYPE_LABELS, CateringRequestCommentCreate, CateringRequestStatusUpdate,
-    FeedbackStatusUpdate, FeedbackCommentUpdate,
+    FeedbackStatusUpdate, FeedbackCommentUpdate, OrderLinesInput, parse_event_date,
 )
 from services.email import send_confirmation, send_reminder
+from services.order_queue import insert_orders
+from slot_capacity import SlotFullError, SlotKey, order_holds_capacity, release_slot, reserve_slot, reserve_slots
+from slow_queries import clear_slow_queries, slow_query_entries
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -173,19 +198,17 @@ ALLOWED_STATUS_TRANSITIONS: dict[str, set[str]] = {
 }
 
 
-class AdminOrderCreate(BaseModel):
+class AdminOrderCreate(OrderLinesInput):
     event_id: Optional[int] = None
     name: str
     email: Optional[EmailStr] = None
     phone_number: Optional[str] = None
-    item_id: str
-    quantity: int
     pickup_location: str
     pickup_time_slot: str
     notes: Optional[str] = None
     exclude_email: bool = False
 
-    @field_validator("name", "item_id", "pickup_location", "pickup_time_slot")
+    @field_validator("name", "pickup_location", "pickup_time_slot")
     @classmethod
     def required_trim(cls, v: str) -> str:
         stripped = v.strip()
@@ -217,13 +240,6 @@ class AdminOrderCreate(BaseModel):
         stripped = str(v).strip()
         return stripped or None
 
-    @field_validator("quantity")
-    @classmethod
-    def quantity_must_be_positive(cls, v: int) -> int:
-        if v < 1:
-            raise ValueError("Quantity must be at least 1")
-        return v
-
     @model_validator(mode="after")
     def require_contact_unless_excluded(self) -> "AdminOrderCreate":
         if not self.exclude_email:
@@ -232,18 +248,16 @@ class AdminOrderCreate(BaseModel):
         return self
 
 
-class AdminOrderUpdate(BaseModel):
+class AdminOrderUpdate(OrderLinesInput):
     name: str
     email: Optional[EmailStr] = None
     phone_number: Optional[str] = None
-    item_id: str
-    quantity: int
     pickup_location: str
     pickup_time_slot: str
     notes: Optional[str] = None
     exclude_email: bool = False
 
-    @field_validator("name", "item_id", "pickup_location", "pickup_time_slot")
+    @field_validator("name", "pickup_location", "pickup_time_slot")
     @classmethod
     def required_trim(cls, v: str) -> str:
         stripped = v.strip()
@@ -275,13 +289,6 @@ class AdminOrderUpdate(BaseModel):
         stripped = str(v).strip()
         return stripped or None
 
-    @field_validator("quantity")
-    @classmethod
-    def quantity_must_be_positive(cls, v: int) -> int:
-        if v < 1:
-            raise ValueError("Quantity must be at least 1")
-        return v
-
     @model_validator(mode="after")
     def require_contact_unless_excluded(self) -> "AdminOrderUpdate":
         if not self.exclude_email:
@@ -294,6 +301,23 @@ class BulkRemindRequest(BaseModel):
     order_ids: list[str]
 
 
+class SlotCapacityEntry(BaseModel):
+    location_id: str
+    time_slot: str
+    capacity: int
+
+    @field_validator("capacity")
+    @classmethod
+    def capacity_not_negative(cls, v: int) -> int:
+        if v < 0:
+            raise ValueError("Capacity cannot be negative")
+        return v
+
+
+class SlotCapacityUpdate(BaseModel):
+    slots: list[SlotCapacityEntry]
+
+
 class FeedbackBulkDeleteRequest(BaseModel):
     ids: list[str]
 
@@ -321,6 +345,7 @@ def _event_dict(event: Event, *, total_revenue: float = 0.0, order_count: int =
         "id": event.id,
         "name": event.name,
         "event_date": event.event_date,
+        "event_on": event.event_on.isoformat() if event.event_on else None,
         "hero_header": event.hero_header,
         "hero_header_sage": event.hero_header_sage,
         "hero_subheader": event.hero_subheader,
@@ -341,6 +366,15 @@ def _event_dict(event: Event, *, total_revenue: float = 0.0, order_count: int =
     }
 
 
+def _event_on(body: Union[EventCreate, EventUpdate], event: Optional[Event] = None) -> Optional[date]:
+    """The typed date to store: as sent, else parsed from a new or changed event_date."""
+    if "event_on" in body.model_fields_set:
+        return body.event_on
+    if event is not None and event.event_date == body.event_date:
+        return event.event_on
+    return parse_event_date(body.event_date)
+
+
 def _validate_event_images(payload: Union[EventCreate, EventUpdate]) -> tuple[Optional[str], Optional[str]]:
     try:
         tooltip_image_key = validate_event_image_key(payload.tooltip_image_key, "tooltip")
@@ -350,19 +384,29 @@ def _validate_event_images(payload: Union[EventCreate, EventUpdate]) -> tuple[Op
     return tooltip_image_key, hero_side_image_key
 
 
+def _commit_catalog_change(db: Session) -> None:
+    """Commit an event, item or location write and drop catalog caches on every worker."""
+    publish_catalog_change(db)
+    db.commit()
+    invalidate_local_caches()
+
+
 @router.get("/event-images")
 def admin_list_event_images(_: dict = Depends(verify_admin_token)):
     return get_event_image_catalog()
 
 
-@router.get("/events")
-def admin_list_events(
-    db: Session = Depends(get_db),
-    _: dict = Depends(verify_admin_token),
-):
+def _event_list_query(event_on_from: Optional[date] = None, event_on_to: Optional[date] = None) -> Select:
+    """Select every event with its revenue and order count, newest first."""
     active_order = Order.status.notin_(["cancelled", "no_show"])
-    rows = (
-        db.query(
+    # Events whose display date could not be parsed have no event_on and drop out of date ranges.
+    filters = []
+    if event_on_from is not None:
+        filters.append(Event.event_on >= event_on_from)
+    if event_on_to is not None:
+        filters.append(Event.event_on <= event_on_to)
+    return (
+        select(
             Event,
             func.coalesce(
                 func.sum(
@@ -384,10 +428,20 @@ def admin_list_events(
             ).label("order_count"),
         )
         .outerjoin(Order, Order.event_id == Event.id)
+        .where(*filters)
         .group_by(Event.id)
         .order_by(Event.id.desc())
-        .all()
     )
+
+
+@router.get("/events")
+def admin_list_events(
+    event_on_from: Optional[date] = Query(None),
+    event_on_to: Optional[date] = Query(None),
+    db: Session = Depends(get_read_db),
+    _: dict = Depends(verify_admin_token),
+):
+    rows = db.execute(_event_list_query(event_on_from, event_on_to)).all()
     return [
         _event_dict(event, total_revenue=float(rev), order_count=int(cnt))
         for event, rev, cnt in rows
@@ -418,6 +472,107 @@ def admin_get_event_config(
         raise HTTPException(status_code=404, detail="Event not found")
 
 
+def _slot_capacity_dicts(db: Session, event_id: int) -> list[dict]:
+    rows = (
+        db.query(SlotCapacity, Location.name)
+        .outerjoin(Location, Location.id == SlotCapacity.location_id)
+        .filter(SlotCapacity.event_id == event_id)
+        .order_by(Location.sort_order, SlotCapacity.location_id, SlotCapacity.time_slot)
+        .all()
+    )
+    return [
+        {
+            "location_id": slot.location_id,
+            "location_name": location_name,
+            "time_slot": slot.time_slot,
+            "capacity": slot.capacity,
+            "reserved": slot.reserved,
+            "remaining": max(slot.capacity - slot.reserved, 0),
+        }
+        for slot, location_name in rows
+    ]
+
+
+@router.get("/events/{event_id}/slot-capacities")
+def admin_list_slot_capacities(
+    event_id: int,
+    db: Session = Depends(get_db),
+    _: dict = Depends(verify_admin_token),
+):
+    if db.query(Event.id).filter(Event.id == event_id).first() is None:
+        raise HTTPException(status_code=404, detail="Event not found")
+    return _slot_capacity_dicts(db, event_id)
+
+
+@router.put("/events/{event_id}/slot-capacities")
+def admin_set_slot_capacities(
+    event_id: int,
+    body: SlotCapacityUpdate,
+    db: Session = Depends(get_db),
+    _: dict = Depends(verify_admin_token),
+):
+    """Replace the event's slot capacities; slots left out become unlimited.
+
+    ``reserved`` is recounted from the event's non-cancelled orders, which also
+    repairs drift after locations or time slots are renamed.
+    """
+    event = db.query(Event).filter(Event.id == event_id).first()
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    locations = {
+        loc.id: loc
+        for loc in db.query(Location).filter(Location.id.in_(event.location_ids or [])).all()
+    }
+    requested: dict[tuple[str, str], int] = {}
+    for entry in body.slots:
+        location = locations.get(entry.location_id)
+        if location is None:
+            raise HTTPException(status_code=400, detail="Invalid location_id for event")
+        if entry.time_slot not in (location.time_slots or []):
+            raise HTTPException(status_code=400, detail="Invalid time_slot for location")
+        requested[(entry.location_id, entry.time_slot)] = entry.capacity
+
+    # Lock existing rows so in-flight reservations land before the recount.
+    existing = {
+        (slot.location_id, slot.time_slot): slot
+        for slot in db.query(SlotCapacity)
+        .filter(SlotCapacity.event_id == event_id)
+        .with_for_update()
+        .all()
+    }
+
+    location_ids_by_key: dict[str, str] = {}
+    for location in locations.values():
+        location_ids_by_key[location.name] = location.id
+        location_ids_by_key[location.id] = location.id
+    reserved: dict[tuple[str, str], int] = {}
+    totals = (
+        db.query(Order.pickup_location, Order.pickup_time_slot, func.sum(Order.quantity))
+        .filter(Order.event_id == event_id, Order.status != OrderStatus.CANCELLED)
+        .group_by(Order.pickup_location, Order.pickup_time_slot)
+        .all()
+    )
+    for pickup_location, pickup_time_slot, quantity in totals:
+        location_id = location_ids_by_key.get(pickup_location)
+        if location_id is not None:
+            key = (location_id, pickup_time_slot)
+            reserved[key] = reserved.get(key, 0) + int(quantity or 0)
+
+    for key, slot in existing.items():
+        if key not in requested:
+            db.delete(slot)
+    for (location_id, time_slot), capacity in requested.items():
+        slot = existing.get((location_id, time_slot))
+        if slot is None:
+            slot = SlotCapacity(event_id=event_id, location_id=location_id, time_slot=time_slot)
+            db.add(slot)
+        slot.capacity = capacity
+        slot.reserved = reserved.get((location_id, time_slot), 0)
+    db.commit()
+    return _slot_capacity_dicts(db, event_id)
+
+
 @router.post("/events", status_code=201)
 def admin_create_event(
     body: EventCreate,
@@ -425,9 +580,12 @@ def admin_create_event(
     _: dict = Depends(verify_admin_token),
 ):
     tooltip_image_key, hero_side_image_key = _validate_event_images(body)
-    event = Event(
+    event = insert_returning(
+        db,
+        Event,
         name=body.name,
         event_date=body.event_date,
+        event_on=_event_on(body),
         hero_header=body.hero_header,
         hero_header_sage=body.hero_header_sage,
         hero_subheader=body.hero_subheader,
@@ -444,9 +602,7 @@ def admin_create_event(
         location_ids=body.location_ids,
         updated_at=datetime.now(timezone.utc),
     )
-    db.add(event)
-    db.commit()
-    db.refresh(event)
+    _commit_catalog_change(db)
     return _event_dict(event)
 
 
@@ -461,6 +617,7 @@ def admin_update_event(
     event = db.query(Event).filter(Event.id == event_id).first()
     if event is None:
         raise HTTPException(status_code=404, detail="Event not found")
+    event.event_on = _event_on(body, event)
     event.name = body.name
     event.event_date = body.event_date
     event.hero_header = body.hero_header
@@ -477,8 +634,7 @@ def admin_update_event(
     event.item_ids = body.item_ids
     event.location_ids = body.location_ids
     event.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(event)
+    _commit_catalog_change(db)
     return _event_dict(event)
 
 
@@ -494,8 +650,7 @@ def admin_activate_event(
     db.query(Event).update({"is_active": False})
     event.is_active = True
     event.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(event)
+    _commit_catalog_change(db)
     return _event_dict(event)
 
 
@@ -510,8 +665,7 @@ def admin_deactivate_event(
         raise HTTPException(status_code=404, detail="Event not found")
     event.is_active = False
     event.updated_at = datetime.now(timezone.utc)
-    db.commit()
-    db.refresh(event)
+    _commit_catalog_change(db)
     return _event_dict(event)
 
 
@@ -530,8 +684,9 @@ def admin_delete_event(
     existing_orders = db.query(Order).filter(Order.event_id == event_id).count()
     if existing_orders > 0:
         raise HTTPException(status_code=400, detail="Cannot delete event with existing orders")
+    db.query(SlotCapacity).filter(SlotCapacity.event_id == event_id).delete(synchronize_session=False)
     db.delete(event)
-    db.commit()
+    _commit_catalog_change(db)
     return {"success": True}
 
 
@@ -569,7 +724,9 @@ def admin_create_item(
 ):
     max_sort = db.query(func.max(Item.sort_order)).scalar()
     next_sort = (max_sort + 1) if max_sort is not None else 0
-    item = Item(
+    item = insert_returning(
+        db,
+        Item,
         name=body.name,
         description=body.description,
         price=body.price,
@@ -577,9 +734,7 @@ def admin_create_item(
         minimum_order_quantity=body.minimum_order_quantity if body.minimum_order_quantity is not None else 1,
         sort_order=next_sort,
     )
-    db.add(item)
-    db.commit()
-    db.refresh(item)
+    _commit_catalog_change(db)
     return _item_dict(item)
 
 
@@ -599,8 +754,7 @@ def admin_update_item(
     item.discounted_price = body.discounted_price
     if body.minimum_order_quantity is not None:
         item.minimum_order_quantity = body.minimum_order_quantity
-    db.commit()
-    db.refresh(item)
+    _commit_catalog_change(db)
     return _item_dict(item)
 
 
@@ -614,7 +768,7 @@ def admin_delete_item(
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
     db.delete(item)
-    db.commit()
+    _commit_catalog_change(db)
     return {"success": True}
 
 
@@ -649,15 +803,15 @@ def admin_create_location(
 ):
     max_sort = db.query(func.max(Location.sort_order)).scalar()
     next_sort = (max_sort + 1) if max_sort is not None else 0
-    loc = Location(
+    loc = insert_returning(
+        db,
+        Location,
         name=body.name,
         address=body.address,
         time_slots=body.time_slots,
         sort_order=next_sort,
     )
-    db.add(loc)
-    db.commit()
-    db.refresh(loc)
+    _commit_catalog_change(db)
     return _location_dict(loc)
 
 
@@ -674,8 +828,7 @@ def admin_update_location(
     loc.name = body.name
     loc.address = body.address
     loc.time_slots = body.time_slots
-    db.commit()
-    db.refresh(loc)
+    _commit_catalog_change(db)
     return _location_dict(loc)
 
 
@@ -689,7 +842,7 @@ def admin_delete_location(
     if not loc:
         raise HTTPException(status_code=404, detail="Location not found")
     db.delete(loc)
-    db.commit()
+    _commit_catalog_change(db)
     return {"success": True}
 
 
@@ -697,7 +850,32 @@ def admin_delete_location(
 # Order endpoints
 # ---------------------------------------------------------------------------
 
-def _order_dict(order: Order) -> dict:
+# Columns of the orders list, read as plain rows instead of Order entities.
+_ORDER_LIST_COLUMNS = (
+    Order.id,
+    Order.event_id,
+    Order.name,
+    Order.email,
+    Order.phone_number,
+    Order.item_id,
+    Order.item_name,
+    Order.quantity,
+    Order.pickup_location,
+    Order.pickup_time_slot,
+    cast(Order.total_price, Float).label("total_price"),
+    Order.status,
+    Order.reminded,
+    Order.paid,
+    Order.payment_method,
+    Order.payment_method_other,
+    Order.notes,
+    Order.exclude_email,
+    Order.created_at,
+)
+
+
+def _order_dict(order: Order, lines: list[OrderLine]) -> dict:
+    """Serialize an order, or a row of ``_ORDER_LIST_COLUMNS``, with its lines."""
     return {
         "id": order.id,
         "event_id": int(order.event_id) if getattr(order, "event_id", None) is not None else None,
@@ -710,6 +888,7 @@ def _order_dict(order: Order) -> dict:
         "pickup_location": order.pickup_location,
         "pickup_time_slot": order.pickup_time_slot,
         "total_price": float(order.total_price),
+        "lines": order_line_dicts(order, lines),
         "status": order.status,
         "reminded": bool(order.reminded),
         "paid": bool(order.paid),
@@ -721,7 +900,9 @@ def _order_dict(order: Order) -> dict:
     }
 
 
-def _get_reminder_context(db: Session, orders: list[Order]) -> tuple[dict[int, Event], str, dict]:
+def _get_reminder_context(
+    db: Session, orders: list[Order]
+) -> tuple[dict[int, Event], str, dict, dict[str, str], dict[str, list[OrderLine]]]:
     event_ids = sorted({int(o.event_id) for o in orders if getattr(o, "event_id", None) is not None})
     events = db.query(Event).filter(Event.id.in_(event_ids)).all() if event_ids else []
     events_by_id: dict[int, Event] = {int(event.id): event for event in events}
@@ -733,7 +914,19 @@ def _get_reminder_context(db: Session, orders: list[Order]) -> tuple[dict[int, E
         "email": active_event.etransfer_email if active_event else None,
     }
 
-    return events_by_id, active_event_date, active_etransfer
+    # Pickup addresses for every order in one query, keyed by location name and id.
+    location_keys = sorted({o.pickup_location for o in orders if o.pickup_location})
+    locations = (
+        db.query(Location)
+        .filter(or_(Location.name.in_(location_keys), Location.id.in_(location_keys)))
+        .all()
+    ) if location_keys else []
+    addresses = {loc.name: loc.address for loc in locations}
+    addresses.update((loc.id, loc.address) for loc in locations)
+
+    lines_by_order = load_order_lines(db, [o.id for o in orders])
+
+    return events_by_id, active_event_date, active_etransfer, addresses, lines_by_order
 
 
 def _reminder_result(order: Order, *, status: str, message: str) -> dict:
@@ -759,6 +952,8 @@ def _prepare_reminder_order_data(
     events_by_id: dict[int, Event],
     active_event_date: str,
     active_etransfer: dict,
+    addresses: dict[str, str],
+    lines_by_order: dict[str, list[OrderLine]],
 ) -> tuple[Optional[dict], Optional[dict]]:
     if order.status != OrderStatus.CONFIRMED:
         return _reminder_result(
@@ -788,10 +983,7 @@ def _prepare_reminder_order_data(
             message="Missing email",
         ), None
 
-    location = db.query(Location).filter(
-        or_(Location.name == order.pickup_location, Location.id == order.pickup_location)
-    ).first()
-    address = location.address if location else ""
+    address = addresses.get(order.pickup_location) or ""
 
     effective_price = float(order.total_price) / order.quantity if order.quantity else 0.0
 
@@ -811,6 +1003,7 @@ def _prepare_reminder_order_data(
         "email": order.email,
         "total_price": float(order.total_price),
         "price_per_item": effective_price,
+        "lines": order_line_dicts(order, lines_by_order.get(order.id, [])),
         "currency": CURRENCY,
         "address": address,
         "event_date": event_date,
@@ -828,6 +1021,8 @@ def _send_order_reminder(
     events_by_id: dict[int, Event],
     active_event_date: str,
     active_etransfer: dict,
+    addresses: dict[str, str],
+    lines_by_order: dict[str, list[OrderLine]],
 ) -> dict:
     skipped_result, order_data = _prepare_reminder_order_data(
         order,
@@ -835,6 +1030,8 @@ def _send_order_reminder(
         events_by_id=events_by_id,
         active_event_date=active_event_date,
         active_etransfer=active_etransfer,
+        addresses=addresses,
+        lines_by_order=lines_by_order,
     )
     if skipped_result is not None:
         return skipped_result
@@ -863,8 +1060,43 @@ def _effective_item_price(item: Item) -> float:
     return float(item.price)
 
 
-def _compute_total_price(item: Item, quantity: int) -> float:
-    return round(_effective_item_price(item) * quantity, 2)
+def _find_location(db: Session, key: str) -> Optional[Location]:
+    """Match a location outside any event catalog by name or by id."""
+    return db.query(Location).filter(or_(Location.name == key, Location.id == key)).first()
+
+
+def _order_catalog(db: Session, order: Order) -> Optional[CatalogIndex]:
+    if getattr(order, "event_id", None) is None:
+        return None
+    return get_catalog_index_for_event_id(db, int(order.event_id))
+
+
+def _order_location(db: Session, order: Order) -> Optional[Union[CatalogLocation, Location]]:
+    """Resolve an order's pickup location from its event's cached catalog when possible."""
+    catalog = _order_catalog(db, order)
+    location = catalog.find_location(order.pickup_location) if catalog is not None else None
+    # Locations since removed from the event are still found, by one query.
+    return location or _find_location(db, order.pickup_location)
+
+
+def _order_slot(db: Session, order: Order) -> Optional[SlotKey]:
+    """The capacity slot an order counts against, if its location still resolves."""
+    if getattr(order, "event_id", None) is None:
+        return None
+    location = _order_location(db, order)
+    if location is None:
+        return None
+    return SlotKey(int(order.event_id), location.id, order.pickup_time_slot)
+
+
+def _reserve_order_slot(db: Session, slot: SlotKey, quantity: int) -> None:
+    try:
+        reserve_slot(db, slot, quantity)
+    except SlotFullError as exc:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Pickup time slot is full ({exc.reserved}/{exc.capacity} reserved)",
+        )
 
 
 @router.post("/orders", status_code=201)
@@ -876,59 +1108,267 @@ def admin_create_order(
     if body.event_id is not None and body.event_id < 1:
         raise HTTPException(status_code=400, detail="Invalid event_id")
 
-    event: Optional[Event]
     if body.event_id is not None:
-        event = db.query(Event).filter(Event.id == body.event_id).first()
-        if event is None:
+        catalog = get_catalog_index_for_event_id(db, body.event_id)
+        if catalog is None:
             raise HTTPException(status_code=404, detail="Event not found")
     else:
-        event = db.query(Event).filter(Event.is_active == True).first()
-        if event is None:
+        try:
+            catalog = get_active_catalog_index(db)
+        except NoActiveEventError:
             raise HTTPException(status_code=400, detail="No active event")
 
-    item = db.query(Item).filter(Item.id == body.item_id).first()
-    if not item:
-        raise HTTPException(status_code=400, detail="Invalid item_id")
-    if item.id not in (event.item_ids or []):
-        raise HTTPException(status_code=400, detail="Invalid item_id for event")
-    if body.quantity < 1:
-        raise HTTPException(status_code=400, detail="Quantity must be at least 1")
+    order_id = str(uuid.uuid4())
+    lines = []
+    for line_number, line_in in enumerate(body.order_lines):
+        item = catalog.get_item(line_in.item_id)
+        if item is None:
+            # Only the error path pays for telling an unknown item from one outside the event.
+            if db.query(Item.id).filter(Item.id == line_in.item_id).first() is None:
+                raise HTTPException(status_code=400, detail="Invalid item_id")
+            raise HTTPException(status_code=400, detail="Invalid item_id for event")
+        lines.append(
+            build_order_line(order_id, line_number, item, line_in.quantity, _effective_item_price(item))
+        )
+    summary = order_summary(lines)
 
     pickup_location = body.pickup_location
     pickup_time_slot = body.pickup_time_slot
-    location = db.query(Location).filter(
-        or_(Location.name == pickup_location, Location.id == pickup_location)
-    ).first()
-    if not location:
-        raise HTTPException(status_code=400, detail="Invalid pickup_location")
-    if location.id not in (event.location_ids or []):
+    location = catalog.find_location(pickup_location)
+    if location is None:
+        if _find_location(db, pickup_location) is None:
+            raise HTTPException(status_code=400, detail="Invalid pickup_location")
         raise HTTPException(status_code=400, detail="Invalid pickup_location for event")
-    if pickup_time_slot not in (location.time_slots or []):
+    if pickup_time_slot not in location.time_slots:
         raise HTTPException(status_code=400, detail="Invalid pickup_time_slot for location")
 
-    total_price = _compute_total_price(item, body.quantity)
+    _reserve_order_slot(
+        db, SlotKey(catalog.event_id, location.id, pickup_time_slot), summary["quantity"]
+    )
 
-    order = Order(
-        id=str(uuid.uuid4()),
-        event_id=int(event.id),
+    order = insert_returning(
+        db,
+        Order,
+        id=order_id,
+        event_id=catalog.event_id,
         name=body.name,
         email=str(body.email) if body.email is not None else None,
         phone_number=body.phone_number,
-        item_id=item.id,
-        item_name=item.name,
-        quantity=body.quantity,
+        **summary,
         pickup_location=pickup_location,
         pickup_time_slot=pickup_time_slot,
-        total_price=total_price,
         status=OrderStatus.PENDING,
         notes=body.notes,
         exclude_email=body.exclude_email,
     )
-    db.add(order)
+    insert_order_lines(db, lines)
     db.commit()
-    db.refresh(order)
 
-    return _order_dict(order)
+    return _order_dict(order, [OrderLine(**line) for line in lines])
+
+
+MAX_IMPORT_ROWS = 2000
+MAX_IMPORT_BYTES = 2 * 1024 * 1024
+_IMPORT_REQUIRED_COLUMNS = ("name", "item", "quantity", "pickup_location", "pickup_time_slot")
+_IMPORT_COLUMN_ALIASES = {"item_id": "item", "item_name": "item", "phone": "phone_number"}
+
+
+def _import_column(header: str) -> str:
+    column = header.strip().lower().replace(" ", "_")
+    return _IMPORT_COLUMN_ALIASES.get(column, column)
+
+
+def _parse_import_csv(data: bytes) -> list[tuple[int, dict]]:
+    """The non-blank rows of an import CSV with their spreadsheet row numbers."""
+    try:
+        text = data.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="CSV must be UTF-8 encoded")
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames:
+        raise HTTPException(status_code=400, detail="CSV file is empty")
+    reader.fieldnames = [_import_column(header) for header in reader.fieldnames]
+    missing = [column for column in _IMPORT_REQUIRED_COLUMNS if column not in reader.fieldnames]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Missing CSV columns: {', '.join(missing)}")
+
+    rows = []
+    for row in reader:
+        # Cells past the header end up under the None key and are ignored.
+        values = {column: (value or "").strip() for column, value in row.items() if column is not None}
+        if not any(values.values()):
+            continue
+        if len(rows) == MAX_IMPORT_ROWS:
+            raise HTTPException(status_code=400, detail=f"CSV has more than {MAX_IMPORT_ROWS} rows")
+        rows.append((reader.line_num, values))
+    return rows
+
+
+def _import_validation_errors(exc: ValidationError, group: list[tuple[int, dict]]) -> list[dict]:
+    """Per-row errors for one imported order; line errors point at that line's row."""
+    errors_by_row: dict[int, list[str]] = {}
+    for error in exc.errors():
+        loc = list(error["loc"])
+        row_number = group[0][0]
+        if len(loc) >= 2 and loc[0] == "lines" and isinstance(loc[1], int):
+            row_number = group[loc[1]][0]
+            loc = loc[2:]
+        field = ".".join(str(part) for part in loc)
+        errors_by_row.setdefault(row_number, []).append(f"{field}: {error['msg']}" if field else error["msg"])
+    return [{"row": row_number, "errors": messages} for row_number, messages in errors_by_row.items()]
+
+
+@router.post("/orders/import")
+def admin_import_orders(
+    file: UploadFile = File(...),
+    event_id: Optional[int] = Form(None),
+    db: Session = Depends(get_db),
+    _: dict = Depends(verify_admin_token),
+):
+    """Create orders from a CSV, one order per row or per shared ``order_ref``.
+
+    Every row is checked against one catalog snapshot of the event. Valid orders
+    are written together in one transaction; the rest come back as errors keyed
+    by spreadsheet row so they can be fixed and uploaded again.
+    """
+    data = file.file.read(MAX_IMPORT_BYTES + 1)
+    if len(data) > MAX_IMPORT_BYTES:
+        raise HTTPException(status_code=413, detail="CSV file is too large")
+    rows = _parse_import_csv(data)
+
+    if event_id is not None:
+        catalog = get_catalog_index_for_event_id(db, event_id) if event_id >= 1 else None
+        if catalog is None:
+            raise HTTPException(status_code=404, detail="Event not found")
+    else:
+        try:
+            catalog = get_active_catalog_index(db)
+        except NoActiveEventError:
+            raise HTTPException(status_code=400, detail="No active event")
+    # Spreadsheets name items more often than they carry their ids.
+    items_by_key = {item.name.lower(): item for item in catalog.items_by_id.values()}
+    items_by_key.update((item_id.lower(), item) for item_id, item in catalog.items_by_id.items())
+
+    # Rows sharing an order_ref are the lines of one order; its first row holds the customer.
+    groups: dict[str, list[tuple[int, dict]]] = {}
+    for row_number, values in rows:
+        groups.setdefault(values.get("order_ref") or f"row {row_number}", []).append((row_number, values))
+
+    errors: list[dict] = []
+    prepared: list[tuple[int, dict, list[dict], SlotKey]] = []
+    created_at = datetime.now(timezone.utc)
+    for group in groups.values():
+        row_number, first = group[0]
+        unknown = [
+            (line_row, values["item"])
+            for line_row, values in group
+            if values["item"].lower() not in items_by_key
+        ]
+        if unknown:
+            errors.extend({"row": line_row, "errors": [f"Unknown item: {item}"]} for line_row, item in unknown)
+            continue
+        try:
+            body = AdminOrderCreate(
+                event_id=catalog.event_id,
+                name=first.get("name", ""),
+                email=first.get("email") or None,
+                phone_number=first.get("phone_number"),
+                pickup_location=first.get("pickup_location", ""),
+                pickup_time_slot=first.get("pickup_time_slot", ""),
+                notes=first.get("notes"),
+                exclude_email=first.get("exclude_email") or False,
+                lines=[
+                    {
+                        "item_id": items_by_key[values["item"].lower()].id,
+                        "quantity": values["quantity"],
+                    }
+                    for _, values in group
+                ],
+            )
+        except ValidationError as exc:
+            errors.extend(_import_validation_errors(exc, group))
+            continue
+
+        location = catalog.find_location(body.pickup_location)
+        if location is None:
+            errors.append({"row": row_number, "errors": [f"Unknown pickup location: {body.pickup_location}"]})
+            continue
+        if body.pickup_time_slot not in location.time_slots:
+            errors.append({
+                "row": row_number,
+                "errors": [f"Unknown pickup time slot for {location.name}: {body.pickup_time_slot}"],
+            })
+            continue
+
+        order_id = str(uuid.uuid4())
+        lines = []
+        for line_number, line_in in enumerate(body.order_lines):
+            item = catalog.get_item(line_in.item_id)
+            lines.append(
+                build_order_line(order_id, line_number, item, line_in.quantity, _effective_item_price(item))
+            )
+        values = {
+            "id": order_id,
+            "event_id": catalog.event_id,
+            "name": body.name,
+            "email": str(body.email) if body.email is not None else None,
+            "phone_number": body.phone_number,
+            **order_summary(lines),
+            "pickup_location": location.name,
+            "pickup_time_slot": body.pickup_time_slot,
+            "status": OrderStatus.PENDING,
+            "notes": body.notes,
+            "exclude_email": body.exclude_email,
+            "created_at": created_at,
+        }
+        prepared.append((row_number, values, lines, SlotKey(catalog.event_id, location.id, body.pickup_time_slot)))
+
+    slot_errors = reserve_slots(db, [(slot, values["quantity"]) for _, values, _, slot in prepared])
+    written = []
+    for (row_number, values, lines, _), slot_error in zip(prepared, slot_errors):
+        if slot_error is None:
+            written.append((values, lines))
+            continue
+        errors.append({
+            "row": row_number,
+            "errors": [f"Pickup time slot is full ({slot_error.reserved}/{slot_error.capacity} reserved)"],
+        })
+
+    if written:
+        insert_orders(db, [values for values, _ in written])
+        insert_order_lines(db, [line for _, lines in written for line in lines])
+    db.commit()
+
+    errors.sort(key=lambda error: error["row"])
+    return {
+        "event_id": catalog.event_id,
+        "imported": len(written),
+        "order_ids": [values["id"] for values, _ in written],
+        "errors": errors,
+    }
+
+
+def _order_list_filters(
+    *,
+    status: Optional[str] = None,
+    event_id: Optional[int] = None,
+    paid: Optional[bool] = None,
+    email: Optional[str] = None,
+) -> list:
+    filters = []
+    if status:
+        filters.append(Order.status == status)
+    if event_id is not None:
+        filters.append(Order.event_id == event_id)
+    if paid is not None:
+        filters.append(Order.paid == paid)
+    if email is not None:
+        filters.append(Order.email == email)
+    return filters
+
+
+def _order_list_query(*filters) -> Select:
+    return select(*_ORDER_LIST_COLUMNS).where(*filters).order_by(Order.created_at.desc())
 
 
 @router.get("/orders")
@@ -937,20 +1377,15 @@ def admin_list_orders(
     event_id: Optional[int] = Query(None),
     paid: Optional[bool] = Query(None),
     email: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: dict = Depends(verify_admin_token),
 ):
-    query = db.query(Order)
-    if status:
-        query = query.filter(Order.status == status)
-    if event_id is not None:
-        query = query.filter(Order.event_id == event_id)
-    if paid is not None:
-        query = query.filter(Order.paid == paid)
-    if email is not None:
-        query = query.filter(Order.email == email)
-    orders = query.order_by(Order.created_at.desc()).all()
-    return [_order_dict(o) for o in orders]
+    filters = _order_list_filters(status=status, event_id=event_id, paid=paid, email=email)
+    # Plain rows skip the identity map and per-object state of ORM entities, which
+    # dominate the cost of this list once an event has thousands of orders.
+    rows = db.execute(_order_list_query(*filters)).all()
+    lines_by_order = load_order_line_rows(db, *filters)
+    return [_order_dict(row, lines_by_order.get(row.id, [])) for row in rows]
 
 
 @router.post("/orders/remind")
@@ -968,7 +1403,9 @@ def admin_bulk_remind(
         else []
     )
     orders_by_id: dict[str, Order] = {o.id: o for o in orders}
-    events_by_id, active_event_date, active_etransfer = _get_reminder_context(db, orders)
+    events_by_id, active_event_date, active_etransfer, addresses, lines_by_order = (
+        _get_reminder_context(db, orders)
+    )
 
     reminded_count = 0
     failed_emails = 0
@@ -986,6 +1423,8 @@ def admin_bulk_remind(
             events_by_id=events_by_id,
             active_event_date=active_event_date,
             active_etransfer=active_etransfer,
+            addresses=addresses,
+            lines_by_order=lines_by_order,
         )
         if result["status"] == "sent":
             reminded_count += 1
@@ -1020,13 +1459,17 @@ def admin_send_single_reminder(
     if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
 
-    events_by_id, active_event_date, active_etransfer = _get_reminder_context(db, [order])
+    events_by_id, active_event_date, active_etransfer, addresses, lines_by_order = (
+        _get_reminder_context(db, [order])
+    )
     result = _send_order_reminder(
         order,
         db,
         events_by_id=events_by_id,
         active_event_date=active_event_date,
         active_etransfer=active_etransfer,
+        addresses=addresses,
+        lines_by_order=lines_by_order,
     )
     if result["status"] == "sent":
         db.commit()
@@ -1042,7 +1485,7 @@ def admin_get_order(
     order = db.query(Order).filter(Order.id == order_id).first()
     if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
-    return _order_dict(order)
+    return _order_dict(order, load_order_lines(db, [order.id]).get(order.id, []))
 
 
 @router.put("/orders/{order_id}")
@@ -1056,54 +1499,76 @@ def admin_update_order(
     if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
 
-    event = db.query(Event).filter(Event.id == int(order.event_id)).first() if getattr(order, "event_id", None) is not None else None
-    enforce_event_membership = event is not None
-
-    item = db.query(Item).filter(Item.id == body.item_id).first()
-    if not item:
-        raise HTTPException(status_code=400, detail="Invalid item_id")
-    if enforce_event_membership and item.id not in (event.item_ids or []):
-        raise HTTPException(status_code=400, detail="Invalid item_id for event")
-    if body.quantity < 1:
-        raise HTTPException(status_code=400, detail="Quantity must be at least 1")
+    catalog = _order_catalog(db, order)
+    previous_lines = {
+        line["item_id"]: line
+        for line in order_line_dicts(order, load_order_lines(db, [order.id]).get(order.id, []))
+    }
+    # A single item_id/quantity body would replace every line with that one item.
+    if not body.lines and len(previous_lines) > 1:
+        raise HTTPException(status_code=409, detail="Order has several lines; send lines to update it")
+
+    lines = []
+    for line_number, line_in in enumerate(body.order_lines):
+        # Orders whose event is gone are only checked against the global catalog.
+        item = catalog.get_item(line_in.item_id) if catalog is not None else None
+        if item is None:
+            item = db.query(Item).filter(Item.id == line_in.item_id).first()
+            if not item:
+                raise HTTPException(status_code=400, detail="Invalid item_id")
+            if catalog is not None:
+                raise HTTPException(status_code=400, detail="Invalid item_id for event")
+        previous = previous_lines.get(item.id)
+        if previous is None or previous["quantity"] <= 0:
+            lines.append(
+                build_order_line(order.id, line_number, item, line_in.quantity, _effective_item_price(item))
+            )
+            continue
+        # Items already on the order keep the unit price they were sold at.
+        historical_unit = previous["total_price"] / previous["quantity"]
+        line = build_order_line(order.id, line_number, item, line_in.quantity, historical_unit)
+        if line_in.quantity == previous["quantity"]:
+            line["total_price"] = previous["total_price"]
+        lines.append(line)
+    summary = order_summary(lines)
 
     pickup_location = body.pickup_location
     pickup_time_slot = body.pickup_time_slot
-    location = db.query(Location).filter(
-        or_(Location.name == pickup_location, Location.id == pickup_location)
-    ).first()
-    if not location:
-        raise HTTPException(status_code=400, detail="Invalid pickup_location")
-    if enforce_event_membership and location.id not in (event.location_ids or []):
-        raise HTTPException(status_code=400, detail="Invalid pickup_location for event")
-    if pickup_time_slot not in (location.time_slots or []):
+    location = catalog.find_location(pickup_location) if catalog is not None else None
+    if location is None:
+        location = _find_location(db, pickup_location)
+        if not location:
+            raise HTTPException(status_code=400, detail="Invalid pickup_location")
+        if catalog is not None:
+            raise HTTPException(status_code=400, detail="Invalid pickup_location for event")
+    if pickup_time_slot not in (location.time_slots or ()):
         raise HTTPException(status_code=400, detail="Invalid pickup_time_slot for location")
 
-    total_price = float(order.total_price)
-    if order.item_id != item.id:
-        total_price = _compute_total_price(item, body.quantity)
-    elif order.quantity != body.quantity:
-        if order.quantity > 0:
-            historical_unit = float(order.total_price) / order.quantity
-            total_price = round(historical_unit * body.quantity, 2)
-        else:
-            total_price = _compute_total_price(item, body.quantity)
+    if order_holds_capacity(order.status):
+        # Release first so a quantity change within the same slot only checks the difference.
+        old_slot = _order_slot(db, order)
+        if old_slot is not None:
+            release_slot(db, old_slot, order.quantity)
+        if getattr(order, "event_id", None) is not None:
+            _reserve_order_slot(
+                db, SlotKey(int(order.event_id), location.id, pickup_time_slot), summary["quantity"]
+            )
 
     order.name = body.name
     order.email = str(body.email) if body.email is not None else None
     order.phone_number = body.phone_number
-    order.item_id = item.id
-    order.item_name = item.name
-    order.quantity = body.quantity
+    order.item_id = summary["item_id"]
+    order.item_name = summary["item_name"]
+    order.quantity = summary["quantity"]
     order.pickup_location = pickup_location
     order.pickup_time_slot = pickup_time_slot
-    order.total_price = total_price
+    order.total_price = summary["total_price"]
     order.notes = body.notes
     order.exclude_email = body.exclude_email
+    replace_order_lines(db, order.id, lines)
 
     db.commit()
-    db.refresh(order)
-    return _order_dict(order)
+    return _order_dict(order, [OrderLine(**line) for line in lines])
 
 
 @router.post("/orders/{order_id}/confirm")
@@ -1130,18 +1595,19 @@ def admin_confirm_order(
                 detail="Order email is missing. Set exclude_email=true to confirm without email.",
             )
 
-        event = db.query(Event).filter(Event.id == int(order.event_id)).first() if getattr(order, "event_id", None) is not None else None
-        if event is None:
-            event = db.query(Event).filter(Event.is_active == True).first()
-        event_date = event.event_date if event else ""
+        catalog = _order_catalog(db, order)
+        if catalog is None:
+            try:
+                catalog = get_active_catalog_index(db)
+            except NoActiveEventError:
+                catalog = None
+        event_date = catalog.event_date if catalog else ""
         etransfer = {
-            "enabled": bool(event.etransfer_enabled) if event else False,
-            "email": event.etransfer_email if event else None,
+            "enabled": catalog.etransfer_enabled if catalog else False,
+            "email": catalog.etransfer_email if catalog else None,
         }
 
-        location = db.query(Location).filter(
-            or_(Location.name == order.pickup_location, Location.id == order.pickup_location)
-        ).first()
+        location = _order_location(db, order)
         address = location.address if location else ""
 
         effective_price = float(order.total_price) / order.quantity
@@ -1157,6 +1623,7 @@ def admin_confirm_order(
             "email": order.email,
             "total_price": float(order.total_price),
             "price_per_item": effective_price,
+            "lines": order_line_dicts(order, load_order_lines(db, [order.id]).get(order.id, [])),
             "currency": CURRENCY,
             "address": address,
             "event_date": event_date,
@@ -1202,6 +1669,16 @@ def update_order_status(
     if body.status not in allowed:
         raise HTTPException(status_code=409, detail="Invalid status transition")
 
+    was_holding = order_holds_capacity(order.status)
+    if was_holding != order_holds_capacity(body.status):
+        slot = _order_slot(db, order)
+        if slot is not None:
+            if was_holding:
+                release_slot(db, slot, order.quantity)
+            else:
+                # A cancelled order marked picked up or no-show already used its food.
+                reserve_slot(db, slot, order.quantity, enforce=False)
+
     order.status = body.status
     db.commit()
     return {"success": True, "status": order.status}
@@ -1241,6 +1718,11 @@ def delete_order(
     order = db.query(Order).filter(Order.id == order_id).first()
     if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
+    if order_holds_capacity(order.status):
+        slot = _order_slot(db, order)
+        if slot is not None:
+            release_slot(db, slot, order.quantity)
+    delete_order_lines(db, [order.id])
     db.delete(order)
     db.commit()
     return {"success": True}
@@ -1250,17 +1732,38 @@ def delete_order(
 # Catering request endpoints
 # ---------------------------------------------------------------------------
 
+_CATERING_LIST_COLUMNS = (
+    CateringRequest.id,
+    CateringRequest.first_name,
+    CateringRequest.last_name,
+    CateringRequest.email,
+    CateringRequest.phone_number,
+    CateringRequest.event_date,
+    CateringRequest.guest_count,
+    CateringRequest.event_type,
+    CateringRequest.budget_range,
+    CateringRequest.special_requests,
+    CateringRequest.status,
+    CateringRequest.created_at,
+)
+
+
+_CATERING_LIST_QUERY = select(*_CATERING_LIST_COLUMNS).order_by(CateringRequest.created_at.desc())
+_CATERING_COMMENTS_QUERY = select(
+    CateringRequestComment.id,
+    CateringRequestComment.catering_request_id,
+    CateringRequestComment.body,
+    CateringRequestComment.created_at,
+).order_by(CateringRequestComment.created_at.desc())
+
+
 @router.get("/catering-requests")
 def admin_list_catering_requests(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: dict = Depends(verify_admin_token),
 ):
-    rows = db.query(CateringRequest).order_by(CateringRequest.created_at.desc()).all()
-    comments = (
-        db.query(CateringRequestComment)
-        .order_by(CateringRequestComment.created_at.desc())
-        .all()
-    )
+    rows = db.execute(_CATERING_LIST_QUERY).all()
+    comments = db.execute(_CATERING_COMMENTS_QUERY)
 
     comments_by_request_id: dict[str, list[dict]] = {}
     for comment in comments:
@@ -1273,8 +1776,11 @@ def admin_list_catering_requests(
         )
 
     items = []
+    status_counts = dict.fromkeys(("new", "in_review", "in_progress", "rejected", "done"), 0)
     for row in rows:
         normalized_status = "done" if row.status == "resolved" else row.status
+        if normalized_status in status_counts:
+            status_counts[normalized_status] += 1
         full_name = " ".join(
             part.strip()
             for part in [row.first_name, row.last_name]
@@ -1299,15 +1805,6 @@ def admin_list_catering_requests(
             }
         )
 
-    status_counts = {
-        status_key: sum(
-            1
-            for row in rows
-            if ("done" if row.status == "resolved" else row.status) == status_key
-        )
-        for status_key in ("new", "in_review", "in_progress", "rejected", "done")
-    }
-
     return {
         "total": len(rows),
         "status_counts": status_counts,
@@ -1393,14 +1890,14 @@ def add_catering_request_comment(
     if catering_request is None:
         raise HTTPException(status_code=404, detail="Catering request not found")
 
-    comment = CateringRequestComment(
+    comment = insert_returning(
+        db,
+        CateringRequestComment,
         id=str(uuid.uuid4()),
         catering_request_id=request_id,
         body=body.comment,
     )
-    db.add(comment)
     db.commit()
-    db.refresh(comment)
     return {
         "success": True,
         "comment": {
@@ -1415,23 +1912,47 @@ def add_catering_request_comment(
 # Feedback endpoints
 # ---------------------------------------------------------------------------
 
+_FEEDBACK_LIST_COLUMNS = (
+    Feedback.id,
+    Feedback.origin,
+    Feedback.feedback_type,
+    Feedback.order_id,
+    Feedback.name,
+    Feedback.contact,
+    Feedback.reason,
+    Feedback.other_details,
+    Feedback.message,
+    Feedback.created_at,
+    Feedback.status,
+    Feedback.admin_comment,
+)
+
+
+def _feedback_list_query(
+    *,
+    reason: Optional[str] = None,
+    origin: Optional[str] = None,
+    feedback_type: Optional[str] = None,
+) -> Select:
+    query = select(*_FEEDBACK_LIST_COLUMNS).order_by(Feedback.created_at.desc())
+    if reason:
+        query = query.where(Feedback.reason == reason)
+    if origin:
+        query = query.where(Feedback.origin == origin)
+    if feedback_type:
+        query = query.where(Feedback.feedback_type == feedback_type)
+    return query
+
+
 @router.get("/feedback")
 def admin_list_feedback(
     reason: Optional[str] = Query(None),
     origin: Optional[str] = Query(None),
     feedback_type: Optional[str] = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: dict = Depends(verify_admin_token),
 ):
-    query = db.query(Feedback).order_by(Feedback.created_at.desc())
-    if reason:
-        query = query.filter(Feedback.reason == reason)
-    if origin:
-        query = query.filter(Feedback.origin == origin)
-    if feedback_type:
-        query = query.filter(Feedback.feedback_type == feedback_type)
-
-    rows = query.all()
+    rows = db.execute(_feedback_list_query(reason=reason, origin=origin, feedback_type=feedback_type)).all()
 
     items = [
         {
@@ -1454,24 +1975,23 @@ def admin_list_feedback(
         for row in rows
     ]
 
-    all_rows = db.query(Feedback).all()
-    total = len(all_rows)
-
-    origin_counts = {
-        origin_key: sum(1 for row in all_rows if row.origin == origin_key)
-        for origin_key in FEEDBACK_ORIGIN_LABELS
-    }
-    type_counts = {
-        feedback_key: sum(1 for row in all_rows if row.feedback_type == feedback_key)
-        for feedback_key in FEEDBACK_TYPE_LABELS
-    }
-
+    # The metrics cover all feedback regardless of the filters, counted by the database.
+    total = 0
+    origin_counts = dict.fromkeys(FEEDBACK_ORIGIN_LABELS, 0)
+    type_counts = dict.fromkeys(FEEDBACK_TYPE_LABELS, 0)
     reason_counts: dict[str, int] = {}
-    for row in all_rows:
-        if row.origin != "events_page_non_customer":
-            continue
-        if row.reason:
-            reason_counts[row.reason] = reason_counts.get(row.reason, 0) + 1
+    grouped = db.execute(
+        select(Feedback.origin, Feedback.feedback_type, Feedback.reason, func.count())
+        .group_by(Feedback.origin, Feedback.feedback_type, Feedback.reason)
+    )
+    for row_origin, row_type, row_reason, count in grouped:
+        total += count
+        if row_origin in origin_counts:
+            origin_counts[row_origin] += count
+        if row_type in type_counts:
+            type_counts[row_type] += count
+        if row_origin == "events_page_non_customer" and row_reason:
+            reason_counts[row_reason] = reason_counts.get(row_reason, 0) + count
 
     pre_order_count = origin_counts["events_page_non_customer"]
     reason_metrics = [
@@ -1564,3 +2084,50 @@ def update_feedback_comment(
     fb.admin_comment = body.admin_comment
     db.commit()
     return {"success": True}
+
+
+# ---------------------------------------------------------------------------
+# Database pool metrics
+# ---------------------------------------------------------------------------
+
+@router.get("/db/pool")
+def admin_pool_metrics(
+    reset: bool = Query(False),
+    _: dict = Depends(verify_admin_token),
+):
+    """Connection pool occupancy and checkout waits of this worker's engines."""
+    pools = {"sync": engine.pool, "async": async_engine.sync_engine.pool}
+    if read_engine is not engine:
+        pools["read"] = read_engine.pool
+    metrics = {name: pool_status(pool) for name, pool in pools.items()}
+    if reset:
+        for pool in pools.values():
+            pool.wait_stats.reset()
+    return {
+        "pid": os.getpid(),
+        "pools": metrics,
+        "settings": {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+            "pre_ping": settings.db_pool_pre_ping,
+            "statement_timeout_ms": settings.db_statement_timeout_ms,
+        },
+    }
+
+
+@router.get("/db/slow-queries")
+def admin_list_slow_queries(_: dict = Depends(verify_admin_token)):
+    """Statements over the slow-query threshold on this worker, newest first."""
+    return {
+        "pid": os.getpid(),
+        "enabled": settings.slow_query_log_enabled,
+        "threshold_ms": settings.slow_query_threshold_ms,
+        "entries": slow_query_entries(),
+    }
+
+
+@router.delete("/db/slow-queries")
+def admin_clear_slow_queries(_: dict = Depends(verify_admin_token)):
+    return {"success": True, "cleared": clear_slow_queries()}
@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
-from database import get_db
+from database import get_async_db, insert_returning_async
 from models import CateringRequest
 from schemas import CateringRequestCreate, CateringRequestResponse
 
@@ -13,11 +13,13 @@ router = APIRouter(prefix="/api/catering-requests", tags=["catering"])
     response_model=CateringRequestResponse,
     status_code=status.HTTP_201_CREATED,
 )
-def create_catering_request(
-    request: CateringRequestCreate, db: Session = Depends(get_db)
+async def create_catering_request(
+    request: CateringRequestCreate, db: AsyncSession = Depends(get_async_db)
 ):
     try:
-        new_request = CateringRequest(
+        new_request = await insert_returning_async(
+            db,
+            CateringRequest,
             first_name=request.first_name,
             last_name=request.last_name,
             email=request.email,
@@ -26,14 +28,12 @@ def create_catering_request(
             guest_count=request.guest_count,
             event_type=request.event_type,
             budget_range=request.budget_range,
-            special_requests=request.special_requests
+            special_requests=request.special_requests,
         )
-        db.add(new_request)
-        db.commit()
-        db.refresh(new_request)
+        await db.commit()
         return CateringRequestResponse(success=True, request_id=new_request.id)
     except SQLAlchemyError as err:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500, detail="Database error occurred while processing catering request"
         ) from err
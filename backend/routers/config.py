@@ -1,16 +1,75 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from typing import Optional
 
-from database import get_db
-from event_config import NoActiveEventError, get_config_from_db
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import settings
+from database import get_async_db
+from event_config import get_config_snapshot
 
 router = APIRouter(prefix="/api/config", tags=["config"])
 
 
+def _etag_matches(if_none_match: Optional[str], etags: set[str]) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    # If-None-Match uses weak comparison, so W/ prefixes added by proxies still match.
+    return any(
+        candidate == "*" or candidate.removeprefix("W/") in etags
+        for candidate in candidates
+    )
+
+
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    # An explicit gzip entry wins over "*"; a q=0 entry refuses that coding.
+    qualities: dict[str, float] = {}
+    for part in (accept_encoding or "").split(","):
+        coding, *params = [value.strip() for value in part.split(";")]
+        coding = coding.lower()
+        if coding not in {"gzip", "*"}:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
 @router.get("")
-def get_event_config(db: Session = Depends(get_db)):
+async def get_event_config(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
     """Public endpoint: returns the current event configuration."""
-    try:
-        return get_config_from_db(db)
-    except NoActiveEventError:
+    # A cache hit never touches the session, so no connection is checked out.
+    snapshot = await db.run_sync(get_config_snapshot)
+    if snapshot.config is None:
         raise HTTPException(status_code=404, detail="no_active_event")
+
+    # The gzip body is a different representation, so it gets its own strong ETag.
+    gzip_etag = snapshot.etag[:-1] + '-gzip"'
+    use_gzip = snapshot.gzip_body is not None and _accepts_gzip(accept_encoding)
+    headers = {
+        "ETag": gzip_etag if use_gzip else snapshot.etag,
+        "Cache-Control": settings.config_cache_control,
+    }
+    if snapshot.gzip_body is not None:
+        headers["Vary"] = "Accept-Encoding"
+
+    if _etag_matches(if_none_match, {snapshot.etag, gzip_etag}):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=snapshot.gzip_body, media_type="application/json", headers=headers)
+    if snapshot.body is not None:
+        return Response(content=snapshot.body, media_type="application/json", headers=headers)
+    response.headers.update(headers)
+    return snapshot.config
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from database import get_db
+from database import get_async_db, insert_returning_async
 from models import Feedback
 from schemas import FeedbackCreate, FeedbackResponse, normalize_feedback_create
 
@@ -9,14 +9,12 @@ router = APIRouter(prefix="/api/feedback", tags=["feedback"])
 
 
 @router.post("", response_model=FeedbackResponse, status_code=201)
-def create_feedback(feedback_in: FeedbackCreate, db: Session = Depends(get_db)):
+async def create_feedback(feedback_in: FeedbackCreate, db: AsyncSession = Depends(get_async_db)):
     try:
         normalized = normalize_feedback_create(feedback_in)
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc))
 
-    feedback = Feedback(**normalized)
-    db.add(feedback)
-    db.commit()
-    db.refresh(feedback)
+    feedback = await insert_returning_async(db, Feedback, **normalized)
+    await db.commit()
     return FeedbackResponse(success=True, feedback_id=str(feedback.id))
@@ -1,82 +1,224 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from database import get_db
+from constants import OrderStatus
+from database import get_async_db
 from event_config import (
     CURRENCY,
     NoActiveEventError,
-    get_active_event_id_from_db,
-    get_item_from_db,
-    get_event_date_for_event_id_from_db,
-    get_etransfer_config_for_event_id_from_db,
+    get_active_catalog_index,
+)
+from idempotency import (
+    MAX_KEY_LENGTH,
+    IdempotencyKeyInProgressError,
+    IdempotencyKeyMismatchError,
+    claim_idempotency_key,
+    request_fingerprint,
+    store_idempotency_response,
 )
-from models import Order
+from order_lines import build_order_line, insert_order_lines, order_summary
 from schemas import OrderCreate, OrderResponse
+from services.order_queue import OrderQueueFullError, QueuedOrder, get_order_queue, insert_orders
+from slot_capacity import SlotFullError, SlotKey, reserve_slot
 
 router = APIRouter(prefix="/api/orders", tags=["orders"])
 
 
 @router.post("", response_model=OrderResponse, status_code=201)
-def create_order(order_in: OrderCreate, db: Session = Depends(get_db)):
+async def create_order(
+    order_in: OrderCreate,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    if idempotency_key is not None:
+        idempotency_key = idempotency_key.strip()
+        if not idempotency_key or len(idempotency_key) > MAX_KEY_LENGTH:
+            raise HTTPException(status_code=400, detail="Invalid Idempotency-Key header")
+
+    order_queue = get_order_queue()
+    if order_queue is None:
+        # The catalog helpers are sync ORM code; run_sync drives them on the async
+        # connection without blocking the event loop or taking a threadpool token.
+        return await db.run_sync(_create_order, order_in, idempotency_key, response)
+
+    values, lines, result, slot = await db.run_sync(_build_order, order_in)
+    # Hand the connection back while the writer commits the batch.
+    await db.close()
+    try:
+        future = order_queue.submit(
+            QueuedOrder(
+                values=values,
+                lines=lines,
+                response=result.model_dump(mode="json"),
+                idempotency_key=idempotency_key,
+                request_hash=_order_fingerprint(order_in) if idempotency_key is not None else None,
+                slot=slot,
+            )
+        )
+    except OrderQueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="We are receiving a lot of orders right now. Please try again in a moment.",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        stored, replayed = await asyncio.wrap_future(future)
+    except (IdempotencyKeyMismatchError, IdempotencyKeyInProgressError) as exc:
+        raise _idempotency_error(exc)
+    except SlotFullError:
+        raise _slot_full_error()
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return OrderResponse.model_validate(stored)
+
+
+def _order_fingerprint(order_in: OrderCreate) -> str:
+    return request_fingerprint(order_in.model_dump(mode="json"))
+
+
+def _idempotency_error(exc: RuntimeError) -> HTTPException:
+    if isinstance(exc, IdempotencyKeyMismatchError):
+        return HTTPException(
+            status_code=422,
+            detail="Idempotency-Key was already used for a different order",
+        )
+    return HTTPException(
+        status_code=409,
+        detail="An order with this Idempotency-Key is still being processed",
+    )
+
+
+def _slot_full_error() -> HTTPException:
+    return HTTPException(
+        status_code=409,
+        detail="This pickup time slot is full. Please choose another time.",
+    )
+
+
+def _create_order(
+    db: Session,
+    order_in: OrderCreate,
+    idempotency_key: Optional[str],
+    response: Response,
+) -> OrderResponse:
+    if idempotency_key is not None:
+        try:
+            replay = claim_idempotency_key(db, idempotency_key, _order_fingerprint(order_in))
+        except (IdempotencyKeyMismatchError, IdempotencyKeyInProgressError) as exc:
+            raise _idempotency_error(exc)
+        if replay is not None:
+            response.headers["Idempotent-Replayed"] = "true"
+            return OrderResponse.model_validate(replay)
+
+    values, lines, result, slot = _build_order(db, order_in)
+    try:
+        reserve_slot(db, slot, values["quantity"])
+    except SlotFullError:
+        raise _slot_full_error()
+    insert_orders(db, [values])
+    insert_order_lines(db, lines)
+    if idempotency_key is not None:
+        # Stored in the order's transaction so a replay always matches a committed order.
+        store_idempotency_response(db, idempotency_key, result.model_dump(mode="json"))
+    db.commit()
+    return result
+
+
+def _build_order(
+    db: Session, order_in: OrderCreate
+) -> tuple[dict, list[dict], OrderResponse, SlotKey]:
+    """Validate an order against the active event's cached catalog.
+
+    Returns the order's row values, its line rows, its response, and the
+    capacity slot it reserves. With a warm catalog index the only query is the
+    one-row ``catalog_version`` check that catches changes from other workers.
+    """
     try:
-        event_id = get_active_event_id_from_db(db)
+        catalog = get_active_catalog_index(db)
     except NoActiveEventError:
         raise HTTPException(status_code=404, detail="no_active_event")
 
-    item = get_item_from_db(db, order_in.item_id)
-    if item is None:
-        raise HTTPException(status_code=400, detail=f"Unknown item: {order_in.item_id}")
+    event_id = catalog.event_id
+    # The id and timestamp are generated here rather than at flush, so the response
+    # exists before the insert and queued rows can share one multi-row INSERT.
+    order_id = str(uuid.uuid4())
 
-    minimum_order_quantity = max(1, int(getattr(item, "minimum_order_quantity", 1) or 1))
-    if order_in.quantity < minimum_order_quantity:
+    lines = []
+    for line_number, line_in in enumerate(order_in.order_lines):
+        item = catalog.get_item(line_in.item_id)
+        if item is None:
+            raise HTTPException(status_code=400, detail=f"Unknown item: {line_in.item_id}")
+        if line_in.quantity < item.minimum_order_quantity:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Minimum order quantity for {item.name} is {item.minimum_order_quantity}",
+            )
+        effective_price = item.discounted_price if item.discounted_price is not None else item.price
+        lines.append(build_order_line(order_id, line_number, item, line_in.quantity, effective_price))
+
+    location = catalog.find_location(order_in.pickup_location)
+    if location is None:
+        raise HTTPException(status_code=400, detail=f"Unknown pickup location: {order_in.pickup_location}")
+    if order_in.pickup_time_slot not in location.time_slots:
         raise HTTPException(
             status_code=400,
-            detail=f"Minimum order quantity for {item.name} is {minimum_order_quantity}",
+            detail=f"Unknown pickup time slot for {location.name}: {order_in.pickup_time_slot}",
         )
+    slot = SlotKey(event_id, location.id, order_in.pickup_time_slot)
 
-    effective_price = float(item.discounted_price) if item.discounted_price is not None else float(item.price)
-    total_price = round(order_in.quantity * effective_price, 2)
-
-    order = Order(
-        event_id=event_id,
-        name=order_in.name,
-        item_id=item.id,
-        item_name=item.name,
-        quantity=order_in.quantity,
-        pickup_location=order_in.pickup_location,
-        pickup_time_slot=order_in.pickup_time_slot,
-        phone_number=order_in.phone_number,
-        email=order_in.email,
-        total_price=total_price,
-    )
-
-    db.add(order)
-    db.commit()
-    db.refresh(order)
+    values = {
+        "id": order_id,
+        "event_id": event_id,
+        "name": order_in.name,
+        **order_summary(lines),
+        "pickup_location": order_in.pickup_location,
+        "pickup_time_slot": order_in.pickup_time_slot,
+        "phone_number": order_in.phone_number,
+        "email": order_in.email,
+        "status": OrderStatus.PENDING,
+        "created_at": datetime.now(timezone.utc),
+    }
 
-    event_date = get_event_date_for_event_id_from_db(db, event_id)
-    etransfer = get_etransfer_config_for_event_id_from_db(db, event_id)
     order_data = {
         "event_id": event_id,
-        "name": order.name,
-        "item_id": order.item_id,
-        "item_name": order.item_name,
-        "quantity": order.quantity,
-        "pickup_location": order.pickup_location,
-        "pickup_time_slot": order.pickup_time_slot,
-        "phone_number": order.phone_number,
-        "email": order.email,
-        "total_price": float(order.total_price),
-        "price_per_item": effective_price,
+        "name": values["name"],
+        "item_id": values["item_id"],
+        "item_name": values["item_name"],
+        "quantity": values["quantity"],
+        "pickup_location": values["pickup_location"],
+        "pickup_time_slot": values["pickup_time_slot"],
+        "phone_number": values["phone_number"],
+        "email": values["email"],
+        "total_price": float(values["total_price"]),
+        # Kept for single-item clients; multi-item orders price each line.
+        "price_per_item": lines[0]["unit_price"],
+        "lines": [
+            {
+                "item_id": line["item_id"],
+                "item_name": line["item_name"],
+                "quantity": line["quantity"],
+                "price_per_item": line["unit_price"],
+                "total_price": line["total_price"],
+            }
+            for line in lines
+        ],
         "currency": CURRENCY,
-        "event_date": event_date,
-        "etransfer_enabled": etransfer["enabled"],
-        "etransfer_email": etransfer["email"],
+        "event_date": catalog.event_date,
+        "etransfer_enabled": catalog.etransfer_enabled,
+        "etransfer_email": catalog.etransfer_email,
     }
 
-    return OrderResponse(
+    response = OrderResponse(
         success=True,
-        order_id=str(order.id),
+        order_id=order_id,
         message="Your pre-order has been placed! We will send a confirmation email once we verify your order.",
         order=order_data,
     )
+    return values, lines, response, slot
@@ -1,16 +1,31 @@
+import re
+from datetime import date, datetime
 from typing import Optional
 
 from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 
 
-class OrderCreate(BaseModel):
-    name: str
+MAX_ORDER_LINES = 20
+
+# Display formats accepted for ``events.event_date``, after ordinal suffixes are removed.
+_EVENT_DATE_FORMATS = ("%B %d, %Y", "%B %d %Y", "%b %d, %Y", "%b %d %Y", "%A, %B %d, %Y", "%d %B %Y", "%Y-%m-%d")
+_ORDINAL_SUFFIX = re.compile(r"(?<=\d)(st|nd|rd|th)\b", re.IGNORECASE)
+
+
+def parse_event_date(value: str) -> Optional[date]:
+    """Read a display date such as "February 28th, 2026"; None if it is not one."""
+    cleaned = " ".join(_ORDINAL_SUFFIX.sub("", value.replace(".", "")).split())
+    for fmt in _EVENT_DATE_FORMATS:
+        try:
+            return datetime.strptime(cleaned, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+class OrderLineCreate(BaseModel):
     item_id: str
     quantity: int
-    pickup_location: str
-    pickup_time_slot: str
-    phone_number: Optional[str] = None
-    email: EmailStr
 
     @field_validator("quantity")
     @classmethod
@@ -19,7 +34,62 @@ class OrderCreate(BaseModel):
             raise ValueError("Quantity must be at least 1")
         return v
 
-    @field_validator("name", "item_id", "pickup_location", "pickup_time_slot")
+    @field_validator("item_id")
+    @classmethod
+    def must_not_be_empty(cls, v: str) -> str:
+        if not v.strip():
+            raise ValueError("Field cannot be empty")
+        return v.strip()
+
+
+class OrderLinesInput(BaseModel):
+    """Either a single ``item_id`` and ``quantity`` or a list of ``lines``."""
+
+    item_id: Optional[str] = None
+    quantity: Optional[int] = None
+    lines: list[OrderLineCreate] = Field(default_factory=list, max_length=MAX_ORDER_LINES)
+
+    @field_validator("quantity")
+    @classmethod
+    def quantity_must_be_positive(cls, v: Optional[int]) -> Optional[int]:
+        if v is not None and v < 1:
+            raise ValueError("Quantity must be at least 1")
+        return v
+
+    @field_validator("item_id")
+    @classmethod
+    def item_id_not_empty(cls, v: Optional[str]) -> Optional[str]:
+        if v is not None and not v.strip():
+            raise ValueError("Field cannot be empty")
+        return v.strip() if v is not None else None
+
+    @model_validator(mode="after")
+    def single_item_or_lines(self) -> "OrderLinesInput":
+        if self.lines:
+            if self.item_id is not None or self.quantity is not None:
+                raise ValueError("Send either item_id and quantity or lines, not both")
+            item_ids = [line.item_id for line in self.lines]
+            if len(set(item_ids)) != len(item_ids):
+                raise ValueError("Each item can only appear once per order")
+        elif self.item_id is None or self.quantity is None:
+            raise ValueError("item_id and quantity are required unless lines are given")
+        return self
+
+    @property
+    def order_lines(self) -> list[OrderLineCreate]:
+        if self.lines:
+            return self.lines
+        return [OrderLineCreate(item_id=self.item_id, quantity=self.quantity)]
+
+
+class OrderCreate(OrderLinesInput):
+    name: str
+    pickup_location: str
+    pickup_time_slot: str
+    phone_number: Optional[str] = None
+    email: EmailStr
+
+    @field_validator("name", "pickup_location", "pickup_time_slot")
     @classmethod
     def must_not_be_empty(cls, v: str) -> str:
         if not v.strip():
@@ -105,6 +175,8 @@ class LocationResponse(BaseModel):
 class EventBase(BaseModel):
     name: str
     event_date: str
+    # When omitted, the admin router parses it from a new or changed event_date.
+    event_on: Optional[date] = None
     hero_header: str
     hero_header_sage: str = ""
     hero_subheader: str = ""
@@ -11,7 +11,7 @@ import uuid
 from datetime import datetime, timezone, timedelta
 
 from database import SessionLocal
-from models import Event, Order
+from models import Event, Order, OrderLine
 from constants import OrderStatus
 
 SEED_ORDERS = [
@@ -142,6 +142,7 @@ def main() -> None:
         existing = db.query(Order).count()
         if existing > 0:
             print(f"Deleting {existing} existing order(s)...")
+            db.query(OrderLine).delete()
             db.query(Order).delete()
             db.commit()
 
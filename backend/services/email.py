@@ -1,6 +1,7 @@
 import resend
 from config import settings
 from event_config import CURRENCY
+from request_timing import time_email
 
 resend.api_key = settings.resend_api_key
 
@@ -38,6 +39,36 @@ def _build_etransfer_section_html(order_data: dict, *, reminder: bool = False) -
 """
 
 
+def _summary_row_html(label: str, value: str) -> str:
+    return f"""                      <tr>
+                        <td style="font-size:14px;color:#4a4a4a;padding:6px 0;">{label}</td>
+                        <td style="font-size:14px;color:#1C1C1A;font-weight:600;text-align:right;padding:6px 0;">{value}</td>
+                      </tr>
+"""
+
+
+def _build_line_rows_html(order_data: dict, currency: str) -> str:
+    """Item rows of the order summary: item and unit price for one line, one row per line otherwise."""
+    lines = order_data.get("lines") or [
+        {
+            "item_name": order_data["item_name"],
+            "quantity": order_data["quantity"],
+            "price_per_item": order_data["price_per_item"],
+            "total_price": order_data["total_price"],
+        }
+    ]
+    if len(lines) == 1:
+        line = lines[0]
+        return (
+            _summary_row_html("Item", f"{line['item_name']} x {line['quantity']}")
+            + _summary_row_html("Price per item", f"{currency} ${line['price_per_item']:.2f}")
+        )
+    return "".join(
+        _summary_row_html(f"{line['item_name']} x {line['quantity']}", f"{currency} ${line['total_price']:.2f}")
+        for line in lines
+    )
+
+
 def send_confirmation(order_data: dict) -> None:
     if not settings.email_enabled:
         print("[email] Email delivery disabled by EMAIL_ENABLED=false")
@@ -45,12 +76,11 @@ def send_confirmation(order_data: dict) -> None:
 
     name = order_data["name"]
     item_name = order_data["item_name"]
-    quantity = order_data["quantity"]
     pickup_location = order_data["pickup_location"]
     pickup_time_slot = order_data["pickup_time_slot"]
     total_price = order_data["total_price"]
-    price_per_item = order_data["price_per_item"]
     currency = order_data.get("currency") or CURRENCY
+    line_rows_html = _build_line_rows_html(order_data, currency)
     email = order_data["email"]
     address = order_data.get("address", "")
     event_date = order_data.get("event_date", "")
@@ -101,15 +131,7 @@ def send_confirmation(order_data: dict) -> None:
                 <tr>
                   <td style="padding:20px 24px;">
                     <table width="100%" cellpadding="0" cellspacing="0">
-                      <tr>
-                        <td style="font-size:14px;color:#4a4a4a;padding:6px 0;">Item</td>
-                        <td style="font-size:14px;color:#1C1C1A;font-weight:600;text-align:right;padding:6px 0;">{item_name} x {quantity}</td>
-                      </tr>
-                      <tr>
-                        <td style="font-size:14px;color:#4a4a4a;padding:6px 0;">Price per item</td>
-                        <td style="font-size:14px;color:#1C1C1A;font-weight:600;text-align:right;padding:6px 0;">{currency} ${price_per_item:.2f}</td>
-                      </tr>
-                      <tr>
+{line_rows_html}                      <tr>
                         <td style="font-size:14px;color:#4a4a4a;padding:6px 0;">Pickup Date</td>
                         <td style="font-size:14px;color:#1C1C1A;font-weight:600;text-align:right;padding:6px 0;">{event_date}</td>
                       </tr>
@@ -166,7 +188,8 @@ def send_confirmation(order_data: dict) -> None:
     if settings.reply_to_email:
         message_payload["reply_to"] = settings.reply_to_email
 
-    resend.Emails.send(message_payload)
+    with time_email():
+        resend.Emails.send(message_payload)
 
 
 def send_reminder(order_data: dict) -> None:
@@ -176,12 +199,11 @@ def send_reminder(order_data: dict) -> None:
 
     name = order_data["name"]
     item_name = order_data["item_name"]
-    quantity = order_data["quantity"]
     pickup_location = order_data["pickup_location"]
     pickup_time_slot = order_data["pickup_time_slot"]
     total_price = order_data["total_price"]
-    price_per_item = order_data["price_per_item"]
     currency = order_data.get("currency") or CURRENCY
+    line_rows_html = _build_line_rows_html(order_data, currency)
     email = order_data["email"]
     address = order_data.get("address", "")
     event_date = order_data.get("event_date", "")
@@ -232,15 +254,7 @@ def send_reminder(order_data: dict) -> None:
                 <tr>
                   <td style="padding:20px 24px;">
                     <table width="100%" cellpadding="0" cellspacing="0">
-                      <tr>
-                        <td style="font-size:14px;color:#4a4a4a;padding:6px 0;">Item</td>
-                        <td style="font-size:14px;color:#1C1C1A;font-weight:600;text-align:right;padding:6px 0;">{item_name} x {quantity}</td>
-                      </tr>
-                      <tr>
-                        <td style="font-size:14px;color:#4a4a4a;padding:6px 0;">Price per item</td>
-                        <td style="font-size:14px;color:#1C1C1A;font-weight:600;text-align:right;padding:6px 0;">{currency} ${price_per_item:.2f}</td>
-                      </tr>
-                      <tr>
+{line_rows_html}                      <tr>
                         <td style="font-size:14px;color:#4a4a4a;padding:6px 0;">Pickup Date</td>
                         <td style="font-size:14px;color:#1C1C1A;font-weight:600;text-align:right;padding:6px 0;">{event_date}</td>
                       </tr>
@@ -297,4 +311,5 @@ def send_reminder(order_data: dict) -> None:
     if settings.reply_to_email:
         message_payload["reply_to"] = settings.reply_to_email
 
-    resend.Emails.send(message_payload)
+    with time_email():
+        resend.Emails.send(message_payload)
@@ -0,0 +1,272 @@
+"""Group-commit writer for public orders.
+
+With ``ORDER_QUEUE_ENABLED`` the order endpoint validates a request, then hands
+the ready-to-insert row to this queue instead of committing on its own. A single
+writer thread drains the queue in batches of up to ``order_queue_max_batch``
+rows, or whatever arrived within ``order_queue_max_delay_ms`` of the first one,
+and writes each batch with one INSERT for the orders, one for their lines and
+one commit. Idempotency keys in the batch are claimed and stored in the same
+transaction. Each request waits on a future that resolves once its batch commits.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import SessionLocal
+from idempotency import (
+    IdempotencyKeyMismatchError,
+    claim_idempotency_keys,
+    release_idempotency_keys,
+    store_idempotency_responses,
+)
+from models import Order
+from order_lines import insert_order_lines
+from slot_capacity import SlotKey, reserve_slots
+
+
+_ORDER_COLUMNS = list(Order.__table__.columns)
+# One array parameter per column keeps the statement the same size for any batch;
+# a multi-row VALUES list grows with the batch and is slow to bind with pg8000.
+_INSERT_ORDERS_SQL = text(
+    "INSERT INTO orders ({columns}) SELECT * FROM unnest({arrays})".format(
+        columns=", ".join(column.name for column in _ORDER_COLUMNS),
+        arrays=", ".join(
+            f"CAST(:{column.key} AS {column.type.compile(dialect=postgresql.dialect())}[])"
+            for column in _ORDER_COLUMNS
+        ),
+    )
+)
+
+
+def insert_orders(db: Session, rows: list[dict]) -> None:
+    """Insert order rows with one statement; omitted columns take their scalar defaults."""
+    params = {}
+    for column in _ORDER_COLUMNS:
+        default = column.default.arg if column.default is not None and column.default.is_scalar else None
+        params[column.key] = [row.get(column.key, default) for row in rows]
+    db.execute(_INSERT_ORDERS_SQL, params)
+
+
+class OrderQueueFullError(RuntimeError):
+    """The queue already holds ``order_queue_max_pending`` orders."""
+
+
+@dataclass
+class QueuedOrder:
+    values: dict
+    response: dict
+    lines: list[dict] = field(default_factory=list)
+    idempotency_key: Optional[str] = None
+    request_hash: Optional[str] = None
+    slot: Optional[SlotKey] = None
+    # Resolves to (response, replayed) once the batch commits.
+    future: Future = field(default_factory=Future)
+
+
+class OrderWriteQueue:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_batch: int,
+        max_delay_seconds: float,
+        max_pending: int,
+    ):
+        self._session_factory = session_factory
+        self._max_batch = max(1, max_batch)
+        self._max_delay_seconds = max_delay_seconds
+        self._queue: "queue.Queue[QueuedOrder]" = queue.Queue(maxsize=max(1, max_pending))
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="order-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop accepting work once everything already queued is written."""
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def submit(self, pending: QueuedOrder) -> Future:
+        if self._thread is None or self._stop_event.is_set():
+            raise RuntimeError("Order writer is not running")
+        try:
+            self._queue.put_nowait(pending)
+        except queue.Full:
+            raise OrderQueueFullError() from None
+        return pending.future
+
+    def _run(self) -> None:
+        while not (self._stop_event.is_set() and self._queue.empty()):
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            batch = [first]
+            deadline = time.monotonic() + self._max_delay_seconds
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self._queue.get(timeout=remaining))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: list[QueuedOrder]) -> None:
+        # Requests that gave up (client disconnected) are not written.
+        batch = [
+            pending
+            for pending in batch
+            if pending.future.running() or pending.future.set_running_or_notify_cancel()
+        ]
+        if not batch:
+            return
+        try:
+            results = self._write(batch)
+        except Exception as exc:
+            if len(batch) > 1:
+                # Isolate the failing row so the rest of the batch still commits.
+                print(f"[orders] Batch of {len(batch)} failed, retrying rows individually: {exc}")
+                for pending in batch:
+                    self._flush([pending])
+                return
+            print(f"[orders] Failed to write queued order: {exc}")
+            batch[0].future.set_exception(exc)
+            return
+        for pending, result in zip(batch, results):
+            if isinstance(result, BaseException):
+                pending.future.set_exception(result)
+            else:
+                pending.future.set_result(result)
+
+    def _write(self, batch: list[QueuedOrder]) -> list:
+        """Write one batch in one transaction; returns each order's outcome."""
+        db = self._session_factory()
+        try:
+            # A key repeated within the batch is claimed once, by its first order.
+            request_hashes: dict[str, str] = {}
+            for pending in batch:
+                if pending.idempotency_key is not None:
+                    request_hashes.setdefault(pending.idempotency_key, pending.request_hash)
+            claims = claim_idempotency_keys(db, request_hashes) if request_hashes else {}
+
+            results: list = []
+            to_insert: list[int] = []
+            first_outcomes: dict[str, object] = {}
+            for index, pending in enumerate(batch):
+                key = pending.idempotency_key
+                if key is None:
+                    to_insert.append(index)
+                    results.append((pending.response, False))
+                    continue
+                if key in first_outcomes:
+                    results.append(None)  # Resolved from the key's first order below.
+                    continue
+                claim = claims[key]
+                if isinstance(claim, RuntimeError):
+                    outcome = claim
+                elif claim is not None:
+                    outcome = (claim, True)
+                else:
+                    to_insert.append(index)
+                    outcome = (pending.response, False)
+                first_outcomes[key] = outcome
+                results.append(outcome)
+
+            # Capacity is reserved per slot for the whole batch; orders that no
+            # longer fit are rejected and give their idempotency key back.
+            limited = [index for index in to_insert if batch[index].slot is not None]
+            slot_errors = reserve_slots(
+                db,
+                [(batch[index].slot, batch[index].values["quantity"]) for index in limited],
+            )
+            rejected: set[int] = set()
+            released: list[str] = []
+            for index, error in zip(limited, slot_errors):
+                if error is None:
+                    continue
+                rejected.add(index)
+                results[index] = error
+                pending = batch[index]
+                if pending.idempotency_key is not None:
+                    first_outcomes[pending.idempotency_key] = results[index]
+                    released.append(pending.idempotency_key)
+            release_idempotency_keys(db, released)
+
+            for index, pending in enumerate(batch):
+                if results[index] is not None:
+                    continue
+                key = pending.idempotency_key
+                first = first_outcomes[key]
+                if pending.request_hash != request_hashes[key]:
+                    results[index] = IdempotencyKeyMismatchError(key)
+                elif isinstance(first, BaseException):
+                    results[index] = first
+                else:
+                    results[index] = (first[0], True)
+
+            written = [index for index in to_insert if index not in rejected]
+            rows = [batch[index].values for index in written]
+            stored = {
+                batch[index].idempotency_key: batch[index].response
+                for index in written
+                if batch[index].idempotency_key is not None
+            }
+            if rows:
+                insert_orders(db, rows)
+                insert_order_lines(db, [line for index in written for line in batch[index].lines])
+            store_idempotency_responses(db, stored)
+            db.commit()
+            return results
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+_order_queue: Optional[OrderWriteQueue] = None
+
+
+def get_order_queue() -> Optional[OrderWriteQueue]:
+    """The running writer, or None when orders commit per request."""
+    return _order_queue
+
+
+def start_order_queue() -> None:
+    global _order_queue
+    if not settings.order_queue_enabled or _order_queue is not None:
+        return
+    _order_queue = OrderWriteQueue(
+        SessionLocal,
+        max_batch=settings.order_queue_max_batch,
+        max_delay_seconds=settings.order_queue_max_delay_ms / 1000,
+        max_pending=settings.order_queue_max_pending,
+    )
+    _order_queue.start()
+
+
+def stop_order_queue() -> None:
+    global _order_queue
+    if _order_queue is None:
+        return
+    _order_queue.stop()
+    _order_queue = None
@@ -0,0 +1,120 @@
+"""Per time-slot pickup capacity.
+
+Capacity is tracked in ``slot_capacities`` rows keyed by event, location id and
+time slot; a slot without a row is unlimited. Each row keeps a running
+``reserved`` total of the quantities of its non-cancelled orders, so placing an
+order is one conditional row update instead of counting orders. Concurrent
+reservations for the same slot serialize on that row lock only.
+"""
+
+from typing import Iterable, NamedTuple, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from constants import OrderStatus
+
+
+class SlotKey(NamedTuple):
+    event_id: int
+    location_id: str
+    time_slot: str
+
+
+class SlotFullError(RuntimeError):
+    def __init__(self, slot: SlotKey, capacity: int, reserved: int):
+        super().__init__(f"Slot {slot.time_slot} at {slot.location_id} is full ({reserved}/{capacity})")
+        self.slot = slot
+        self.capacity = capacity
+        self.reserved = reserved
+
+
+def order_holds_capacity(status: str) -> bool:
+    return status != OrderStatus.CANCELLED
+
+
+_SLOT_WHERE = "event_id = :event_id AND location_id = :location_id AND time_slot = :time_slot"
+
+# Reports ok=TRUE when the update applied, ok=FALSE when the slot is full, and no
+# row at all when the slot has no capacity limit.
+_RESERVE_SQL = text(
+    f"""
+    WITH reserved AS (
+        UPDATE slot_capacities
+        SET reserved = reserved + :quantity
+        WHERE {_SLOT_WHERE} AND reserved + :quantity <= capacity
+        RETURNING capacity, reserved
+    )
+    SELECT TRUE AS ok, capacity, reserved FROM reserved
+    UNION ALL
+    SELECT FALSE AS ok, capacity, reserved FROM slot_capacities
+    WHERE {_SLOT_WHERE} AND NOT EXISTS (SELECT 1 FROM reserved)
+    """
+)
+
+_ADD_SQL = text(f"UPDATE slot_capacities SET reserved = reserved + :quantity WHERE {_SLOT_WHERE}")
+
+_RELEASE_SQL = text(
+    f"UPDATE slot_capacities SET reserved = GREATEST(reserved - :quantity, 0) WHERE {_SLOT_WHERE}"
+)
+
+
+def _params(slot: SlotKey, quantity: int) -> dict:
+    return {
+        "event_id": slot.event_id,
+        "location_id": slot.location_id,
+        "time_slot": slot.time_slot,
+        "quantity": quantity,
+    }
+
+
+def reserve_slot(db: Session, slot: SlotKey, quantity: int, *, enforce: bool = True) -> None:
+    """Add ``quantity`` to the slot in the session's transaction.
+
+    Raises ``SlotFullError`` when the slot has a capacity and it would be
+    exceeded. With ``enforce=False`` the quantity is added regardless, for admin
+    corrections that reflect orders already handed out.
+    """
+    if not enforce:
+        db.execute(_ADD_SQL, _params(slot, quantity))
+        return
+    row = db.execute(_RESERVE_SQL, _params(slot, quantity)).first()
+    if row is not None and not row.ok:
+        raise SlotFullError(slot, int(row.capacity), int(row.reserved))
+
+
+def release_slot(db: Session, slot: SlotKey, quantity: int) -> None:
+    db.execute(_RELEASE_SQL, _params(slot, quantity))
+
+
+def reserve_slots(
+    db: Session, requests: Iterable[tuple[SlotKey, int]]
+) -> list[Optional[SlotFullError]]:
+    """Reserve several (slot, quantity) pairs.
+
+    Returns None for each request that fit and its ``SlotFullError`` otherwise.
+    Quantities for the same slot are first reserved together in one update and
+    only fall back to one update per request when the total does not fit. Slots
+    are locked in sorted order so concurrent batches cannot deadlock each other.
+    """
+    requests = list(requests)
+    errors: list[Optional[SlotFullError]] = [None] * len(requests)
+    by_slot: dict[SlotKey, list[int]] = {}
+    for index, (slot, _) in enumerate(requests):
+        by_slot.setdefault(slot, []).append(index)
+
+    for slot in sorted(by_slot):
+        indexes = by_slot[slot]
+        try:
+            reserve_slot(db, slot, sum(requests[index][1] for index in indexes))
+            continue
+        except SlotFullError as exc:
+            if len(indexes) == 1:
+                errors[indexes[0]] = exc
+                continue
+        for index in indexes:
+            try:
+                reserve_slot(db, slot, requests[index][1])
+            except SlotFullError as exc:
+                errors[index] = exc
+    return errors
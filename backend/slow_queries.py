@@ -0,0 +1,157 @@
+"""Opt-in slow-query log with captured plans.
+
+With ``SLOW_QUERY_LOG_ENABLED``, every statement on the sync engines that takes
+longer than ``slow_query_threshold_ms`` is kept in a ring buffer of the last
+``slow_query_buffer_size`` entries: its SQL, its parameters with anything that
+could be personal data redacted, and an ``EXPLAIN (FORMAT JSON)`` plan. Plans
+are captured by a background thread on a connection of its own, so the request
+that ran the statement does not wait for them, and never with ANALYZE, so the
+statement is not run a second time. ``GET /api/admin/db/slow-queries`` returns
+the buffer.
+"""
+
+import collections
+import itertools
+import json
+import queue
+import re
+import threading
+import time
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import create_engine, event, pool
+from sqlalchemy.engine import URL, Engine
+
+from config import settings
+
+_MAX_STATEMENT_LENGTH = 10_000
+_MAX_LIST_PARAMETERS = 10
+# A plan is reused for the same statement for this long rather than explained again.
+_PLAN_REUSE_SECONDS = 60.0
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH|INSERT|UPDATE|DELETE)\b", re.IGNORECASE)
+_UUID = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.IGNORECASE)
+
+_ids = itertools.count(1)
+_entries_lock = threading.Lock()
+_entries: collections.deque = collections.deque(maxlen=max(1, settings.slow_query_buffer_size))
+_explain_queue: "queue.Queue[tuple[dict, URL, str, object]]" = queue.Queue(maxsize=100)
+_explainer: Optional[threading.Thread] = None
+_explainer_lock = threading.Lock()
+
+
+def _redact(value):
+    """Keep what helps reading a plan (numbers, flags, ids, dates) and mask free text."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, (Decimal, date, datetime)):
+        return str(value)
+    if isinstance(value, str):
+        return value if _UUID.match(value) else f"<redacted {len(value)} chars>"
+    if isinstance(value, (list, tuple)):
+        redacted = [_redact(item) for item in value[:_MAX_LIST_PARAMETERS]]
+        if len(value) > _MAX_LIST_PARAMETERS:
+            redacted.append(f"<{len(value) - _MAX_LIST_PARAMETERS} more>")
+        return redacted
+    if isinstance(value, dict):
+        return {key: _redact(item) for key, item in value.items()}
+    return f"<redacted {type(value).__name__}>"
+
+
+def _before_cursor_execute(_conn, _cursor, _statement, _parameters, context, _executemany):
+    # Kept on the statement's context so a statement that raises leaves nothing behind.
+    if context is not None:
+        context.slow_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, _cursor, statement, parameters, context, executemany):
+    start = getattr(context, "slow_query_start", None)
+    if start is None:
+        return
+    duration_ms = (time.perf_counter() - start) * 1000
+    if duration_ms < settings.slow_query_threshold_ms:
+        return
+    entry = {
+        "id": next(_ids),
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "duration_ms": round(duration_ms, 2),
+        "statement": statement[:_MAX_STATEMENT_LENGTH],
+        "parameters": _redact(parameters),
+        "plan": None,
+        "explain_error": None,
+    }
+    with _entries_lock:
+        _entries.append(entry)
+    if not settings.slow_query_explain:
+        return
+    if executemany or not _EXPLAINABLE.match(statement):
+        entry["explain_error"] = "Statement not explained"
+        return
+    try:
+        _explain_queue.put_nowait((entry, conn.engine.url, statement, parameters))
+    except queue.Full:
+        entry["explain_error"] = "Explain queue full"
+        return
+    _start_explainer()
+
+
+def record_slow_queries(sync_engine: Engine) -> None:
+    if not settings.slow_query_log_enabled:
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _start_explainer() -> None:
+    global _explainer
+    with _explainer_lock:
+        if _explainer is None:
+            _explainer = threading.Thread(target=_explain_loop, name="slow-query-explain", daemon=True)
+            _explainer.start()
+
+
+def _explain_loop() -> None:
+    # One engine per database URL, on the same driver so the statement's
+    # parameter style is understood as-is. These engines carry no listeners.
+    engines: dict[str, Engine] = {}
+    plans: dict[str, tuple[float, object]] = {}
+    while True:
+        entry, url, statement, parameters = _explain_queue.get()
+        reused = plans.get(statement)
+        if reused is not None and time.monotonic() - reused[0] < _PLAN_REUSE_SECONDS:
+            entry["plan"] = reused[1]
+            continue
+        key = url.render_as_string(hide_password=False)
+        engine = engines.get(key)
+        if engine is None:
+            engine = engines[key] = create_engine(url, poolclass=pool.NullPool)
+        try:
+            raw = engine.raw_connection()
+            try:
+                cursor = raw.cursor()
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                plan = cursor.fetchone()[0]
+                cursor.close()
+                raw.rollback()
+            finally:
+                raw.close()
+            entry["plan"] = json.loads(plan) if isinstance(plan, str) else plan
+            plans[statement] = (time.monotonic(), entry["plan"])
+            if len(plans) > 500:
+                plans.clear()
+        except Exception as exc:
+            entry["explain_error"] = str(exc)[:500]
+
+
+def slow_query_entries() -> list[dict]:
+    """Recorded slow statements, newest first."""
+    with _entries_lock:
+        return [dict(entry) for entry in reversed(_entries)]
+
+
+def clear_slow_queries() -> int:
+    with _entries_lock:
+        cleared = len(_entries)
+        _entries.clear()
+    return cleared
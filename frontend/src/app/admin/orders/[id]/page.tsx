@@ -15,6 +15,14 @@ import {
   type OrderLineItem,
 } from "@/lib/orderLineUtils";
 
+interface OrderLine {
+  item_id: string;
+  item_name: string;
+  quantity: number;
+  price_per_item: number;
+  total_price: number;
+}
+
 interface Order {
   id: string;
   event_id: number;
@@ -35,6 +43,17 @@ interface Order {
   notes?: string | null;
   exclude_email?: boolean;
   created_at: string;
+  lines?: OrderLine[];
+}
+
+// One line of one order in the edit scope; an order can hold several items.
+interface EditLineRow {
+  id: string;
+  order_id: string;
+  item_id: string;
+  item_name: string;
+  quantity: number;
+  total_price: number;
 }
 
 interface AdminEvent {
@@ -338,6 +357,23 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
     return [order, ...scoped];
   }, [order, siblingOrders]);
 
+  const editScopeLines = useMemo<EditLineRow[]>(
+    () =>
+      editScopeOrders.flatMap((row) => {
+        const lines: Array<Pick<OrderLine, "item_id" | "item_name" | "quantity" | "total_price">> =
+          row.lines && row.lines.length > 0 ? row.lines : [row];
+        return lines.map((line, index) => ({
+          id: `${row.id}:${index}`,
+          order_id: row.id,
+          item_id: line.item_id,
+          item_name: line.item_name,
+          quantity: line.quantity,
+          total_price: line.total_price,
+        }));
+      }),
+    [editScopeOrders]
+  );
+
   const editEventItems = useMemo<OrderLineItem[]>(
     () => (eventConfig?.items ?? []).map((item) => ({ ...item, is_locked: false })),
     [eventConfig]
@@ -345,13 +381,13 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
 
   const editLegacyItems = useMemo<OrderLineItem[]>(() => {
     const knownItemIds = new Set(editEventItems.map((item) => item.id));
-    return buildLegacyItemsFromOrders(editScopeOrders, knownItemIds);
-  }, [editEventItems, editScopeOrders]);
+    return buildLegacyItemsFromOrders(editScopeLines, knownItemIds);
+  }, [editEventItems, editScopeLines]);
 
   const duplicateEditableRowItems = useMemo<OrderLineItem[]>(() => {
     const catalogById = new Map(editEventItems.map((item) => [item.id, item] as const));
     const lockedItemIds = new Set(editLegacyItems.map((item) => item.id));
-    const editableRows = editScopeOrders.filter((row) => !lockedItemIds.has(row.item_id));
+    const editableRows = editScopeLines.filter((row) => !lockedItemIds.has(row.item_id));
 
     const rowCountByItemId: Record<string, number> = {};
     for (const row of editableRows) {
@@ -383,21 +419,21 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
         discounted_price: null,
         is_locked: false,
         source_item_id: base.id,
-        source_order_id: row.id,
+        source_line_id: row.id,
       });
     }
 
     return rowItems;
-  }, [editEventItems, editLegacyItems, editScopeOrders]);
+  }, [editEventItems, editLegacyItems, editScopeLines]);
 
-  const duplicatePickerIdByOrderId = useMemo(() => {
-    const idByOrderId = new Map<string, string>();
+  const duplicatePickerIdByLineId = useMemo(() => {
+    const idByLineId = new Map<string, string>();
     for (const item of duplicateEditableRowItems) {
-      if (item.source_order_id) {
-        idByOrderId.set(item.source_order_id, item.id);
+      if (item.source_line_id) {
+        idByLineId.set(item.source_line_id, item.id);
       }
     }
-    return idByOrderId;
+    return idByLineId;
   }, [duplicateEditableRowItems]);
 
   const editPickerItems = useMemo<OrderLineItem[]>(
@@ -490,10 +526,9 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
 
   function openEditModal() {
     if (!order) return;
-    const seedRows = editScopeOrders.length > 0 ? editScopeOrders : [order];
     const nextQuantities: Record<string, number> = {};
-    for (const row of seedRows) {
-      const key = duplicatePickerIdByOrderId.get(row.id) ?? row.item_id;
+    for (const row of editScopeLines) {
+      const key = duplicatePickerIdByLineId.get(row.id) ?? row.item_id;
       const qty = Number(row.quantity);
       if (!Number.isFinite(qty) || qty <= 0) continue;
       nextQuantities[key] = (nextQuantities[key] ?? 0) + qty;
@@ -564,7 +599,7 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
         exclude_email: editForm.exclude_email,
       };
 
-      const existingRows = [...(editScopeOrders.length > 0 ? editScopeOrders : [order])];
+      const existingRows = [...editScopeLines];
       const targetStatus = order.status;
       const targetPaid = !!order.paid;
       const targetPaymentMethod = order.payment_method;
@@ -576,7 +611,7 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
       const editableExistingRows = existingRows.filter((row) => !lockedItemIds.has(row.item_id));
 
       const assignments: Array<{
-        row: Order;
+        row: EditLineRow;
         line: (typeof desiredEditableLines)[number];
       }> = [];
 
@@ -584,13 +619,13 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
       const unusedRows = [...editableExistingRows];
       const unmatchedDesired: typeof desiredQueue = [];
       for (const line of desiredQueue) {
-        const sourceOrderId = line.item.source_order_id;
-        if (!sourceOrderId) {
+        const sourceLineId = line.item.source_line_id;
+        if (!sourceLineId) {
           unmatchedDesired.push(line);
           continue;
         }
 
-        const sourceRowIndex = unusedRows.findIndex((row) => row.id === sourceOrderId);
+        const sourceRowIndex = unusedRows.findIndex((row) => row.id === sourceLineId);
         if (sourceRowIndex >= 0) {
           const sourceRow = unusedRows.splice(sourceRowIndex, 1)[0];
           assignments.push({ row: sourceRow, line });
@@ -601,7 +636,7 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
 
       const firstLine = unmatchedDesired.shift();
       if (firstLine) {
-        const currentRowIndex = unusedRows.findIndex((row) => row.id === order.id);
+        const currentRowIndex = unusedRows.findIndex((row) => row.order_id === order.id);
         if (currentRowIndex >= 0) {
           const currentRow = unusedRows.splice(currentRowIndex, 1)[0];
           assignments.push({ row: currentRow, line: firstLine });
@@ -637,30 +672,55 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
         }
       }
 
-      const deleteRows = [...unusedRows];
+      // Every order in scope is saved with one PUT carrying all of its remaining
+      // lines; orders left without lines are deleted.
+      const linesByOrderId = new Map<string, Array<{ item_id: string; quantity: number }>>();
+      for (const row of existingRows) {
+        linesByOrderId.set(row.order_id, []);
+      }
+      const addOrderLine = (orderId: string, itemId: string, quantity: number): boolean => {
+        const orderLines = linesByOrderId.get(orderId) ?? [];
+        if (orderLines.some((line) => line.item_id === itemId)) return false;
+        orderLines.push({ item_id: itemId, quantity });
+        linesByOrderId.set(orderId, orderLines);
+        return true;
+      };
 
       let updatedCount = 0;
       let addedCount = 0;
-      let removedCount = 0;
+      const removedCount = unusedRows.length;
 
+      for (const row of lockedExistingRows) {
+        addOrderLine(row.order_id, row.item_id, row.quantity);
+        updatedCount += 1;
+      }
       for (const assignment of assignments) {
-        const updateRes = await fetch(`${API_URL}/api/admin/orders/${assignment.row.id}`, {
+        // An order holds each item once, so a clashing line goes to a new order instead.
+        if (addOrderLine(assignment.row.order_id, resolveBackendItemId(assignment.line.item), assignment.line.qty)) {
+          updatedCount += 1;
+        } else {
+          createLines.push(assignment.line);
+        }
+      }
+      const orderLineEntries = Array.from(linesByOrderId.entries());
+
+      for (const [orderId, orderLines] of orderLineEntries) {
+        if (orderLines.length === 0) continue;
+        const updateRes = await fetch(`${API_URL}/api/admin/orders/${orderId}`, {
           method: "PUT",
           headers: { Authorization: `Bearer ${token}`, "Content-Type": "application/json" },
           body: JSON.stringify({
             ...basePayload,
-            item_id: resolveBackendItemId(assignment.line.item),
-            quantity: assignment.line.qty,
+            lines: orderLines,
           }),
         });
         if (!updateRes.ok) {
-          throw new Error(await getApiErrorMessage(updateRes, "Failed to update order line"));
+          throw new Error(await getApiErrorMessage(updateRes, "Failed to update order"));
         }
         const updatedRow = (await updateRes.json()) as Order;
         if (updatedRow.id === order.id) {
           setOrder(updatedRow);
         }
-        updatedCount += 1;
       }
 
       for (const line of createLines) {
@@ -715,35 +775,15 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
         addedCount += 1;
       }
 
-      for (const row of lockedExistingRows) {
-        const syncRes = await fetch(`${API_URL}/api/admin/orders/${row.id}`, {
-          method: "PUT",
-          headers: { Authorization: `Bearer ${token}`, "Content-Type": "application/json" },
-          body: JSON.stringify({
-            ...basePayload,
-            item_id: row.item_id,
-            quantity: row.quantity,
-          }),
-        });
-        if (!syncRes.ok) {
-          throw new Error(await getApiErrorMessage(syncRes, "Failed to sync legacy order line"));
-        }
-        const syncedRow = (await syncRes.json()) as Order;
-        if (syncedRow.id === order.id) {
-          setOrder(syncedRow);
-        }
-        updatedCount += 1;
-      }
-
-      for (const row of deleteRows) {
-        const deleteRes = await fetch(`${API_URL}/api/admin/orders/${row.id}`, {
+      for (const [orderId, orderLines] of orderLineEntries) {
+        if (orderLines.length > 0) continue;
+        const deleteRes = await fetch(`${API_URL}/api/admin/orders/${orderId}`, {
           method: "DELETE",
           headers: { Authorization: `Bearer ${token}` },
         });
         if (!deleteRes.ok) {
-          throw new Error(await getApiErrorMessage(deleteRes, "Failed to remove obsolete order line"));
+          throw new Error(await getApiErrorMessage(deleteRes, "Failed to remove obsolete order"));
         }
-        removedCount += 1;
       }
 
       await fetchOrderById({ showLoader: false, suppressErrorToast: true });
@@ -1358,7 +1398,7 @@ export default function OrderDetailPage({ params }: { params: Promise<{ id: stri
                 <label className="block text-xs font-semibold mb-1" style={{ color: "var(--color-muted)" }}>
                   Bundle Items
                   <span className="ml-1 text-[11px] font-normal">
-                    ({editScopeOrders.length > 0 ? editScopeOrders.length : 1} line{(editScopeOrders.length > 0 ? editScopeOrders.length : 1) !== 1 ? "s" : ""} in scope)
+                    ({editScopeLines.length} line{editScopeLines.length !== 1 ? "s" : ""} in scope)
                   </span>
                 </label>
                 <ItemQuantityPicker
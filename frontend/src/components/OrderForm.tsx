@@ -6,6 +6,14 @@ import { API_URL, type Item, type Location } from "@/config/event";
 import CustomSelect from "@/components/ui/CustomSelect";
 import Modal from "@/components/ui/Modal";
 
+export interface OrderResultLine {
+  item_id: string;
+  item_name: string;
+  quantity: number;
+  price_per_item: number;
+  total_price: number;
+}
+
 export interface OrderResult {
   order_id: string;
   order: {
@@ -19,6 +27,7 @@ export interface OrderResult {
     pickup_time_slot: string;
     total_price: number;
     price_per_item: number;
+    lines?: OrderResultLine[];
     currency: string;
     event_date: string;
     etransfer_enabled: boolean;
@@ -64,6 +73,9 @@ export default function OrderForm({ items, locations, onSuccess }: OrderFormProp
   const [pickerOpen, setPickerOpen] = useState(false);
   const [pickerSearch, setPickerSearch] = useState("");
   const searchInputRef = useRef<HTMLInputElement>(null);
+  // One Idempotency-Key per distinct order body, so retrying after a dropped
+  // connection replays an order that already went through instead of duplicating it.
+  const idempotencyKeysRef = useRef<Record<string, string>>({});
 
   const timeSlots = form.pickup_location
     ? (locations.find((l) => l.name === form.pickup_location)?.timeSlots ?? [])
@@ -183,35 +195,37 @@ export default function OrderForm({ items, locations, onSuccess }: OrderFormProp
     setSubmitting(true);
     setServerError("");
 
-    const results: OrderResult[] = [];
     try {
-      for (const { item, qty } of selectedLines) {
-        const res = await fetch(`${API_URL}/api/orders`, {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({
-            name: form.name.trim(),
-            item_id: item.id,
-            quantity: qty,
-            pickup_location: form.pickup_location,
-            pickup_time_slot: form.pickup_time_slot,
-            phone_number: form.phone_number.trim(),
-            email: form.email.trim(),
-          }),
-        });
-        const data = await res.json();
-        if (!res.ok) {
-          const detail = data?.detail;
-          const msg = Array.isArray(detail)
-            ? detail.map((d: { msg: string }) => d.msg).join(", ")
-            : (detail || "Something went wrong. Please try again.");
-          setServerError(msg);
-          setShowErrorModal(true);
-          return;
-        }
-        results.push(data);
+      // All selected items go in one order, placed with a single request.
+      const body = JSON.stringify({
+        name: form.name.trim(),
+        lines: selectedLines.map(({ item, qty }) => ({ item_id: item.id, quantity: qty })),
+        pickup_location: form.pickup_location,
+        pickup_time_slot: form.pickup_time_slot,
+        phone_number: form.phone_number.trim(),
+        email: form.email.trim(),
+      });
+      idempotencyKeysRef.current[body] ??= crypto.randomUUID();
+      const res = await fetch(`${API_URL}/api/orders`, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+          "Idempotency-Key": idempotencyKeysRef.current[body],
+        },
+        body,
+      });
+      const data = await res.json();
+      if (!res.ok) {
+        const detail = data?.detail;
+        const msg = Array.isArray(detail)
+          ? detail.map((d: { msg: string }) => d.msg).join(", ")
+          : (detail || "Something went wrong. Please try again.");
+        setServerError(msg);
+        setShowErrorModal(true);
+        return;
       }
-      onSuccess(results);
+      idempotencyKeysRef.current = {};
+      onSuccess([data]);
     } catch {
       setServerError("Unable to connect. Please check your connection and try again.");
       setShowErrorModal(true);
@@ -168,20 +168,22 @@ export default function SuccessView({ results }: SuccessViewProps) {
           </p>
 
           {/* Line items */}
-          {results.map((r) => (
-            <div
-              key={r.order_id}
-              className="flex justify-between items-center text-sm border-b pb-3"
-              style={{ borderColor: "var(--color-border)" }}
-            >
-              <span style={{ color: "var(--color-muted)" }}>
-                {r.order.item_name} x {r.order.quantity}
-              </span>
-              <span className="font-semibold" style={{ color: "var(--color-text)" }}>
-                {r.order.currency} ${r.order.total_price.toFixed(2)}
-              </span>
-            </div>
-          ))}
+          {results.flatMap((r) =>
+            (r.order.lines ?? [r.order]).map((line) => (
+              <div
+                key={`${r.order_id}-${line.item_id}`}
+                className="flex justify-between items-center text-sm border-b pb-3"
+                style={{ borderColor: "var(--color-border)" }}
+              >
+                <span style={{ color: "var(--color-muted)" }}>
+                  {line.item_name} x {line.quantity}
+                </span>
+                <span className="font-semibold" style={{ color: "var(--color-text)" }}>
+                  {r.order.currency} ${line.total_price.toFixed(2)}
+                </span>
+              </div>
+            ))
+          )}
 
           {/* Shared pickup details */}
           {[
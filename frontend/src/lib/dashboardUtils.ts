@@ -1,3 +1,11 @@
+export interface OrderLine {
+  item_id: string;
+  item_name: string;
+  quantity: number;
+  price_per_item: number;
+  total_price: number;
+}
+
 export interface Order {
   id: string;
   event_id: number;
@@ -18,6 +26,7 @@ export interface Order {
   notes?: string | null;
   exclude_email?: boolean;
   created_at: string;
+  lines?: OrderLine[];
 }
 
 export const STATUS_STYLES: Record<string, { bg: string; color: string; label: string }> = {
@@ -34,6 +43,27 @@ function isActive(order: Order): boolean {
   return order.status !== "cancelled" && order.status !== "no_show";
 }
 
+// Per-item figures come from the order's lines; item_id and item_name on the
+// order itself only describe its first item.
+function orderLines(order: Order): Pick<OrderLine, "item_id" | "item_name" | "quantity" | "total_price">[] {
+  return order.lines && order.lines.length > 0 ? order.lines : [order];
+}
+
+function lineItemId(line: Pick<OrderLine, "item_id" | "item_name">): string {
+  return (line.item_id || line.item_name || "unknown").trim() || "unknown";
+}
+
+function lineItemName(line: Pick<OrderLine, "item_id" | "item_name">): string {
+  return (line.item_name || line.item_id || "Unknown item").trim() || "Unknown item";
+}
+
+function addLineRevenue(itemRevenue: Map<string, number>, order: Order): void {
+  for (const line of orderLines(order)) {
+    const id = lineItemId(line);
+    itemRevenue.set(id, (itemRevenue.get(id) ?? 0) + line.total_price);
+  }
+}
+
 function toLocalDateKey(date: Date): string {
   return [
     date.getFullYear(),
@@ -80,29 +110,29 @@ export function computeItemRevenueBreakdown(orders: Order[]): ItemRevenueRow[] {
   const map = new Map<string, ItemRevenueRow>();
 
   for (const o of active) {
-    const rawKey = (o.item_id || o.item_name || "unknown").trim();
-    const itemId = rawKey || "unknown";
-    const rawName = (o.item_name || o.item_id || "Unknown item").trim();
-    const itemName = rawName || "Unknown item";
-
-    const existing = map.get(itemId);
-    if (existing) {
-      existing.orderCount += 1;
-      existing.quantity += o.quantity;
-      existing.revenue += o.total_price;
-      if ((!existing.itemName || existing.itemName === existing.itemId) && itemName) {
-        existing.itemName = itemName;
+    for (const line of orderLines(o)) {
+      const itemId = lineItemId(line);
+      const itemName = lineItemName(line);
+
+      const existing = map.get(itemId);
+      if (existing) {
+        existing.orderCount += 1;
+        existing.quantity += line.quantity;
+        existing.revenue += line.total_price;
+        if ((!existing.itemName || existing.itemName === existing.itemId) && itemName) {
+          existing.itemName = itemName;
+        }
+        continue;
       }
-      continue;
-    }
 
-    map.set(itemId, {
-      itemId,
-      itemName,
-      orderCount: 1,
-      quantity: o.quantity,
-      revenue: o.total_price,
-    });
+      map.set(itemId, {
+        itemId,
+        itemName,
+        orderCount: 1,
+        quantity: line.quantity,
+        revenue: line.total_price,
+      });
+    }
   }
 
   return Array.from(map.values()).sort((a, b) => b.revenue - a.revenue);
@@ -246,9 +276,11 @@ export function computeRevenueOverTime(
   // Track per-item name lookup
   const itemNames = new Map<string, string>();
   for (const o of active) {
-    const id = (o.item_id || o.item_name || "unknown").trim() || "unknown";
-    if (!itemNames.has(id)) {
-      itemNames.set(id, (o.item_name || o.item_id || "Unknown item").trim() || "Unknown item");
+    for (const line of orderLines(o)) {
+      const id = lineItemId(line);
+      if (!itemNames.has(id)) {
+        itemNames.set(id, lineItemName(line));
+      }
     }
   }
 
@@ -266,9 +298,8 @@ export function computeRevenueOverTime(
       const key = o.created_at.substring(0, 7);
       const bucket = buckets.find((b) => b.date === key);
       if (!bucket) continue;
-      const id = (o.item_id || o.item_name || "unknown").trim() || "unknown";
       bucket.totalRevenue += o.total_price;
-      bucket.itemRevenue.set(id, (bucket.itemRevenue.get(id) ?? 0) + o.total_price);
+      addLineRevenue(bucket.itemRevenue, o);
     }
   } else {
     const days = range === "7d" ? 7 : 30;
@@ -285,9 +316,8 @@ export function computeRevenueOverTime(
       const dateStr = toLocalDateKey(createdAt);
       const bucket = buckets.find((b) => b.date === dateStr);
       if (!bucket) continue;
-      const id = (o.item_id || o.item_name || "unknown").trim() || "unknown";
       bucket.totalRevenue += o.total_price;
-      bucket.itemRevenue.set(id, (bucket.itemRevenue.get(id) ?? 0) + o.total_price);
+      addLineRevenue(bucket.itemRevenue, o);
     }
   }
 
@@ -434,11 +464,13 @@ export function computeItemsPerLocation(orders: Order[]): ItemsPerLocationRow[]
     const loc = o.pickup_location;
 
     // Items
-    const itemName = (o.item_name || o.item_id || "Unknown").trim() || "Unknown";
     if (!locationItems.has(loc)) locationItems.set(loc, new Map());
     const itemMap = locationItems.get(loc)!;
-    const existing = itemMap.get(itemName) ?? { quantity: 0, revenue: 0 };
-    itemMap.set(itemName, { quantity: existing.quantity + o.quantity, revenue: existing.revenue + o.total_price });
+    for (const line of orderLines(o)) {
+      const itemName = (line.item_name || line.item_id || "Unknown").trim() || "Unknown";
+      const existing = itemMap.get(itemName) ?? { quantity: 0, revenue: 0 };
+      itemMap.set(itemName, { quantity: existing.quantity + line.quantity, revenue: existing.revenue + line.total_price });
+    }
 
     // Paid vs unpaid
     if (o.paid) {
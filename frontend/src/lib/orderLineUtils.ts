@@ -4,7 +4,7 @@ export interface OrderLineItem extends Item {
   is_locked?: boolean;
   legacy_reason?: string;
   source_item_id?: string;
-  source_order_id?: string;
+  source_line_id?: string;
 }
 
 export interface QuantityLine<TItem extends { id: string }> {